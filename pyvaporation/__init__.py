@@ -1,40 +1,81 @@
-from .components import Component, Components
+from .components import Component, ComponentTable, Components
 from .conditions import CalculationType, Conditions, TemperatureProgram
 from .diffusion_curve import DiffusionCurve, DiffusionCurveSet
 from .experiments import IdealExperiment, IdealExperiments
 from .membrane import Membrane
 from .mixtures import (
+    ActivityCoefficientModel,
     Composition,
+    CompositionArray,
     CompositionType,
     Mixture,
     Mixtures,
+    PartialPressuresDerivatives,
+    ThermodynamicCache,
+    ThermodynamicKernel,
+    ThermodynamicSurrogate,
+    calculate_activity_coefficients_array,
     get_partial_pressures,
+    get_partial_pressures_with_derivatives,
     VLEPoints,
     VLEPoint,
     fit_vle,
+    VLEFitCache,
+    bootstrap_vle,
+    VLEBootstrap,
+    refit_mixtures,
+    load_mixtures,
+    fit_nrtl_vle,
+    fit_activity_coefficient_model,
+    register_activity_coefficient_model,
+    fit_vle_parallel,
+    fit_vle_least_squares,
+    fit_vle_multistart,
+    VLEFit,
+    VLEDiagram,
+    calculate_bubble_pressures,
+    calculate_bubble_temperatures,
+    Azeotrope,
+    find_azeotropes,
+    MulticomponentMixture,
+    calculate_multicomponent_activity_coefficients,
 )
 from .optimizer import Measurements, PervaporationFunction, find_best_fit, fit
 from .permeance import Permeance, Units
-from .pervaporation import Pervaporation
+from .pervaporation import (
+    PermeateCompositionError,
+    PermeateSolver,
+    Pervaporation,
+    ProcessFailurePolicy,
+)
 from .process import ProcessModel
 from .utils import (
     HeatCapacityConstants,
+    MargulesParameters,
     NRTLParameters,
     R,
     VaporPressureConstants,
     VPConstantsType,
     UNIQUACParameters,
     UNIQUACConstants,
+    VanLaarParameters,
+    WilsonParameters,
 )
 
 __all__ = [
     "VaporPressureConstants",
     "R",
     "NRTLParameters",
+    "MargulesParameters",
+    "VanLaarParameters",
+    "WilsonParameters",
     "HeatCapacityConstants",
     "VPConstantsType",
     "ProcessModel",
     "Pervaporation",
+    "PermeateSolver",
+    "PermeateCompositionError",
+    "ProcessFailurePolicy",
     "Permeance",
     "Units",
     "Measurements",
@@ -42,10 +83,17 @@ __all__ = [
     "find_best_fit",
     "fit",
     "Composition",
+    "CompositionArray",
     "CompositionType",
     "Mixture",
     "Mixtures",
     "get_partial_pressures",
+    "get_partial_pressures_with_derivatives",
+    "PartialPressuresDerivatives",
+    "calculate_activity_coefficients_array",
+    "ThermodynamicKernel",
+    "ThermodynamicCache",
+    "ThermodynamicSurrogate",
     "Membrane",
     "IdealExperiment",
     "IdealExperiments",
@@ -56,11 +104,32 @@ __all__ = [
     "TemperatureProgram",
     "Component",
     "Components",
+    "ComponentTable",
     "UNIQUACParameters",
     "UNIQUACConstants",
     "VLEPoint",
     "VLEPoints",
     "fit_vle",
+    "VLEFitCache",
+    "bootstrap_vle",
+    "VLEBootstrap",
+    "refit_mixtures",
+    "load_mixtures",
+    "fit_nrtl_vle",
+    "fit_activity_coefficient_model",
+    "register_activity_coefficient_model",
+    "ActivityCoefficientModel",
+    "fit_vle_parallel",
+    "fit_vle_least_squares",
+    "fit_vle_multistart",
+    "VLEFit",
+    "VLEDiagram",
+    "calculate_bubble_pressures",
+    "calculate_bubble_temperatures",
+    "Azeotrope",
+    "find_azeotropes",
+    "MulticomponentMixture",
+    "calculate_multicomponent_activity_coefficients",
 ]
 
 __version__ = "1.2.0"
@@ -1,4 +1,5 @@
 from .component import Component
 from .components import Components
+from .table import ComponentTable
 
-__all__ = ["Components", "Component"]
+__all__ = ["Components", "Component", "ComponentTable"]
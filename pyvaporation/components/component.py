@@ -1,3 +1,4 @@
+import math
 import typing
 
 import attr
@@ -11,73 +12,94 @@ from ..utils import (
     UNIQUACConstants,
 )
 
+_LN_10 = math.log(10)
+
 
 @attr.s(auto_attribs=True)
 class Component:
+    """
+    A class to represent components.
+    Type of the vapour pressure equation is resolved once, when the component is created,
+    so that all the properties are evaluated for temperature arrays without any dispatching
+    """
+
     name: str
     molecular_weight: float = attr.ib(converter=lambda value: float(value))
     vapour_pressure_constants: VaporPressureConstants
     heat_capacity_constants: HeatCapacityConstants
     uniquac_constants: typing.Optional[UNIQUACConstants] = None
+    _is_antoine: bool = attr.ib(init=False, repr=False, eq=False)
 
-    def get_vapor_pressure(self, temperature: float) -> float:
+    def __attrs_post_init__(self):
+        if self.vapour_pressure_constants.type not in (
+            VPConstantsType.antoine,
+            VPConstantsType.frost,
+        ):
+            raise ValueError("Type of calculation not supported")
+        self._is_antoine = (
+            self.vapour_pressure_constants.type == VPConstantsType.antoine
+        )
+
+    def get_vapor_pressure(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of saturated pressure in kPa at a given temperature in K using Antoine equation (by the basis of 10)
         type of the calculation using Antoine (antoine) log10(P)=a+b/(T+C)
         or Frost equation (Frost) ln(P) = a+b/T+c/T^2
-        :param temperature: temperature in K
+        :param temperature: temperature(s) in K
         :return: saturated pressure in kPa calculated with respect to constants and given temperature
         """
-        if self.vapour_pressure_constants.type == VPConstantsType.antoine:
-            return 10 ** (
-                self.vapour_pressure_constants.a
-                + self.vapour_pressure_constants.b
-                / (temperature + self.vapour_pressure_constants.c)
-            )
-        elif self.vapour_pressure_constants.type == VPConstantsType.frost:
-            return numpy.exp(
-                self.vapour_pressure_constants.a
-                + self.vapour_pressure_constants.b / temperature
-                + self.vapour_pressure_constants.c / temperature**2
+        a, b, c = self._vapour_pressure_constants()
+        if self._is_antoine:
+            return 10 ** (a + b / (temperature + c))
+        return numpy.exp(a + b / temperature + c / temperature**2)
+
+    def get_vapor_pressure_derivative(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
+        """
+        Calculation of the derivative of saturated pressure by temperature in kPa/K
+        for Antoine equation: dP/dT=-P*b*ln(10)/(T+C)^2
+        for Frost equation: dP/dT=-P*(b/T^2+2*c/T^3)
+        :param temperature: temperature(s) in K
+        :return: derivative of saturated pressure in kPa/K
+        """
+        a, b, c = self._vapour_pressure_constants()
+        if self._is_antoine:
+            return (
+                -self.get_vapor_pressure(temperature)
+                * b
+                * _LN_10
+                / (temperature + c) ** 2
             )
-        else:
-            raise ValueError("Type of calculation not supported")
+        return -self.get_vapor_pressure(temperature) * (
+            b / temperature**2 + 2 * c / temperature**3
+        )
 
-    def get_vaporisation_heat(self, temperature: float) -> float:
+    def get_vaporisation_heat(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of Vaporisation heat in kJ/mol using Clapeyron-Clausius equation
         for Antoine equation: H=b*R*ln(10)*(T/(T+C))^2
         for Frost Equation: H=R*(-b-2*c/T)
-        :param temperature: temperature in K
+        :param temperature: temperature(s) in K
         :return: Vaporisation heat in kJ/mol
         """
-        if self.vapour_pressure_constants.type == VPConstantsType.antoine:
+        a, b, c = self._vapour_pressure_constants()
+        if self._is_antoine:
             return (
-                -(
-                    (temperature / (temperature + self.vapour_pressure_constants.c))
-                    ** 2
-                    * R
-                    * self.vapour_pressure_constants.b
-                    * numpy.log(10)
-                )
-                / 1000
+                -((temperature / (temperature + c)) ** 2 * R * b * _LN_10) / 1000
             )
-        elif self.vapour_pressure_constants.type == VPConstantsType.frost:
-            return (
-                -R
-                * (
-                    self.vapour_pressure_constants.b
-                    + 2 * self.vapour_pressure_constants.c / temperature
-                )
-                / 1000
-            )
-        else:
-            raise ValueError("Type of calculation not supported")
+        return -R * (b + 2 * c / temperature) / 1000
 
-    def get_specific_heat(self, temperature: float) -> float:
+    def get_specific_heat(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of Heat Capacity in J/(mol*K) using polynomial isobaric heat capacity fit
-        :param temperature: temperature in K
+        :param temperature: temperature(s) in K
         :return: Isobaric Heat capacity in J/(mol*K)
         """
         return (
@@ -87,11 +109,15 @@ class Component:
             + self.heat_capacity_constants.d * temperature**3
         )
 
-    def get_cooling_heat(self, t0, t1):
+    def get_cooling_heat(
+        self,
+        t0: typing.Union[float, numpy.ndarray],
+        t1: typing.Union[float, numpy.ndarray],
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of Specific Heat in J/mol using Integral (T2-T1) (CpdT)
-        :param t0: temperature in K (t1 < t0)
-        :param t1: temperature in K (t1 < t0)
+        :param t0: temperature(s) in K (t1 < t0)
+        :param t1: temperature(s) in K (t1 < t0)
         :return: Specific Heat in J/mol
         """
         return (
@@ -100,3 +126,35 @@ class Component:
             + self.heat_capacity_constants.c * (t0**3 - t1**3) / 3
             + self.heat_capacity_constants.d * (t0**4 - t1**4) / 4
         )
+
+    def properties(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Tuple[typing.Any, typing.Any, typing.Any]:
+        """
+        Calculation of saturated pressure, vaporisation heat and heat capacity in a single pass,
+        the terms shared by the equations are calculated once
+        :param temperature: temperature(s) in K
+        :return: saturated pressure in kPa, vaporisation heat in kJ/mol and isobaric heat capacity in J/(mol*K),
+        arrays of the shape of the temperatures for an array
+        """
+        a, b, c = self._vapour_pressure_constants()
+
+        if self._is_antoine:
+            inverse = 1 / (temperature + c)
+            vapour_pressure = 10 ** (a + b * inverse)
+            vaporisation_heat = (
+                -((temperature * inverse) ** 2) * R * b * _LN_10 / 1000
+            )
+        else:
+            inverse = 1 / temperature
+            vapour_pressure = numpy.exp(a + (b + c * inverse) * inverse)
+            vaporisation_heat = -R * (b + 2 * c * inverse) / 1000
+
+        return vapour_pressure, vaporisation_heat, self.get_specific_heat(temperature)
+
+    def _vapour_pressure_constants(self) -> typing.Tuple[float, float, float]:
+        return (
+            self.vapour_pressure_constants.a,
+            self.vapour_pressure_constants.b,
+            self.vapour_pressure_constants.c,
+        )
@@ -0,0 +1,256 @@
+import typing
+from pathlib import Path
+
+import attr
+import numpy
+import pandas
+
+from ..utils import HeatCapacityConstants, R, VaporPressureConstants, VPConstantsType
+from .component import Component
+from .components import Components
+
+COMPONENT_TABLE_COLUMNS = [
+    "name",
+    "molecular_weight",
+    "vapour_pressure_type",
+    "vapour_pressure_a",
+    "vapour_pressure_b",
+    "vapour_pressure_c",
+    "heat_capacity_a",
+    "heat_capacity_b",
+    "heat_capacity_c",
+    "heat_capacity_d",
+]
+
+
+def _default_components() -> typing.List[Component]:
+    return [
+        value for value in vars(Components).values() if isinstance(value, Component)
+    ]
+
+
+@attr.s(auto_attribs=True, eq=False)
+class ComponentTable:
+    """
+    Constants of many components packed into contiguous arrays,
+    so that properties of all the components are evaluated over a grid of temperatures in a single broadcast call.
+    Vapour pressure constants are split into Antoine and Frost groups,
+    the indices map rows of each group to the columns of the results
+    """
+
+    names: typing.List[str]
+    molecular_weights: numpy.ndarray
+    antoine_indices: numpy.ndarray
+    antoine_constants: numpy.ndarray
+    frost_indices: numpy.ndarray
+    frost_constants: numpy.ndarray
+    heat_capacity_constants: numpy.ndarray
+
+    def __attrs_post_init__(self):
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("Names of the components should be unique")
+
+    @classmethod
+    def from_components(
+        cls, components: typing.Optional[typing.Sequence[Component]] = None
+    ) -> "ComponentTable":
+        """
+        Packs constants of the components
+        :param components: components of the table, by default all the pre-defined Components
+        :return: ComponentTable object
+        """
+        if components is None:
+            components = _default_components()
+        if len(components) == 0:
+            raise ValueError("At least one component is required to create a table")
+
+        is_antoine = numpy.array(
+            [
+                component.vapour_pressure_constants.type == VPConstantsType.antoine
+                for component in components
+            ]
+        )
+        vapour_pressure_constants = numpy.array(
+            [
+                [
+                    component.vapour_pressure_constants.a,
+                    component.vapour_pressure_constants.b,
+                    component.vapour_pressure_constants.c,
+                ]
+                for component in components
+            ],
+            dtype=float,
+        )
+
+        return cls(
+            names=[component.name for component in components],
+            molecular_weights=numpy.array(
+                [component.molecular_weight for component in components], dtype=float
+            ),
+            antoine_indices=numpy.flatnonzero(is_antoine),
+            antoine_constants=vapour_pressure_constants[is_antoine],
+            frost_indices=numpy.flatnonzero(~is_antoine),
+            frost_constants=vapour_pressure_constants[~is_antoine],
+            heat_capacity_constants=numpy.array(
+                [
+                    [
+                        component.heat_capacity_constants.a,
+                        component.heat_capacity_constants.b,
+                        component.heat_capacity_constants.c,
+                        component.heat_capacity_constants.d,
+                    ]
+                    for component in components
+                ],
+                dtype=float,
+            ),
+        )
+
+    @classmethod
+    def from_csv(cls, path: typing.Union[str, Path]) -> "ComponentTable":
+        """
+        Reads the table from a .csv file with COMPONENT_TABLE_COLUMNS,
+        empty vapour_pressure_type stands for Antoine equation
+        :param path: Path to the file
+        :return: ComponentTable object
+        """
+        frame = pandas.read_csv(path)
+        if list(frame.columns) != COMPONENT_TABLE_COLUMNS:
+            raise ValueError("Incorrect columns: %s" % list(frame.columns))
+
+        return cls.from_components(
+            [
+                Component(
+                    name=str(row["name"]),
+                    molecular_weight=row["molecular_weight"],
+                    vapour_pressure_constants=VaporPressureConstants(
+                        a=row["vapour_pressure_a"],
+                        b=row["vapour_pressure_b"],
+                        c=row["vapour_pressure_c"],
+                        type=None
+                        if pandas.isna(row["vapour_pressure_type"])
+                        else row["vapour_pressure_type"],
+                    ),
+                    heat_capacity_constants=HeatCapacityConstants(
+                        a=row["heat_capacity_a"],
+                        b=row["heat_capacity_b"],
+                        c=row["heat_capacity_c"],
+                        d=row["heat_capacity_d"],
+                    ),
+                )
+                for _, row in frame.iterrows()
+            ]
+        )
+
+    def to_csv(self, path: typing.Union[str, Path]) -> None:
+        """
+        Writes the table to a .csv file, which could be read with from_csv
+        :param path: Path to the file
+        """
+        vapour_pressure_constants = numpy.empty((len(self), 3))
+        vapour_pressure_constants[self.antoine_indices] = self.antoine_constants
+        vapour_pressure_constants[self.frost_indices] = self.frost_constants
+        vapour_pressure_types = numpy.full(len(self), VPConstantsType.antoine, dtype=object)
+        vapour_pressure_types[self.frost_indices] = VPConstantsType.frost
+
+        frame = pandas.DataFrame(
+            {
+                "name": self.names,
+                "molecular_weight": self.molecular_weights,
+                "vapour_pressure_type": vapour_pressure_types,
+                "vapour_pressure_a": vapour_pressure_constants[:, 0],
+                "vapour_pressure_b": vapour_pressure_constants[:, 1],
+                "vapour_pressure_c": vapour_pressure_constants[:, 2],
+                "heat_capacity_a": self.heat_capacity_constants[:, 0],
+                "heat_capacity_b": self.heat_capacity_constants[:, 1],
+                "heat_capacity_c": self.heat_capacity_constants[:, 2],
+                "heat_capacity_d": self.heat_capacity_constants[:, 3],
+            },
+            columns=COMPONENT_TABLE_COLUMNS,
+        )
+        frame.to_csv(path, index=False)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index(self, name: str) -> int:
+        """
+        :param name: name of a component
+        :return: index of the component's column in the results
+        """
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise ValueError("Component %s is not in the table" % name)
+
+    def get_vapor_pressure(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        Calculation of saturated pressures of all the components in kPa,
+        using Antoine (log10(P)=a+b/(T+C)) or Frost (ln(P) = a+b/T+c/T^2) equation of each component
+        :param temperature: temperature(s) in K
+        :return: saturated pressures as an array of shape (..., number of components)
+        """
+        return self.properties(temperature)[0]
+
+    def get_vaporisation_heat(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        Calculation of Vaporisation heats of all the components in kJ/mol using Clapeyron-Clausius equation
+        :param temperature: temperature(s) in K
+        :return: Vaporisation heats as an array of shape (..., number of components)
+        """
+        return self.properties(temperature)[1]
+
+    def get_specific_heat(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        Calculation of Heat Capacities of all the components in J/(mol*K) using polynomial isobaric heat capacity fit
+        :param temperature: temperature(s) in K
+        :return: Isobaric Heat capacities as an array of shape (..., number of components)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)[..., None]
+        a, b, c, d = self.heat_capacity_constants.T
+        return a + temperature * (b + temperature * (c + temperature * d))
+
+    def properties(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Calculation of saturated pressures, vaporisation heats and heat capacities of all the components
+        in a single pass over the temperatures
+        :param temperature: temperature(s) in K
+        :return: saturated pressures in kPa, vaporisation heats in kJ/mol and isobaric heat capacities in J/(mol*K)
+        as arrays of shape (..., number of components)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)
+        shape = temperature.shape + (len(self),)
+        vapour_pressure = numpy.empty(shape)
+        vaporisation_heat = numpy.empty(shape)
+        temperature = temperature[..., None]
+
+        if len(self.antoine_indices) > 0:
+            a, b, c = self.antoine_constants.T
+            inverse = 1 / (temperature + c)
+            vapour_pressure[..., self.antoine_indices] = 10 ** (a + b * inverse)
+            vaporisation_heat[..., self.antoine_indices] = (
+                -((temperature * inverse) ** 2) * R * b * numpy.log(10) / 1000
+            )
+
+        if len(self.frost_indices) > 0:
+            a, b, c = self.frost_constants.T
+            inverse = 1 / temperature
+            vapour_pressure[..., self.frost_indices] = numpy.exp(
+                a + (b + c * inverse) * inverse
+            )
+            vaporisation_heat[..., self.frost_indices] = (
+                -R * (b + 2 * c * inverse) / 1000
+            )
+
+        return (
+            vapour_pressure,
+            vaporisation_heat,
+            self.get_specific_heat(temperature[..., 0]),
+        )
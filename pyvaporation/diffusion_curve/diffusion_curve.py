@@ -7,6 +7,7 @@ import pandas
 
 from ..mixtures import (
     Composition,
+    CompositionArray,
     CompositionType,
     Mixture,
     Mixtures,
@@ -33,6 +34,29 @@ DC_SET_COLUMNS = [
 ]
 
 
+def _get_partial_pressures_list(
+    temperature: float,
+    mixture: Mixture,
+    compositions: typing.Union[typing.List[Composition], CompositionArray],
+    calculation_type: typing.Optional[str] = "NRTL",
+) -> typing.List[typing.Tuple[float, float]]:
+    """
+    Calculation of partial pressures of both test_components at each composition,
+    a CompositionArray is evaluated in a single vectorized call
+    :return: a list of partial pressures tuples
+    """
+    if isinstance(compositions, CompositionArray):
+        partial_pressures = get_partial_pressures(
+            temperature, mixture, compositions, calculation_type
+        )
+        return list(zip(partial_pressures[0].tolist(), partial_pressures[1].tolist()))
+
+    return [
+        get_partial_pressures(temperature, mixture, composition, calculation_type)
+        for composition in compositions
+    ]
+
+
 @attr.s(auto_attribs=True)
 class DiffusionCurve:
     """
@@ -43,7 +67,7 @@ class DiffusionCurve:
     mixture: Mixture
     membrane_name: str
     feed_temperature: float
-    feed_compositions: typing.List[Composition]
+    feed_compositions: typing.Union[typing.List[Composition], CompositionArray]
     partial_fluxes: typing.Optional[typing.List[typing.Tuple[float, float]]] = None
     permeate_temperature: typing.Optional[float] = None
     permeate_pressure: typing.Optional[float] = None
@@ -60,10 +84,9 @@ class DiffusionCurve:
             is considered zero
             :return a list of Partial fluxes for each component tuple(Ji,Jj) at each concentration
             """
-            feed_partial_pressures = [
-                get_partial_pressures(self.feed_temperature, self.mixture, composition)
-                for composition in self.feed_compositions
-            ]
+            feed_partial_pressures = _get_partial_pressures_list(
+                self.feed_temperature, self.mixture, self.feed_compositions
+            )
 
             self.permeances = [
                 (
@@ -95,10 +118,9 @@ class DiffusionCurve:
             :return a list of Permeances for each component tuple(Pi,Pj) at each concentration
             """
             permeate_compositions = self.permeate_composition
-            feed_partial_pressures = [
-                get_partial_pressures(self.feed_temperature, self.mixture, composition)
-                for composition in self.feed_compositions
-            ]
+            feed_partial_pressures = _get_partial_pressures_list(
+                self.feed_temperature, self.mixture, self.feed_compositions
+            )
             if self.permeate_temperature is None and self.permeate_pressure is None:
                 self.permeances = [
                     (
@@ -313,10 +335,12 @@ class DiffusionCurve:
             return self.permeances
         else:
             permeate_compositions = self.permeate_composition
-            feed_partial_pressures = [
-                get_partial_pressures(self.feed_temperature, self.mixture, composition, calculation_type)
-                for composition in self.feed_compositions
-            ]
+            feed_partial_pressures = _get_partial_pressures_list(
+                self.feed_temperature,
+                self.mixture,
+                self.feed_compositions,
+                calculation_type,
+            )
             if self.permeate_temperature is None:
                 self.permeances = [
                     (
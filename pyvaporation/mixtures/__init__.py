@@ -1,14 +1,101 @@
-from .mixture import Composition, CompositionType, Mixture, get_partial_pressures
+from .cache import ThermodynamicCache
+from .mixture import (
+    ACTIVITY_COEFFICIENT_MODELS,
+    ActivityCoefficientModel,
+    Composition,
+    CompositionArray,
+    CompositionType,
+    MargulesModel,
+    Mixture,
+    NRTLModel,
+    PartialPressuresDerivatives,
+    ThermodynamicKernel,
+    UNIQUACModel,
+    VanLaarModel,
+    WilsonModel,
+    calculate_activity_coefficients_array,
+    get_partial_pressures,
+    get_partial_pressures_with_derivatives,
+    register_activity_coefficient_model,
+)
 from .mixtures import Mixtures
-from .uniquac_fitting import VLEPoint, VLEPoints, fit_vle
+from .multicomponent import (
+    MulticomponentMixture,
+    MulticomponentNRTLModel,
+    MulticomponentUNIQUACModel,
+    calculate_multicomponent_activity_coefficients,
+)
+from .refit import RefitResult, load_mixtures, refit_mixtures
+from .surrogate import ThermodynamicSurrogate
+from .vle import (
+    Azeotrope,
+    VLEDiagram,
+    calculate_bubble_pressures,
+    calculate_bubble_temperatures,
+    find_azeotropes,
+)
+from .fit_cache import VLEFitCache
+from .uniquac_fitting import (
+    FittingReport,
+    VLEBootstrap,
+    VLEFit,
+    VLEObjective,
+    VLEPoint,
+    VLEPoints,
+    bootstrap_vle,
+    fit_activity_coefficient_model,
+    fit_nrtl_vle,
+    fit_vle,
+    fit_vle_least_squares,
+    fit_vle_multistart,
+    fit_vle_parallel,
+)
 
 __all__ = [
     "Mixture",
     "Mixtures",
     "Composition",
+    "CompositionArray",
     "get_partial_pressures",
+    "get_partial_pressures_with_derivatives",
+    "PartialPressuresDerivatives",
+    "calculate_activity_coefficients_array",
+    "UNIQUACModel",
+    "NRTLModel",
+    "MargulesModel",
+    "VanLaarModel",
+    "WilsonModel",
+    "ActivityCoefficientModel",
+    "ACTIVITY_COEFFICIENT_MODELS",
+    "register_activity_coefficient_model",
+    "ThermodynamicKernel",
+    "ThermodynamicCache",
+    "ThermodynamicSurrogate",
     "CompositionType",
     "VLEPoints",
     "VLEPoint",
+    "VLEObjective",
     "fit_vle",
+    "VLEFitCache",
+    "bootstrap_vle",
+    "VLEBootstrap",
+    "refit_mixtures",
+    "load_mixtures",
+    "RefitResult",
+    "fit_nrtl_vle",
+    "fit_activity_coefficient_model",
+    "fit_vle_parallel",
+    "fit_vle_least_squares",
+    "fit_vle_multistart",
+    "VLEFit",
+    "FittingReport",
+    "VLEDiagram",
+    "calculate_bubble_pressures",
+    "calculate_bubble_temperatures",
+    "Azeotrope",
+    "find_azeotropes",
+    "MulticomponentMixture",
+    "MulticomponentNRTLModel",
+    "MulticomponentUNIQUACModel",
+    "calculate_multicomponent_activity_coefficients",
 ]
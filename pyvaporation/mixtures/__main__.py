@@ -0,0 +1,21 @@
+import argparse
+
+from .refit import refit_mixtures
+
+parser = argparse.ArgumentParser(
+    description="Refits parameters of the mixtures to the VLE data in a directory"
+)
+parser.add_argument("directory", help="directory with VLE data .csv files")
+parser.add_argument("registry", help="path to the .json registry of the mixtures")
+parser.add_argument("--jobs", type=int, default=None, help="number of worker processes")
+parser.add_argument("--force", action="store_true", help="refit all the mixtures")
+arguments = parser.parse_args()
+
+result = refit_mixtures(
+    arguments.directory,
+    arguments.registry,
+    n_jobs=arguments.jobs,
+    force=arguments.force,
+)
+print("Fitted: %s" % ", ".join(result.fitted))
+print("Skipped: %s" % ", ".join(result.skipped))
@@ -0,0 +1,107 @@
+import typing
+from collections import OrderedDict
+
+import attr
+
+
+@attr.s(auto_attribs=True)
+class ThermodynamicCache:
+    """
+    Size-bounded LRU cache for results of thermodynamic calculations.
+    Entries are keyed on the mixture identity, activity coefficient model, calculated quantity,
+    temperature and molar fraction of the first component, the last two are rounded to a specified number of decimals
+    :param max_size: maximum number of stored entries, least recently used entries are evicted first
+    :param decimals: number of decimals temperature and molar fraction are rounded to when building a key
+    """
+
+    max_size: int = 4096
+    decimals: int = 10
+    hits: int = attr.ib(default=0, init=False)
+    misses: int = attr.ib(default=0, init=False)
+    evictions: int = attr.ib(default=0, init=False)
+    _entries: "OrderedDict[typing.Tuple, typing.Tuple[typing.Any, typing.Any]]" = (
+        attr.ib(factory=OrderedDict, init=False, repr=False, eq=False)
+    )
+
+    def __attrs_post_init__(self):
+        if self.max_size < 1:
+            raise ValueError("Size of the cache should be a positive integer")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        :return: fraction of lookups served from the cache
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def get_or_calculate(
+        self,
+        mixture: typing.Any,
+        calculation_type: str,
+        quantity: str,
+        temperature: float,
+        molar_fraction: float,
+        calculate: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        """
+        Returns a stored result or calculates and stores a new one
+        :param mixture: a mixture the result is calculated for
+        :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param quantity: name of the calculated quantity
+        :param temperature: temperature in K
+        :param molar_fraction: molar fraction of the first component
+        :param calculate: function calculating the result if it is not stored
+        :return: calculated or stored result
+        """
+        key = (
+            id(mixture),
+            calculation_type,
+            quantity,
+            round(float(temperature), self.decimals),
+            round(float(molar_fraction), self.decimals),
+        )
+        entry = self._entries.get(key)
+
+        # the mixture is stored along with the result, so that the id is not reused while the entry is alive
+        if entry is not None and entry[0] is mixture:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = calculate()
+        self._entries[key] = (mixture, result)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return result
+
+    def statistics(self) -> typing.Dict[str, float]:
+        """
+        :return: hits, misses, evictions, hit rate and current size of the cache
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "size": len(self),
+        }
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the statistics
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
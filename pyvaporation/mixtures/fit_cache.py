@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import time
+import typing
+from pathlib import Path
+
+import attr
+import numpy
+
+from ..utils import UNIQUACParameters
+
+
+def _touch(path: Path) -> None:
+    # modification times track the order of use, the clock of the file system may be too coarse for that
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _modification_time(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@attr.s(auto_attribs=True)
+class VLEFitCache:
+    """
+    Content-addressed on-disk cache of fitted UNIQUAC parameters.
+    Entries are keyed on a hash of the VLE data arrays, optimization method, starting point and library version,
+    each entry is a small .json file storing the parameters along with the error of the fit.
+    :param path: directory of the cache, created if it does not exist
+    :param max_size: maximum number of stored entries, least recently used entries are evicted first
+    """
+
+    path: Path = attr.ib(converter=Path)
+    max_size: int = 256
+    hits: int = attr.ib(default=0, init=False)
+    misses: int = attr.ib(default=0, init=False)
+    evictions: int = attr.ib(default=0, init=False)
+
+    def __attrs_post_init__(self):
+        if self.max_size < 1:
+            raise ValueError("Size of the cache should be a positive integer")
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    @staticmethod
+    def key(
+        data: typing.Any,
+        method: typing.Optional[str],
+        x0: typing.Sequence[float],
+    ) -> str:
+        """
+        Builds the key of a fit
+        :param data: Experimental data represented as a VLEPoints object
+        :param method: Optimization method string
+        :param x0: starting point of the optimization
+        :return: hexadecimal SHA-256 digest
+        """
+        from .. import __version__
+
+        digest = hashlib.sha256()
+        for text in (__version__, str(method), data.digest()):
+            digest.update(text.encode())
+            digest.update(b"\0")
+        digest.update(numpy.asarray(x0, dtype="<f8").tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> typing.Optional[typing.Tuple[UNIQUACParameters, float]]:
+        """
+        Returns a stored fit and marks it as recently used
+        :param key: key of the fit
+        :return: fitted UNIQUACParameters and the error of the fit, None if the fit is not stored
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path) as file:
+                entry = json.load(file)
+            _touch(entry_path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return UNIQUACParameters(**entry["parameters"]), entry["error"]
+
+    def put(self, key: str, parameters: UNIQUACParameters, error: float) -> None:
+        """
+        Stores a fit and evicts the least recently used entries if the cache is full
+        :param key: key of the fit
+        :param parameters: fitted UNIQUACParameters
+        :param error: error of the fit
+        """
+        entry_path = self._entry_path(key)
+        temporary_path = entry_path.with_suffix(".tmp%s" % os.getpid())
+        with open(temporary_path, "w") as file:
+            json.dump(
+                {
+                    "parameters": {
+                        name: value if name == "z" else float(value)
+                        for name, value in attr.asdict(parameters).items()
+                    },
+                    "error": float(error),
+                },
+                file,
+            )
+        # the entry appears at once, so that concurrent readers never see a partially written file
+        os.replace(temporary_path, entry_path)
+        _touch(entry_path)
+
+        entries = self._entries()
+        if len(entries) > self.max_size:
+            entries.sort(key=_modification_time)
+            for entry in entries[: len(entries) - self.max_size]:
+                if entry != entry_path:
+                    try:
+                        entry.unlink()
+                    except FileNotFoundError:
+                        # evicted by another process sharing the cache
+                        continue
+                    self.evictions += 1
+
+    def statistics(self) -> typing.Dict[str, float]:
+        """
+        :return: hits, misses, evictions and current size of the cache
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self),
+        }
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the statistics
+        """
+        for entry in self._entries():
+            entry.unlink()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / ("%s.json" % key)
+
+    def _entries(self) -> typing.List[Path]:
+        return list(self.path.glob("*.json"))
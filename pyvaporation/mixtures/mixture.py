@@ -1,10 +1,21 @@
+import abc
 import typing
 
 import attr
 import numpy
+from scipy import optimize
 
 from ..components import Component
-from ..utils import NRTLParameters, R, UNIQUACParameters
+from ..utils import (
+    MargulesParameters,
+    NRTLParameters,
+    R,
+    UNIQUACParameters,
+    VanLaarParameters,
+    VPConstantsType,
+    WilsonParameters,
+)
+from .cache import ThermodynamicCache
 
 
 def _is_in_0_to_1_range(instance: typing.Any, attribute, value: float) -> None:
@@ -12,6 +23,15 @@ def _is_in_0_to_1_range(instance: typing.Any, attribute, value: float) -> None:
         raise ValueError("Give %s value is not in [0, 1] range" % value)
 
 
+def _to_fraction_array(value: typing.Any) -> numpy.ndarray:
+    return numpy.asarray(value, dtype=float)
+
+
+def _are_in_0_to_1_range(instance: typing.Any, attribute, value: numpy.ndarray) -> None:
+    if numpy.any((value < 0) | (value > 1)) or numpy.isnan(value).any():
+        raise ValueError("Given fractions are not in [0, 1] range")
+
+
 class CompositionType:
     """
     A class to describe type of the composition
@@ -24,7 +44,8 @@ class CompositionType:
 @attr.s(auto_attribs=True)
 class Mixture:
     """
-    A class to represent mixtures
+    A class to represent mixtures,
+    parameters of activity coefficient models other than NRTL and UNIQUAC are stored by the names of the models
     """
 
     name: str
@@ -32,13 +53,33 @@ class Mixture:
     second_component: Component
     nrtl_params: typing.Optional[NRTLParameters] = None
     uniquac_params: typing.Optional[UNIQUACParameters] = None
+    parameters: typing.Dict[str, typing.Any] = attr.Factory(dict)
 
     def __attrs_post_init__(self):
-        if self.nrtl_params is None and self.uniquac_params is None:
+        if (
+            self.nrtl_params is None
+            and self.uniquac_params is None
+            and not self.parameters
+        ):
             raise ValueError(
                 "Component Interaction parameters are required to create a mixture!"
             )
 
+    def get_kernel(
+        self,
+        calculation_type: str = "NRTL",
+        cache: typing.Optional[ThermodynamicCache] = None,
+    ) -> "ThermodynamicKernel":
+        """
+        Prepares the thermodynamic kernel of the mixture for a chosen activity coefficient model
+        :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param cache: optional ThermodynamicCache to memoize partial pressures calculated by the kernel
+        :return: ThermodynamicKernel object with all the constants validated and unpacked
+        """
+        return ThermodynamicKernel.from_mixture(
+            mixture=self, calculation_type=calculation_type, cache=cache
+        )
+
 
 class ActivityCoefficientModel:
     """
@@ -47,6 +88,38 @@ class ActivityCoefficientModel:
 
     NRTL: str = "NRTL"
     UNIQUAC: str = "UNIQUAC"
+    MARGULES: str = "Margules"
+    VAN_LAAR: str = "VanLaar"
+    WILSON: str = "Wilson"
+
+
+# activity coefficient model classes by the names, which are accepted as calculation_type
+ACTIVITY_COEFFICIENT_MODELS: typing.Dict[str, typing.Any] = {}
+
+
+def register_activity_coefficient_model(
+    name: str,
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Class decorator adding an activity coefficient model to the registry,
+    so that its name may be used as calculation_type in get_partial_pressures, Pervaporation etc.
+    A registered model must implement:
+    from_mixture(mixture) classmethod, validating and unpacking the parameters of a Mixture,
+    ln_activity_coefficients(first_component_fraction, temperature) and
+    activity_coefficients(first_component_fraction, temperature), vectorized over arrays of both arguments,
+    ln_activity_coefficients_derivatives(first_component_fraction, temperature) is required only
+    for the calculations with derivatives.
+    Parameters of the models other than NRTL and UNIQUAC are taken from Mixture.parameters by the name of the model,
+    such models also implement fit(first_component_fractions, temperatures, ln_activity_coefficients) classmethod
+    :param name: name of the model
+    :return: decorator registering the model class
+    """
+
+    def register(model: typing.Any) -> typing.Any:
+        ACTIVITY_COEFFICIENT_MODELS[name] = model
+        return model
+
+    return register
 
 
 @attr.s(auto_attribs=True)
@@ -99,23 +172,145 @@ class Composition:
             return Composition(p=p, type=CompositionType.weight)
 
 
+@attr.s(auto_attribs=True, eq=False)
+class CompositionArray:
+    """
+    A class to represent many compositions of a mixture of the same type as a single array
+    of fractions of the first component, validated and converted in bulk.
+    Iteration and integer indexing yield Composition objects, so that it may be used in place of a list of them
+    """
+
+    p: numpy.ndarray = attr.ib(
+        converter=_to_fraction_array, validator=_are_in_0_to_1_range
+    )
+    type: str
+
+    @classmethod
+    def from_compositions(
+        cls,
+        compositions: typing.Iterable[Composition],
+        mixture: typing.Optional[Mixture] = None,
+    ) -> "CompositionArray":
+        """
+        Packs a list of compositions into an array
+        :param compositions: compositions to pack
+        :param mixture: the mixture, required only if the compositions are of different types,
+        in that case all of them are converted to molar fractions
+        :return: CompositionArray object
+        """
+        compositions = list(compositions)
+        if len(compositions) == 0:
+            raise ValueError("At least one composition should be specified")
+
+        types = set(composition.type for composition in compositions)
+        if len(types) == 1:
+            return cls(p=[composition.p for composition in compositions], type=types.pop())
+
+        if mixture is None:
+            raise ValueError(
+                "Mixture must be specified to pack compositions of different types"
+            )
+        return cls(
+            p=[composition.to_molar(mixture).p for composition in compositions],
+            type=CompositionType.molar,
+        )
+
+    def __len__(self) -> int:
+        return len(self.p)
+
+    def __iter__(self) -> typing.Iterator[Composition]:
+        for p in self.p.tolist():
+            yield Composition(p=p, type=self.type)
+
+    def __getitem__(
+        self, item: typing.Any
+    ) -> typing.Union[Composition, "CompositionArray"]:
+        p = self.p[item]
+        if numpy.ndim(p) == 0:
+            return Composition(p=float(p), type=self.type)
+        return CompositionArray(p=p, type=self.type)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, CompositionArray):
+            return NotImplemented
+        return self.type == other.type and numpy.array_equal(self.p, other.p)
+
+    @property
+    def first(self) -> numpy.ndarray:
+        """
+        Returns fractions of the first test_components
+        """
+        return self.p
+
+    @property
+    def second(self) -> numpy.ndarray:
+        """
+        Returns fractions of the second test_components
+        """
+        return 1 - self.p
+
+    def to_molar(self, mixture: Mixture) -> "CompositionArray":
+        """
+        Converts CompositionArray to molar %
+        """
+        if self.type == CompositionType.molar:
+            return self
+        first = self.p / mixture.first_component.molecular_weight
+        return CompositionArray(
+            p=first / (first + (1 - self.p) / mixture.second_component.molecular_weight),
+            type=CompositionType.molar,
+        )
+
+    def to_weight(self, mixture: Mixture) -> "CompositionArray":
+        """
+        Converts CompositionArray to weight %
+        """
+        if self.type == CompositionType.weight:
+            return self
+        first = self.p * mixture.first_component.molecular_weight
+        return CompositionArray(
+            p=first / (first + (1 - self.p) * mixture.second_component.molecular_weight),
+            type=CompositionType.weight,
+        )
+
+    def to_compositions(self) -> typing.List[Composition]:
+        """
+        :return: list of Composition objects
+        """
+        return list(self)
+
+
 def get_partial_pressures(
-    temperature: float,
+    temperature: typing.Union[float, numpy.ndarray],
     mixture: Mixture,
-    composition: Composition,
+    composition: typing.Union[Composition, CompositionArray],
     calculation_type: str = ActivityCoefficientModel.NRTL,
-) -> typing.Tuple[float, float]:
+    cache: typing.Optional[ThermodynamicCache] = None,
+) -> typing.Tuple[typing.Any, typing.Any]:
     """
     Calculation of partial pressures of both test_components
     :params
-    temperature: temperature in K
+    temperature: temperature in K, may be an array broadcastable with a CompositionArray
     mixture: a mixture for which the calculation should be conducted
-    composition: specified composition in mol or weight %
-    :return: Partial pressures as a tuple, test_components wise in kPa
+    composition: specified composition in mol or weight %, or a CompositionArray
+    cache: optional ThermodynamicCache to memoize the results, used only for single compositions
+    :return: Partial pressures as a tuple, test_components wise in kPa, arrays for a CompositionArray
     """
     if composition.type == CompositionType.weight:
         composition = composition.to_molar(mixture=mixture)
 
+    if cache is not None and not isinstance(composition, CompositionArray):
+        return cache.get_or_calculate(
+            mixture=mixture,
+            calculation_type=calculation_type,
+            quantity="partial_pressures",
+            temperature=temperature,
+            molar_fraction=composition.first,
+            calculate=lambda: get_partial_pressures(
+                temperature, mixture, composition, calculation_type
+            ),
+        )
+
     activity_coefficients = calculate_activity_coefficients(temperature=temperature,
                                                             mixture=mixture,
                                                             composition=composition,
@@ -130,177 +325,1504 @@ def get_partial_pressures(
     )
 
 
-def calculate_activity_coefficients(
+@attr.s(auto_attribs=True)
+class PartialPressuresDerivatives:
+    """
+    Partial pressures of both components in kPa along with their derivatives
+    by the molar fraction of the first component (kPa) and by temperature (kPa/K)
+    """
+
+    partial_pressures: typing.Tuple[float, float]
+    d_first_component_fraction: typing.Tuple[float, float]
+    d_temperature: typing.Tuple[float, float]
+
+
+def get_partial_pressures_with_derivatives(
     temperature: float,
     mixture: Mixture,
     composition: Composition,
     calculation_type: str = ActivityCoefficientModel.NRTL,
-) -> typing.Tuple[float, float]:
+) -> PartialPressuresDerivatives:
+    """
+    Calculation of partial pressures of both test_components and their analytic derivatives
+    :params
+    temperature: temperature in K
+    mixture: a mixture for which the calculation should be conducted
+    composition: specified composition in mol or weight %, derivatives are always by the molar fraction
+    :return: PartialPressuresDerivatives object
+    """
+    return mixture.get_kernel(calculation_type).get_partial_pressures_with_derivatives(
+        temperature=temperature, composition=composition
+    )
+
+
+def calculate_activity_coefficients(
+    temperature: typing.Union[float, numpy.ndarray],
+    mixture: Mixture,
+    composition: typing.Union[Composition, CompositionArray],
+    calculation_type: str = ActivityCoefficientModel.NRTL,
+    cache: typing.Optional[ThermodynamicCache] = None,
+) -> typing.Tuple[typing.Any, typing.Any]:
     """
        Calculation of activity coefficients of both test_components
        :params
-       temperature: temperature in K
+       temperature: temperature in K, may be an array broadcastable with a CompositionArray
        mixture: a mixture for which the calculation should be conducted
-       composition: specified composition in mol or weight %
-       :return: activity coefficients as a tuple
+       composition: specified composition in mol or weight %, or a CompositionArray
+       cache: optional ThermodynamicCache to memoize the results, used only for single compositions
+       :return: activity coefficients as a tuple, arrays for a CompositionArray
        """
     if composition.type == CompositionType.weight:
         composition = composition.to_molar(mixture=mixture)
 
-    if calculation_type == ActivityCoefficientModel.NRTL:
+    if cache is not None and not isinstance(composition, CompositionArray):
+        return cache.get_or_calculate(
+            mixture=mixture,
+            calculation_type=calculation_type,
+            quantity="activity_coefficients",
+            temperature=temperature,
+            molar_fraction=composition.first,
+            calculate=lambda: calculate_activity_coefficients(
+                temperature, mixture, composition, calculation_type
+            ),
+        )
+
+    ln_activity_coefficients = _get_activity_model(
+        mixture, calculation_type
+    ).ln_activity_coefficients(
+        first_component_fraction=composition.first,
+        temperature=temperature,
+    )
+
+    return (
+        numpy.exp(ln_activity_coefficients[0]),
+        numpy.exp(ln_activity_coefficients[1]),
+    )
+
 
+def _to_fraction_and_temperature_arrays(
+    first_component_fraction: typing.Union[float, numpy.ndarray],
+    temperature: typing.Union[float, numpy.ndarray],
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Broadcasts molar fractions of the first component and temperatures against each other
+    :param first_component_fraction: molar fraction(s) of the first component
+    :param temperature: temperature(s) in K
+    :return: tuple of broadcast float arrays of the same shape
+    """
+    first_component_fraction = numpy.asarray(first_component_fraction, dtype=float)
+    temperature = numpy.asarray(temperature, dtype=float)
+
+    if numpy.any((first_component_fraction < 0) | (first_component_fraction > 1)):
+        raise ValueError("Given molar fractions are not in [0, 1] range")
+
+    return numpy.broadcast_arrays(first_component_fraction, temperature)
+
+
+@register_activity_coefficient_model(ActivityCoefficientModel.NRTL)
+@attr.s(auto_attribs=True)
+class NRTLModel:
+    """
+    NRTL activity coefficient model bound to a binary mixture
+    """
+
+    alpha: typing.Tuple[float, float]
+    a: typing.Tuple[float, float]
+    g: typing.Tuple[float, float]
+
+    @classmethod
+    def from_mixture(cls, mixture: Mixture) -> "NRTLModel":
+        """
+        Validates NRTL parameters of the mixture
+        :param mixture: a mixture for which the calculation should be conducted
+        :return: NRTLModel object
+        """
         if mixture.nrtl_params is None:
             raise ValueError("NRTL Parameters must be specified for this type of calculation")
 
-        tau = numpy.array(
-            [
-                (mixture.nrtl_params.a12 + mixture.nrtl_params.g12 / (R * temperature)),
-                (mixture.nrtl_params.a21 + mixture.nrtl_params.g21 / (R * temperature)),
-            ]
-        )
-        if mixture.nrtl_params.alpha21 is None:
-            alphas = mixture.nrtl_params.alpha12
+        nrtl_params = mixture.nrtl_params
+        if nrtl_params.alpha21 is None:
+            alpha_21 = nrtl_params.alpha12
         else:
-            alphas = [mixture.nrtl_params.alpha12, mixture.nrtl_params.alpha21]
+            alpha_21 = nrtl_params.alpha21
 
-        g_exp = numpy.exp(numpy.multiply(-tau, alphas))
+        return cls(
+            alpha=(nrtl_params.alpha12, alpha_21),
+            a=(nrtl_params.a12, nrtl_params.a21),
+            g=(nrtl_params.g12 / R, nrtl_params.g21 / R),
+        )
 
-        activity_coefficients = (
-            numpy.exp(
-                (composition.second**2)
-                * (
-                    tau[1]
-                    * (g_exp[1] / (composition.first + composition.second * g_exp[1]))
-                    ** 2
-                    + tau[0]
-                    * g_exp[0]
-                    / (composition.second + composition.first * g_exp[0]) ** 2
-                )
+    def ln_activity_coefficients(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        Calculation of logarithms of activity coefficients of both components
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: logarithms of activity coefficients as a tuple
+        """
+        x_1 = first_component_fraction
+        x_2 = 1 - first_component_fraction
+
+        tau_12 = self.a[0] + self.g[0] / temperature
+        tau_21 = self.a[1] + self.g[1] / temperature
+
+        g_12 = numpy.exp(-tau_12 * self.alpha[0])
+        g_21 = numpy.exp(-tau_21 * self.alpha[1])
+
+        denominator_1 = x_1 + x_2 * g_21
+        denominator_2 = x_2 + x_1 * g_12
+
+        return (
+            x_2**2
+            * (tau_21 * (g_21 / denominator_1) ** 2 + tau_12 * g_12 / denominator_2**2),
+            x_1**2
+            * (tau_12 * (g_12 / denominator_2) ** 2 + tau_21 * g_21 / denominator_1**2),
+        )
+
+    def ln_activity_coefficients_derivatives(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[
+        typing.Tuple[typing.Any, typing.Any],
+        typing.Tuple[typing.Any, typing.Any],
+        typing.Tuple[typing.Any, typing.Any],
+    ]:
+        """
+        Calculation of logarithms of activity coefficients of both components and their analytic derivatives
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: tuple of logarithms of activity coefficients,
+        their derivatives by the molar fraction of the first component and their derivatives by temperature
+        """
+        x_1 = first_component_fraction
+        x_2 = 1 - first_component_fraction
+
+        tau_12 = self.a[0] + self.g[0] / temperature
+        tau_21 = self.a[1] + self.g[1] / temperature
+        d_tau_12 = -self.g[0] / temperature**2
+        d_tau_21 = -self.g[1] / temperature**2
+
+        g_12 = numpy.exp(-tau_12 * self.alpha[0])
+        g_21 = numpy.exp(-tau_21 * self.alpha[1])
+        d_g_12 = -self.alpha[0] * g_12 * d_tau_12
+        d_g_21 = -self.alpha[1] * g_21 * d_tau_21
+
+        denominator_1 = x_1 + x_2 * g_21
+        denominator_2 = x_2 + x_1 * g_12
+
+        sum_1 = tau_21 * (g_21 / denominator_1) ** 2 + tau_12 * g_12 / denominator_2**2
+        sum_2 = tau_12 * (g_12 / denominator_2) ** 2 + tau_21 * g_21 / denominator_1**2
+
+        # derivatives of the denominators by x_1 are (1 - G_21) and (G_12 - 1)
+        d_sum_1_dx = -2 * (
+            tau_21 * g_21**2 * (1 - g_21) / denominator_1**3
+            + tau_12 * g_12 * (g_12 - 1) / denominator_2**3
+        )
+        d_sum_2_dx = -2 * (
+            tau_12 * g_12**2 * (g_12 - 1) / denominator_2**3
+            + tau_21 * g_21 * (1 - g_21) / denominator_1**3
+        )
+
+        d_denominator_1_dt = x_2 * d_g_21
+        d_denominator_2_dt = x_1 * d_g_12
+        d_sum_1_dt = (
+            (d_tau_21 * g_21**2 + 2 * tau_21 * g_21 * d_g_21) / denominator_1**2
+            - 2 * tau_21 * g_21**2 * d_denominator_1_dt / denominator_1**3
+            + (d_tau_12 * g_12 + tau_12 * d_g_12) / denominator_2**2
+            - 2 * tau_12 * g_12 * d_denominator_2_dt / denominator_2**3
+        )
+        d_sum_2_dt = (
+            (d_tau_12 * g_12**2 + 2 * tau_12 * g_12 * d_g_12) / denominator_2**2
+            - 2 * tau_12 * g_12**2 * d_denominator_2_dt / denominator_2**3
+            + (d_tau_21 * g_21 + tau_21 * d_g_21) / denominator_1**2
+            - 2 * tau_21 * g_21 * d_denominator_1_dt / denominator_1**3
+        )
+
+        return (
+            (x_2**2 * sum_1, x_1**2 * sum_2),
+            (
+                -2 * x_2 * sum_1 + x_2**2 * d_sum_1_dx,
+                2 * x_1 * sum_2 + x_1**2 * d_sum_2_dx,
             ),
-            numpy.exp(
-                (composition.first**2)
-                * (
-                    tau[0]
-                    * (g_exp[0] / (composition.second + composition.first * g_exp[0]))
-                    ** 2
-                    + tau[1]
-                    * g_exp[1]
-                    / (composition.first + composition.second * g_exp[1]) ** 2
-                )
+            (x_2**2 * d_sum_1_dt, x_1**2 * d_sum_2_dt),
+        )
+
+    def ln_activity_coefficients_parameters_derivatives(
+        self,
+        first_component_fraction: numpy.ndarray,
+        temperature: numpy.ndarray,
+    ) -> typing.Tuple[
+        typing.Tuple[numpy.ndarray, numpy.ndarray],
+        typing.Tuple[numpy.ndarray, numpy.ndarray],
+    ]:
+        """
+        Calculation of logarithms of activity coefficients of both components and their analytic derivatives
+        by the parameters g12, g21, alpha12, a12 and a21, alpha12 is assumed to be the non-randomness of both components
+        :param first_component_fraction: molar fractions of the first component
+        :param temperature: temperatures in K, broadcastable with the fractions
+        :return: tuple of logarithms of activity coefficients
+        and tuple of their derivatives by the parameters as arrays of shape (..., 5)
+        """
+        x_1 = first_component_fraction
+        x_2 = 1 - first_component_fraction
+
+        tau_12 = self.a[0] + self.g[0] / temperature
+        tau_21 = self.a[1] + self.g[1] / temperature
+
+        g_12 = numpy.exp(-tau_12 * self.alpha[0])
+        g_21 = numpy.exp(-tau_21 * self.alpha[1])
+
+        denominator_1 = x_1 + x_2 * g_21
+        denominator_2 = x_2 + x_1 * g_12
+
+        # derivatives by tau_12 and tau_21
+        ratio_12 = 2 * self.alpha[0] * tau_12 * x_1 * g_12 / denominator_2
+        ratio_21 = 2 * self.alpha[1] * tau_21 * x_2 * g_21 / denominator_1
+        d_tau_12 = (
+            x_2**2
+            * g_12
+            / denominator_2**2
+            * (1 - self.alpha[0] * tau_12 + ratio_12),
+            x_1**2
+            * g_12**2
+            / denominator_2**2
+            * (1 - 2 * self.alpha[0] * tau_12 + ratio_12),
+        )
+        d_tau_21 = (
+            x_2**2
+            * g_21**2
+            / denominator_1**2
+            * (1 - 2 * self.alpha[1] * tau_21 + ratio_21),
+            x_1**2
+            * g_21
+            / denominator_1**2
+            * (1 - self.alpha[1] * tau_21 + ratio_21),
+        )
+
+        # derivatives by the non-randomness, through G_12 and G_21
+        d_alpha = (
+            -(x_2**2)
+            * (
+                2 * tau_21**2 * g_21**2 * x_1 / denominator_1**3
+                + tau_12**2
+                * g_12
+                * (denominator_2 - 2 * x_1 * g_12)
+                / denominator_2**3
+            ),
+            -(x_1**2)
+            * (
+                2 * tau_12**2 * g_12**2 * x_2 / denominator_2**3
+                + tau_21**2
+                * g_21
+                * (denominator_1 - 2 * x_2 * g_21)
+                / denominator_1**3
             ),
         )
 
-        return activity_coefficients
+        derivatives = tuple(
+            numpy.stack(
+                numpy.broadcast_arrays(
+                    d_12 / (R * temperature),
+                    d_21 / (R * temperature),
+                    d_a,
+                    d_12,
+                    d_21,
+                ),
+                axis=-1,
+            )
+            for d_12, d_21, d_a in zip(d_tau_12, d_tau_21, d_alpha)
+        )
 
-    elif calculation_type == ActivityCoefficientModel.UNIQUAC:
-        # The implementation is based on https://doi.org/10.1021/i260068a028
-        if composition.first == 0:
-            composition = Composition(p=0.00001, type="molar")
-        if composition.second == 0:
-            composition = Composition(p=0.99999, type="molar")
+        return self.ln_activity_coefficients(x_1, temperature), derivatives
 
+    def activity_coefficients(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of both components
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: activity coefficients stacked along the last axis
+        """
+        return numpy.exp(
+            numpy.stack(
+                self.ln_activity_coefficients(first_component_fraction, temperature),
+                axis=-1,
+            )
+        )
+
+
+@register_activity_coefficient_model(ActivityCoefficientModel.UNIQUAC)
+@attr.s(auto_attribs=True)
+class UNIQUACModel:
+    """
+    UNIQUAC activity coefficient model bound to a binary mixture.
+    All the terms depending only on UNIQUACConstants and UNIQUACParameters
+    are calculated once, when the model is created from a Mixture
+    The implementation is based on https://doi.org/10.1021/i260068a028
+    """
+
+    uniquac_params: UNIQUACParameters
+    r: typing.Tuple[float, float]
+    q_geometric: typing.Tuple[float, float]
+    q_interaction: typing.Tuple[float, float]
+    combinatorial_factors: typing.Tuple[float, float]
+    size_terms: typing.Tuple[float, float]
+
+    @classmethod
+    def from_mixture(cls, mixture: Mixture) -> "UNIQUACModel":
+        """
+        Validates UNIQUAC constants and parameters of the mixture and calculates composition independent terms
+        :param mixture: a mixture for which the calculation should be conducted
+        :return: UNIQUACModel object
+        """
         if mixture.uniquac_params is None:
             raise ValueError("UNIQUAC Parameters must be specified for this type of calculation")
         if mixture.first_component.uniquac_constants is None or mixture.second_component.uniquac_constants is None:
             raise ValueError("UNIQUAC Constants for all Components must be specified for this type of calculation")
 
-        phi_sum = (
-            composition.first * mixture.first_component.uniquac_constants.r
-            + composition.second * mixture.second_component.uniquac_constants.r
+        constants = (
+            mixture.first_component.uniquac_constants,
+            mixture.second_component.uniquac_constants,
         )
-        phi_1 = (
-            composition.first * mixture.first_component.uniquac_constants.r / phi_sum
+        z = mixture.uniquac_params.z
+
+        r = tuple(float(c.r) for c in constants)
+        q_geometric = tuple(float(c.q_geometric) for c in constants)
+        q_interaction = tuple(float(c.q_interaction) for c in constants)
+
+        l_1 = z / 2 * (r[0] - q_geometric[0]) - (r[0] - 1)
+        l_2 = z / 2 * (r[1] - q_geometric[1]) - (r[1] - 1)
+
+        return cls(
+            uniquac_params=mixture.uniquac_params,
+            r=r,
+            q_geometric=q_geometric,
+            q_interaction=q_interaction,
+            combinatorial_factors=(z / 2 * q_geometric[0], z / 2 * q_geometric[1]),
+            size_terms=(l_1 - r[0] / r[1] * l_2, l_2 - r[1] / r[0] * l_1),
         )
-        phi_2 = (
-            composition.second * mixture.second_component.uniquac_constants.r / phi_sum
+
+    def ln_activity_coefficients(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        Calculation of logarithms of activity coefficients of both components,
+        pure components are replaced with 0.99999 molar fractions
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: logarithms of activity coefficients as a tuple
+        """
+        if isinstance(first_component_fraction, numpy.ndarray):
+            x_1 = numpy.where(
+                first_component_fraction == 0, 0.00001, first_component_fraction
+            )
+            x_1 = numpy.where(x_1 == 1, 0.99999, x_1)
+        elif first_component_fraction == 0:
+            x_1 = 0.00001
+        elif first_component_fraction == 1:
+            x_1 = 0.99999
+        else:
+            x_1 = first_component_fraction
+        x_2 = 1 - x_1
+
+        r_1, r_2 = self.r
+        q_1, q_2 = self.q_interaction
+
+        phi_sum = x_1 * r_1 + x_2 * r_2
+        phi_1 = x_1 * r_1 / phi_sum
+        phi_2 = x_2 * r_2 / phi_sum
+
+        theta_sum_geometric = x_1 * self.q_geometric[0] + x_2 * self.q_geometric[1]
+        theta_1_geometric = x_1 * self.q_geometric[0] / theta_sum_geometric
+        theta_2_geometric = x_2 * self.q_geometric[1] / theta_sum_geometric
+
+        theta_sum_interaction = x_1 * q_1 + x_2 * q_2
+        theta_1 = x_1 * q_1 / theta_sum_interaction
+        theta_2 = x_2 * q_2 / theta_sum_interaction
+
+        a_12 = self.uniquac_params.alpha_12 + self.uniquac_params.beta_12 / temperature
+        a_21 = self.uniquac_params.alpha_21 + self.uniquac_params.beta_21 / temperature
+
+        tau_12 = numpy.exp(-a_12 / temperature)
+        tau_21 = numpy.exp(-a_21 / temperature)
+
+        # The residual part of the second component is kept exactly as the default
+        # mixtures' UNIQUACParameters were fitted with
+        return (
+            numpy.log(phi_1 / x_1)
+            + self.combinatorial_factors[0] * numpy.log(theta_1_geometric / phi_1)
+            + phi_2 * self.size_terms[0]
+            - q_1 * numpy.log(theta_1 + theta_2 * tau_21)
+            + theta_2
+            * q_1
+            * (
+                tau_21 / (theta_1 + theta_2 * tau_21)
+                - tau_12 / (theta_2 + theta_1 * tau_12)
+            ),
+            numpy.log(phi_2 / x_2)
+            + self.combinatorial_factors[1] * numpy.log(theta_2_geometric / phi_2)
+            + phi_1 * self.size_terms[1]
+            - q_2 * numpy.log(theta_2 + theta_1 * tau_12)
+            + theta_1
+            * q_2
+            * (
+                tau_12 / (theta_2 + theta_1 * tau_21)
+                - tau_12 / (theta_1 + theta_2 * tau_12)
+            ),
         )
 
-        theta_sum_geometric = (
-            composition.first * mixture.first_component.uniquac_constants.q_geometric
-            + composition.second
-            * mixture.second_component.uniquac_constants.q_geometric
+    def ln_activity_coefficients_derivatives(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[
+        typing.Tuple[typing.Any, typing.Any],
+        typing.Tuple[typing.Any, typing.Any],
+        typing.Tuple[typing.Any, typing.Any],
+    ]:
+        """
+        Calculation of logarithms of activity coefficients of both components and their analytic derivatives,
+        pure components are replaced with 0.99999 molar fractions
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: tuple of logarithms of activity coefficients,
+        their derivatives by the molar fraction of the first component and their derivatives by temperature
+        """
+        if isinstance(first_component_fraction, numpy.ndarray):
+            x_1 = numpy.where(
+                first_component_fraction == 0, 0.00001, first_component_fraction
+            )
+            x_1 = numpy.where(x_1 == 1, 0.99999, x_1)
+        elif first_component_fraction == 0:
+            x_1 = 0.00001
+        elif first_component_fraction == 1:
+            x_1 = 0.99999
+        else:
+            x_1 = first_component_fraction
+        x_2 = 1 - x_1
+
+        r_1, r_2 = self.r
+        q_1, q_2 = self.q_interaction
+        q_geometric_1, q_geometric_2 = self.q_geometric
+
+        phi_sum = x_1 * r_1 + x_2 * r_2
+        phi_1 = x_1 * r_1 / phi_sum
+        phi_2 = x_2 * r_2 / phi_sum
+        d_phi_1 = r_1 * r_2 / phi_sum**2
+
+        theta_sum_geometric = x_1 * q_geometric_1 + x_2 * q_geometric_2
+        theta_1_geometric = x_1 * q_geometric_1 / theta_sum_geometric
+        theta_2_geometric = x_2 * q_geometric_2 / theta_sum_geometric
+        d_theta_geometric = q_geometric_1 * q_geometric_2 / theta_sum_geometric**2
+
+        theta_sum_interaction = x_1 * q_1 + x_2 * q_2
+        theta_1 = x_1 * q_1 / theta_sum_interaction
+        theta_2 = x_2 * q_2 / theta_sum_interaction
+        d_theta = q_1 * q_2 / theta_sum_interaction**2
+
+        a_12 = self.uniquac_params.alpha_12 + self.uniquac_params.beta_12 / temperature
+        a_21 = self.uniquac_params.alpha_21 + self.uniquac_params.beta_21 / temperature
+
+        tau_12 = numpy.exp(-a_12 / temperature)
+        tau_21 = numpy.exp(-a_21 / temperature)
+        d_tau_12 = tau_12 * (
+            self.uniquac_params.alpha_12 / temperature**2
+            + 2 * self.uniquac_params.beta_12 / temperature**3
         )
+        d_tau_21 = tau_21 * (
+            self.uniquac_params.alpha_21 / temperature**2
+            + 2 * self.uniquac_params.beta_21 / temperature**3
+        )
+
+        # denominators of the residual parts, see ln_activity_coefficients
+        p = theta_1 + theta_2 * tau_21
+        q = theta_2 + theta_1 * tau_12
+        r = theta_2 + theta_1 * tau_21
+        s = theta_1 + theta_2 * tau_12
+
+        residual_1 = tau_21 / p - tau_12 / q
+        residual_2 = tau_12 / r - tau_12 / s
 
-        theta_1_geometric = (
-            composition.first
-            * mixture.first_component.uniquac_constants.q_geometric
-            / theta_sum_geometric
+        d_p_dx = d_theta * (1 - tau_21)
+        d_q_dx = d_theta * (tau_12 - 1)
+        d_r_dx = d_theta * (tau_21 - 1)
+        d_s_dx = d_theta * (1 - tau_12)
+
+        d_p_dt = theta_2 * d_tau_21
+        d_q_dt = theta_1 * d_tau_12
+        d_r_dt = theta_1 * d_tau_21
+        d_s_dt = theta_2 * d_tau_12
+
+        values = (
+            numpy.log(phi_1 / x_1)
+            + self.combinatorial_factors[0] * numpy.log(theta_1_geometric / phi_1)
+            + phi_2 * self.size_terms[0]
+            - q_1 * numpy.log(p)
+            + theta_2 * q_1 * residual_1,
+            numpy.log(phi_2 / x_2)
+            + self.combinatorial_factors[1] * numpy.log(theta_2_geometric / phi_2)
+            + phi_1 * self.size_terms[1]
+            - q_2 * numpy.log(q)
+            + theta_1 * q_2 * residual_2,
+        )
+        fraction_derivatives = (
+            d_phi_1 / phi_1
+            - 1 / x_1
+            + self.combinatorial_factors[0]
+            * (d_theta_geometric / theta_1_geometric - d_phi_1 / phi_1)
+            - d_phi_1 * self.size_terms[0]
+            - q_1 * d_p_dx / p
+            - d_theta * q_1 * residual_1
+            + theta_2
+            * q_1
+            * (-tau_21 * d_p_dx / p**2 + tau_12 * d_q_dx / q**2),
+            -d_phi_1 / phi_2
+            + 1 / x_2
+            + self.combinatorial_factors[1]
+            * (d_phi_1 / phi_2 - d_theta_geometric / theta_2_geometric)
+            + d_phi_1 * self.size_terms[1]
+            - q_2 * d_q_dx / q
+            + d_theta * q_2 * residual_2
+            + theta_1
+            * q_2
+            * (-tau_12 * d_r_dx / r**2 + tau_12 * d_s_dx / s**2),
         )
-        theta_2_geometric = (
-            composition.second
-            * mixture.second_component.uniquac_constants.q_geometric
-            / theta_sum_geometric
+        temperature_derivatives = (
+            -q_1 * d_p_dt / p
+            + theta_2
+            * q_1
+            * (
+                d_tau_21 / p
+                - tau_21 * d_p_dt / p**2
+                - d_tau_12 / q
+                + tau_12 * d_q_dt / q**2
+            ),
+            -q_2 * d_q_dt / q
+            + theta_1
+            * q_2
+            * (
+                d_tau_12 / r
+                - tau_12 * d_r_dt / r**2
+                - d_tau_12 / s
+                + tau_12 * d_s_dt / s**2
+            ),
         )
 
-        theta_sum_interaction = (
-            composition.first * mixture.first_component.uniquac_constants.q_interaction
-            + composition.second
-            * mixture.second_component.uniquac_constants.q_interaction
+        return values, fraction_derivatives, temperature_derivatives
+
+    def ln_activity_coefficients_parameters_derivatives(
+        self,
+        first_component_fraction: numpy.ndarray,
+        temperature: numpy.ndarray,
+    ) -> typing.Tuple[
+        typing.Tuple[numpy.ndarray, numpy.ndarray],
+        typing.Tuple[numpy.ndarray, numpy.ndarray],
+    ]:
+        """
+        Calculation of logarithms of activity coefficients of both components and their analytic derivatives
+        by the interaction parameters alpha_12, alpha_21, beta_12 and beta_21,
+        pure components are replaced with 0.99999 molar fractions
+        :param first_component_fraction: molar fractions of the first component
+        :param temperature: temperatures in K, broadcastable with the fractions
+        :return: tuple of logarithms of activity coefficients
+        and tuple of their derivatives by the parameters as arrays of shape (..., 4)
+        """
+        x_1 = numpy.where(
+            first_component_fraction == 0, 0.00001, first_component_fraction
         )
+        x_1 = numpy.where(x_1 == 1, 0.99999, x_1)
 
-        theta_1_interaction = (
-            composition.first
-            * mixture.first_component.uniquac_constants.q_interaction
-            / theta_sum_interaction
+        q_1, q_2 = self.q_interaction
+        theta_sum_interaction = x_1 * q_1 + (1 - x_1) * q_2
+        theta_1 = x_1 * q_1 / theta_sum_interaction
+        theta_2 = (1 - x_1) * q_2 / theta_sum_interaction
+
+        tau_12 = numpy.exp(
+            -(self.uniquac_params.alpha_12 + self.uniquac_params.beta_12 / temperature)
+            / temperature
         )
-        theta_2_interaction = (
-            composition.second
-            * mixture.second_component.uniquac_constants.q_interaction
-            / theta_sum_interaction
+        tau_21 = numpy.exp(
+            -(self.uniquac_params.alpha_21 + self.uniquac_params.beta_21 / temperature)
+            / temperature
         )
 
-        l_1 = mixture.uniquac_params.z / 2 * (
-            mixture.first_component.uniquac_constants.r
-            - mixture.first_component.uniquac_constants.q_geometric
-        ) - (mixture.first_component.uniquac_constants.r - 1)
+        # denominators of the residual parts, see ln_activity_coefficients
+        p = theta_1 + theta_2 * tau_21
+        q = theta_2 + theta_1 * tau_12
+        r = theta_2 + theta_1 * tau_21
+        s = theta_1 + theta_2 * tau_12
 
-        l_2 = mixture.uniquac_params.z / 2 * (
-            mixture.second_component.uniquac_constants.r
-            - mixture.second_component.uniquac_constants.q_geometric
-        ) - (mixture.second_component.uniquac_constants.r - 1)
+        # derivatives by tau_12 and tau_21, d(tau)/d(alpha) = -tau/T and d(tau)/d(beta) = -tau/T^2
+        d_tau_12 = (
+            -q_1 * theta_2**2 / q**2,
+            -q_2 * theta_1 / q + theta_1 * q_2 * (1 / r - theta_1 / s**2),
+        )
+        d_tau_21 = (
+            -q_1 * theta_2**2 * tau_21 / p**2,
+            -q_2 * theta_1**2 * tau_12 / r**2,
+        )
 
-        a_12 = mixture.uniquac_params.alpha_12 + mixture.uniquac_params.beta_12/temperature
-        a_21 = mixture.uniquac_params.alpha_21 + mixture.uniquac_params.beta_21/temperature
+        derivatives = tuple(
+            numpy.stack(
+                numpy.broadcast_arrays(
+                    -d_12 * tau_12 / temperature,
+                    -d_21 * tau_21 / temperature,
+                    -d_12 * tau_12 / temperature**2,
+                    -d_21 * tau_21 / temperature**2,
+                ),
+                axis=-1,
+            )
+            for d_12, d_21 in zip(d_tau_12, d_tau_21)
+        )
 
-        tau_12 = numpy.exp(-a_12/temperature)
-        tau_21 = numpy.exp(-a_21/temperature)
+        return self.ln_activity_coefficients(x_1, temperature), derivatives
 
-        gamma_1 = numpy.exp(
-            numpy.log(phi_1 / composition.first)
-            + mixture.uniquac_params.z
-            / 2
-            * mixture.first_component.uniquac_constants.q_geometric
-            * numpy.log(theta_1_geometric / phi_1)
-            + phi_2
-            * (
-                l_1
-                - mixture.first_component.uniquac_constants.r
-                / mixture.second_component.uniquac_constants.r
-                * l_2
-            ) - mixture.first_component.uniquac_constants.q_interaction
-            * numpy.log(theta_1_interaction + theta_2_interaction * tau_21)
-            + theta_2_interaction * mixture.first_component.uniquac_constants.q_interaction
-            * (tau_21 / (theta_1_interaction+theta_2_interaction * tau_21)
-               - tau_12 / (theta_2_interaction + theta_1_interaction * tau_12))
-        )
-
-        gamma_2 = numpy.exp(
-            numpy.log(phi_2 / composition.second)
-            + mixture.uniquac_params.z
-            / 2
-            * mixture.second_component.uniquac_constants.q_geometric
-            * numpy.log(theta_2_geometric / phi_2)
-            + phi_1
-            * (
-                    l_2
-                    - mixture.second_component.uniquac_constants.r
-                    / mixture.first_component.uniquac_constants.r
-                    * l_1
-            ) - mixture.second_component.uniquac_constants.q_interaction
-            * numpy.log(theta_2_interaction + theta_1_interaction * tau_12)
-            + theta_1_interaction * mixture.second_component.uniquac_constants.q_interaction
-            * (tau_12 / (theta_2_interaction + theta_1_interaction * tau_21)
-               - tau_12 / (theta_1_interaction + theta_2_interaction * tau_12))
-        )
-
-        return gamma_1, gamma_2
+    def activity_coefficients(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of both components
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: activity coefficients stacked along the last axis
+        """
+        return numpy.exp(
+            numpy.stack(
+                self.ln_activity_coefficients(first_component_fraction, temperature),
+                axis=-1,
+            )
+        )
+
+
+@attr.s(auto_attribs=True)
+class _InteractionTermsModel(abc.ABC):
+    """
+    Base of the activity coefficient models described by a pair of interaction terms P_12 and P_21
+    depending on temperature through the parameters a_ij and b_ij.
+    Subclasses define the terms and logarithms of activity coefficients along with their derivatives,
+    the parameters are taken from Mixture.parameters by the name of the model
+    """
+
+    a: typing.Tuple[float, float]
+    b: typing.Tuple[float, float]
+
+    name: typing.ClassVar[str]
+    parameters_type: typing.ClassVar[typing.Any]
+
+    @classmethod
+    def from_mixture(cls, mixture: Mixture) -> "_InteractionTermsModel":
+        """
+        Validates parameters of the model stored in the mixture
+        :param mixture: a mixture for which the calculation should be conducted
+        :return: model object
+        """
+        parameters = mixture.parameters.get(cls.name)
+        if parameters is None:
+            raise ValueError(
+                "%s Parameters must be specified for this type of calculation" % cls.name
+            )
+        return cls.from_parameters(parameters)
+
+    @classmethod
+    def from_parameters(cls, parameters: typing.Any) -> "_InteractionTermsModel":
+        """
+        :param parameters: parameters of the model, e.g. MargulesParameters
+        :return: model object
+        """
+        return cls(
+            a=(float(parameters.a12), float(parameters.a21)),
+            b=(float(parameters.b12), float(parameters.b21)),
+        )
+
+    @abc.abstractmethod
+    def _terms(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        :return: interaction terms P_12 and P_21
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _terms_derivatives(
+        self, terms: typing.Tuple[typing.Any, typing.Any]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        :return: derivatives of the interaction terms by a_12 and a_21,
+        derivatives by b_ij are the same divided by T
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _ln_activity_coefficients(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _ln_activity_coefficients_fraction_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        :return: derivatives of logarithms of activity coefficients of both components by x_1
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _ln_activity_coefficients_terms_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Tuple[typing.Any, typing.Any], typing.Tuple[typing.Any, typing.Any]]:
+        """
+        :return: derivatives of logarithms of activity coefficients of both components by P_12 and by P_21
+        """
+        raise NotImplementedError
+
+    def ln_activity_coefficients(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        Calculation of logarithms of activity coefficients of both components
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: logarithms of activity coefficients as a tuple
+        """
+        return self._ln_activity_coefficients(
+            first_component_fraction, self._terms(temperature)
+        )
+
+    def ln_activity_coefficients_derivatives(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[
+        typing.Tuple[typing.Any, typing.Any],
+        typing.Tuple[typing.Any, typing.Any],
+        typing.Tuple[typing.Any, typing.Any],
+    ]:
+        """
+        Calculation of logarithms of activity coefficients of both components and their analytic derivatives
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: tuple of logarithms of activity coefficients,
+        their derivatives by the molar fraction of the first component and their derivatives by temperature
+        """
+        x_1 = first_component_fraction
+        terms = self._terms(temperature)
+        d_terms = self._terms_derivatives(terms)
+        d_terms_dt = tuple(
+            -d_terms[k] * self.b[k] / temperature**2 for k in range(2)
+        )
+        d_12, d_21 = self._ln_activity_coefficients_terms_derivatives(x_1, terms)
+
+        return (
+            self._ln_activity_coefficients(x_1, terms),
+            self._ln_activity_coefficients_fraction_derivatives(x_1, terms),
+            tuple(
+                d_12[i] * d_terms_dt[0] + d_21[i] * d_terms_dt[1] for i in range(2)
+            ),
+        )
+
+    def activity_coefficients(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of both components
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: activity coefficients stacked along the last axis
+        """
+        return numpy.exp(
+            numpy.stack(
+                self.ln_activity_coefficients(first_component_fraction, temperature),
+                axis=-1,
+            )
+        )
+
+    @classmethod
+    def _initial_parameters(
+        cls,
+        first_component_fractions: numpy.ndarray,
+        temperatures: numpy.ndarray,
+        ln_activity_coefficients: numpy.ndarray,
+        temperature_dependent: bool,
+    ) -> numpy.ndarray:
+        return numpy.zeros(4)
+
+    @classmethod
+    def fit(
+        cls,
+        first_component_fractions: typing.Union[typing.Sequence[float], numpy.ndarray],
+        temperatures: typing.Union[typing.Sequence[float], numpy.ndarray],
+        ln_activity_coefficients: numpy.ndarray,
+        temperature_dependent: typing.Optional[bool] = None,
+    ) -> typing.Any:
+        """
+        Fits parameters of the model to logarithms of activity coefficients by least squares
+        :param first_component_fractions: molar fractions of the first component, array of shape (n,)
+        :param temperatures: temperatures in K, array of shape (n,)
+        :param ln_activity_coefficients: logarithms of activity coefficients of both components,
+        array of shape (n, 2), not finite values are ignored
+        :param temperature_dependent: if False b_12 and b_21 are fixed to zero,
+        by default they are fitted if the temperatures differ
+        :return: parameters of the model, e.g. MargulesParameters
+        """
+        x_1, temperatures, targets, mask, temperature_dependent = _prepare_fit_data(
+            first_component_fractions,
+            temperatures,
+            ln_activity_coefficients,
+            temperature_dependent,
+        )
+        size = 4 if temperature_dependent else 2
+        x0 = cls._initial_parameters(x_1, temperatures, targets, temperature_dependent)
+
+        def to_model(params: numpy.ndarray) -> "_InteractionTermsModel":
+            return cls(
+                a=(params[0], params[1]),
+                b=(params[2], params[3]) if size == 4 else (0.0, 0.0),
+            )
+
+        def residuals(params: numpy.ndarray) -> numpy.ndarray:
+            values = numpy.stack(
+                to_model(params).ln_activity_coefficients(x_1, temperatures), axis=-1
+            )
+            return (values - targets)[mask]
+
+        def jacobian(params: numpy.ndarray) -> numpy.ndarray:
+            model = to_model(params)
+            terms = model._terms(temperatures)
+            d_terms = model._terms_derivatives(terms)
+            d_12, d_21 = model._ln_activity_coefficients_terms_derivatives(x_1, terms)
+            columns = [
+                numpy.stack((d_12[0], d_12[1]), axis=-1) * d_terms[0][..., None],
+                numpy.stack((d_21[0], d_21[1]), axis=-1) * d_terms[1][..., None],
+            ]
+            columns += [column / temperatures[:, None] for column in columns]
+            return numpy.stack([column[mask] for column in columns[:size]], axis=-1)
+
+        result = optimize.least_squares(
+            residuals, x0[:size], jac=jacobian, method="trf", x_scale="jac"
+        )
+        params = numpy.zeros(4)
+        params[:size] = result.x
+        return cls.parameters_type.from_array(params)
+
+
+def _prepare_fit_data(
+    first_component_fractions: typing.Union[typing.Sequence[float], numpy.ndarray],
+    temperatures: typing.Union[typing.Sequence[float], numpy.ndarray],
+    ln_activity_coefficients: numpy.ndarray,
+    temperature_dependent: typing.Optional[bool],
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, bool]:
+    """
+    Validates data for fitting of the activity coefficient models
+    :return: fractions, temperatures, logarithms of activity coefficients, mask of the finite ones
+    and whether temperature dependence is fitted
+    """
+    x_1 = numpy.asarray(first_component_fractions, dtype=float)
+    temperatures = numpy.asarray(temperatures, dtype=float)
+    targets = numpy.asarray(ln_activity_coefficients, dtype=float)
+
+    if targets.shape != x_1.shape + (2,) or temperatures.shape != x_1.shape:
+        raise ValueError("Shapes of fractions, temperatures and activity coefficients do not match")
+    if numpy.any((x_1 < 0) | (x_1 > 1)):
+        raise ValueError("Given molar fractions are not in [0, 1] range")
+
+    mask = numpy.isfinite(targets)
+    if temperature_dependent is None:
+        temperature_dependent = bool(numpy.ptp(temperatures) > 0)
+    if mask.sum() < (4 if temperature_dependent else 2):
+        raise ValueError("Not enough data to fit the parameters")
+
+    return x_1, temperatures, numpy.where(mask, targets, 0), mask, temperature_dependent
+
+
+@register_activity_coefficient_model(ActivityCoefficientModel.MARGULES)
+@attr.s(auto_attribs=True)
+class MargulesModel(_InteractionTermsModel):
+    """
+    Two-parameter Margules activity coefficient model,
+    ln(gamma_1) = x_2^2 (A_12 + 2 (A_21 - A_12) x_1), A_ij = a_ij + b_ij / T.
+    Logarithms of activity coefficients are linear in the parameters, so that they are fitted by linear least squares
+    """
+
+    name: typing.ClassVar[str] = ActivityCoefficientModel.MARGULES
+    parameters_type: typing.ClassVar[typing.Any] = MargulesParameters
+
+    def _terms(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        return (
+            self.a[0] + self.b[0] / temperature,
+            self.a[1] + self.b[1] / temperature,
+        )
+
+    def _terms_derivatives(
+        self, terms: typing.Tuple[typing.Any, typing.Any]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        return numpy.ones_like(terms[0]), numpy.ones_like(terms[1])
+
+    def _ln_activity_coefficients(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        x_2 = 1 - x_1
+        a_12, a_21 = terms
+        return (
+            x_2**2 * (a_12 + 2 * (a_21 - a_12) * x_1),
+            x_1**2 * (a_21 + 2 * (a_12 - a_21) * x_2),
+        )
+
+    def _ln_activity_coefficients_fraction_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        x_2 = 1 - x_1
+        a_12, a_21 = terms
+        return (
+            -2 * x_2 * (a_12 + 2 * (a_21 - a_12) * x_1) + 2 * x_2**2 * (a_21 - a_12),
+            2 * x_1 * (a_21 + 2 * (a_12 - a_21) * x_2) - 2 * x_1**2 * (a_12 - a_21),
+        )
+
+    def _ln_activity_coefficients_terms_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Tuple[typing.Any, typing.Any], typing.Tuple[typing.Any, typing.Any]]:
+        x_2 = 1 - x_1
+        return (
+            (x_2**2 * (1 - 2 * x_1), 2 * x_1**2 * x_2),
+            (2 * x_2**2 * x_1, x_1**2 * (1 - 2 * x_2)),
+        )
+
+    @classmethod
+    def fit(
+        cls,
+        first_component_fractions: typing.Union[typing.Sequence[float], numpy.ndarray],
+        temperatures: typing.Union[typing.Sequence[float], numpy.ndarray],
+        ln_activity_coefficients: numpy.ndarray,
+        temperature_dependent: typing.Optional[bool] = None,
+    ) -> MargulesParameters:
+        """
+        Fits parameters of the model to logarithms of activity coefficients by linear least squares
+        :param first_component_fractions: molar fractions of the first component, array of shape (n,)
+        :param temperatures: temperatures in K, array of shape (n,)
+        :param ln_activity_coefficients: logarithms of activity coefficients of both components,
+        array of shape (n, 2), not finite values are ignored
+        :param temperature_dependent: if False b_12 and b_21 are fixed to zero,
+        by default they are fitted if the temperatures differ
+        :return: MargulesParameters object
+        """
+        x_1, temperatures, targets, mask, temperature_dependent = _prepare_fit_data(
+            first_component_fractions,
+            temperatures,
+            ln_activity_coefficients,
+            temperature_dependent,
+        )
+        d_12, d_21 = cls(a=(0, 0), b=(0, 0))._ln_activity_coefficients_terms_derivatives(
+            x_1, (0, 0)
+        )
+        columns = [
+            numpy.stack(d_12, axis=-1),
+            numpy.stack(d_21, axis=-1),
+        ]
+        if temperature_dependent:
+            columns += [column / temperatures[:, None] for column in columns]
+
+        params = numpy.zeros(4)
+        params[: len(columns)] = numpy.linalg.lstsq(
+            numpy.stack([column[mask] for column in columns], axis=-1),
+            targets[mask],
+            rcond=None,
+        )[0]
+        return MargulesParameters.from_array(params)
+
+
+@register_activity_coefficient_model(ActivityCoefficientModel.VAN_LAAR)
+@attr.s(auto_attribs=True)
+class VanLaarModel(_InteractionTermsModel):
+    """
+    Van Laar activity coefficient model,
+    ln(gamma_1) = A_12 (A_21 x_2 / (A_12 x_1 + A_21 x_2))^2, A_ij = a_ij + b_ij / T,
+    A_12 and A_21 should be non-zero and of the same sign
+    """
+
+    name: typing.ClassVar[str] = ActivityCoefficientModel.VAN_LAAR
+    parameters_type: typing.ClassVar[typing.Any] = VanLaarParameters
+
+    def _terms(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        return (
+            self.a[0] + self.b[0] / temperature,
+            self.a[1] + self.b[1] / temperature,
+        )
+
+    def _terms_derivatives(
+        self, terms: typing.Tuple[typing.Any, typing.Any]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        return numpy.ones_like(terms[0]), numpy.ones_like(terms[1])
+
+    def _ln_activity_coefficients(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        x_2 = 1 - x_1
+        a_12, a_21 = terms
+        denominator = a_12 * x_1 + a_21 * x_2
+        return (
+            a_12 * (a_21 * x_2 / denominator) ** 2,
+            a_21 * (a_12 * x_1 / denominator) ** 2,
+        )
+
+    def _ln_activity_coefficients_fraction_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        x_2 = 1 - x_1
+        a_12, a_21 = terms
+        factor = 2 * a_12**2 * a_21**2 / (a_12 * x_1 + a_21 * x_2) ** 3
+        return -factor * x_2, factor * x_1
+
+    def _ln_activity_coefficients_terms_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Tuple[typing.Any, typing.Any], typing.Tuple[typing.Any, typing.Any]]:
+        x_2 = 1 - x_1
+        a_12, a_21 = terms
+        cube = (a_12 * x_1 + a_21 * x_2) ** 3
+        return (
+            (
+                a_21**2 * x_2**2 * (a_21 * x_2 - a_12 * x_1) / cube,
+                2 * a_12 * a_21**2 * x_2 * x_1**2 / cube,
+            ),
+            (
+                2 * a_12**2 * a_21 * x_1 * x_2**2 / cube,
+                a_12**2 * x_1**2 * (a_12 * x_1 - a_21 * x_2) / cube,
+            ),
+        )
+
+    @classmethod
+    def _initial_parameters(
+        cls,
+        first_component_fractions: numpy.ndarray,
+        temperatures: numpy.ndarray,
+        ln_activity_coefficients: numpy.ndarray,
+        temperature_dependent: bool,
+    ) -> numpy.ndarray:
+        # both models have the same limits at infinite dilution, ln(gamma_1) = A_12 at x_1 = 0
+        parameters = MargulesModel.fit(
+            first_component_fractions,
+            temperatures,
+            ln_activity_coefficients,
+            temperature_dependent,
+        )
+        x0 = numpy.array(
+            [parameters.a12, parameters.a21, parameters.b12, parameters.b21]
+        )
+        if x0[0] * x0[1] <= 0:
+            # the equation is singular for the terms of different signs
+            mean = x0[:2].mean() if x0[:2].mean() != 0 else 0.1
+            x0 = numpy.array([mean, mean, 0, 0])
+        return x0
+
+
+@register_activity_coefficient_model(ActivityCoefficientModel.WILSON)
+@attr.s(auto_attribs=True)
+class WilsonModel(_InteractionTermsModel):
+    """
+    Wilson activity coefficient model,
+    ln(gamma_1) = -ln(x_1 + Lambda_12 x_2) + x_2 (Lambda_12 / (x_1 + Lambda_12 x_2) - Lambda_21 / (x_2 + Lambda_21 x_1)),
+    Lambda_ij = exp(a_ij + b_ij / T), so that molar volumes of the components are included into a_ij
+    """
+
+    name: typing.ClassVar[str] = ActivityCoefficientModel.WILSON
+    parameters_type: typing.ClassVar[typing.Any] = WilsonParameters
+
+    def _terms(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        return (
+            numpy.exp(self.a[0] + self.b[0] / temperature),
+            numpy.exp(self.a[1] + self.b[1] / temperature),
+        )
+
+    def _terms_derivatives(
+        self, terms: typing.Tuple[typing.Any, typing.Any]
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        return terms
+
+    def _ln_activity_coefficients(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        x_2 = 1 - x_1
+        lambda_12, lambda_21 = terms
+        denominator_1 = x_1 + lambda_12 * x_2
+        denominator_2 = x_2 + lambda_21 * x_1
+        difference = lambda_12 / denominator_1 - lambda_21 / denominator_2
+        return (
+            -numpy.log(denominator_1) + x_2 * difference,
+            -numpy.log(denominator_2) - x_1 * difference,
+        )
+
+    def _ln_activity_coefficients_fraction_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        x_2 = 1 - x_1
+        lambda_12, lambda_21 = terms
+        denominator_1 = x_1 + lambda_12 * x_2
+        denominator_2 = x_2 + lambda_21 * x_1
+        difference = lambda_12 / denominator_1 - lambda_21 / denominator_2
+        # derivatives of the denominators by x_1 are (1 - Lambda_12) and (Lambda_21 - 1)
+        d_difference = (
+            -lambda_12 * (1 - lambda_12) / denominator_1**2
+            + lambda_21 * (lambda_21 - 1) / denominator_2**2
+        )
+        return (
+            -(1 - lambda_12) / denominator_1 - difference + x_2 * d_difference,
+            -(lambda_21 - 1) / denominator_2 - difference - x_1 * d_difference,
+        )
+
+    def _ln_activity_coefficients_terms_derivatives(
+        self,
+        x_1: typing.Union[float, numpy.ndarray],
+        terms: typing.Tuple[typing.Any, typing.Any],
+    ) -> typing.Tuple[typing.Tuple[typing.Any, typing.Any], typing.Tuple[typing.Any, typing.Any]]:
+        x_2 = 1 - x_1
+        lambda_12, lambda_21 = terms
+        denominator_1 = x_1 + lambda_12 * x_2
+        denominator_2 = x_2 + lambda_21 * x_1
+        return (
+            (
+                -x_2 / denominator_1 + x_1 * x_2 / denominator_1**2,
+                -(x_1**2) / denominator_1**2,
+            ),
+            (
+                -(x_2**2) / denominator_2**2,
+                -x_1 / denominator_2 + x_1 * x_2 / denominator_2**2,
+            ),
+        )
+
+
+def calculate_activity_coefficients_array(
+    temperature: typing.Union[float, numpy.ndarray],
+    mixture: Mixture,
+    first_component_fraction: typing.Union[float, numpy.ndarray],
+    calculation_type: str = ActivityCoefficientModel.NRTL,
+) -> numpy.ndarray:
+    """
+    Calculation of activity coefficients of both test_components for arrays of compositions and temperatures.
+    Fractions and temperatures are broadcast against each other,
+    so that a composition-temperature grid may be evaluated in a single call
+    :params
+    temperature: temperature(s) in K
+    mixture: a mixture for which the calculation should be conducted
+    first_component_fraction: molar fraction(s) of the first component
+    :return: activity coefficients as an array of shape (..., 2)
+    """
+    first_component_fraction, temperature = _to_fraction_and_temperature_arrays(
+        first_component_fraction, temperature
+    )
+
+    return _get_activity_model(mixture, calculation_type).activity_coefficients(
+        first_component_fraction=first_component_fraction,
+        temperature=temperature,
+    )
+
+
+def get_activity_coefficient_model_type(calculation_type: str) -> typing.Any:
+    """
+    Finds a registered activity coefficient model
+    :param calculation_type: name of the model
+    :return: class of the model
+    """
+    try:
+        return ACTIVITY_COEFFICIENT_MODELS[calculation_type]
+    except (KeyError, TypeError):
+        raise ValueError("Type of calculation not supported")
+
+
+def _get_activity_model(mixture: Mixture, calculation_type: str) -> typing.Any:
+    """
+    Creates an activity coefficient model of a specified type for the mixture
+    :param mixture: a mixture for which the calculation should be conducted
+    :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+    :return: object of the registered model class, e.g. NRTLModel or UNIQUACModel
+    """
+    return get_activity_coefficient_model_type(calculation_type).from_mixture(mixture)
+
+
+@attr.s(auto_attribs=True)
+class ThermodynamicKernel:
+    """
+    Prepared thermodynamic model of a binary mixture.
+    Activity coefficient model, vapour pressure equations and molecular weights
+    are validated and unpacked once, so that the evaluation does not repeat any dispatching,
+    saturated pressures are calculated by the components
+    """
+
+    mixture: Mixture
+    calculation_type: str
+    activity_model: typing.Any
+    molecular_weights: typing.Tuple[float, float]
+    components: typing.Tuple[Component, Component]
+    cache: typing.Optional[ThermodynamicCache] = None
+
+    @classmethod
+    def from_mixture(
+        cls,
+        mixture: Mixture,
+        calculation_type: str = ActivityCoefficientModel.NRTL,
+        cache: typing.Optional[ThermodynamicCache] = None,
+    ) -> "ThermodynamicKernel":
+        """
+        Creates a kernel for a mixture and a chosen activity coefficient model
+        :param mixture: a mixture for which the calculation should be conducted
+        :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param cache: optional ThermodynamicCache to memoize partial pressures calculated by the kernel
+        :return: ThermodynamicKernel object
+        """
+        components = (mixture.first_component, mixture.second_component)
+
+        for component in components:
+            if component.vapour_pressure_constants.type not in (
+                VPConstantsType.antoine,
+                VPConstantsType.frost,
+            ):
+                raise ValueError("Type of calculation not supported")
+
+        return cls(
+            mixture=mixture,
+            calculation_type=calculation_type,
+            activity_model=_get_activity_model(mixture, calculation_type),
+            molecular_weights=(
+                mixture.first_component.molecular_weight,
+                mixture.second_component.molecular_weight,
+            ),
+            components=components,
+            cache=cache,
+        )
+
+    def to_molar_fraction(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        composition_type: str,
+    ) -> typing.Union[float, numpy.ndarray]:
+        """
+        Converts fraction(s) of the first component to molar fraction(s)
+        :param first_component_fraction: fraction(s) of the first component
+        :param composition_type: type of the given fraction(s)
+        :return: molar fraction(s) of the first component
+        """
+        if composition_type != CompositionType.weight:
+            return first_component_fraction
+
+        first = first_component_fraction / self.molecular_weights[0]
+        return first / (
+            first + (1 - first_component_fraction) / self.molecular_weights[1]
+        )
+
+    def vapour_pressure(
+        self, index: int, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
+        """
+        Calculation of saturated pressure of a component in kPa
+        :param index: index of the component in the mixture, 0 or 1
+        :param temperature: temperature(s) in K
+        :return: saturated pressure(s) in kPa
+        """
+        return self.components[index].get_vapor_pressure(temperature)
+
+    def vapour_pressure_derivative(
+        self, index: int, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
+        """
+        Calculation of the derivative of saturated pressure of a component by temperature in kPa/K
+        :param index: index of the component in the mixture, 0 or 1
+        :param temperature: temperature(s) in K
+        :return: derivative(s) of saturated pressure in kPa/K
+        """
+        return self.components[index].get_vapor_pressure_derivative(temperature)
+
+    def gamma(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of both components
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: activity coefficients as an array of shape (..., 2)
+        """
+        return self.activity_model.activity_coefficients(
+            first_component_fraction=numpy.asarray(first_component_fraction, dtype=float),
+            temperature=numpy.asarray(temperature, dtype=float),
+        )
+
+    def psat(self, temperature: typing.Union[float, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculation of saturated pressures of both components in kPa,
+        using Antoine (log10(P)=a+b/(T+C)) or Frost (ln(P) = a+b/T+c/T^2) equation of each component
+        :param temperature: temperature(s) in K
+        :return: saturated pressures as an array of shape (..., 2)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)
+        return numpy.stack(
+            (
+                self.vapour_pressure(0, temperature),
+                self.vapour_pressure(1, temperature),
+            ),
+            axis=-1,
+        )
+
+    def psat_derivative(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        Calculation of derivatives of saturated pressures of both components by temperature in kPa/K
+        :param temperature: temperature(s) in K
+        :return: derivatives of saturated pressures as an array of shape (..., 2)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)
+        return numpy.stack(
+            (
+                self.vapour_pressure_derivative(0, temperature),
+                self.vapour_pressure_derivative(1, temperature),
+            ),
+            axis=-1,
+        )
+
+    def partial_pressures(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of partial pressures of both components in kPa
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: partial pressures as an array of shape (..., 2)
+        """
+        first_component_fraction = numpy.asarray(first_component_fraction, dtype=float)
+        fractions = numpy.stack(
+            (first_component_fraction, 1 - first_component_fraction), axis=-1
+        )
+        return (
+            self.psat(temperature)
+            * self.gamma(first_component_fraction, temperature)
+            * fractions
+        )
+
+    def get_partial_pressures(
+        self, temperature: float, composition: Composition
+    ) -> typing.Tuple[float, float]:
+        """
+        Calculation of partial pressures of both test_components at a single point, same as get_partial_pressures
+        :param temperature: temperature in K
+        :param composition: specified composition in mol or weight %
+        :return: Partial pressures as a tuple, test_components wise in kPa
+        """
+        x = self.to_molar_fraction(composition.p, composition.type)
+
+        if self.cache is not None:
+            return self.cache.get_or_calculate(
+                mixture=self.mixture,
+                calculation_type=self.calculation_type,
+                quantity="partial_pressures",
+                temperature=temperature,
+                molar_fraction=x,
+                calculate=lambda: self._get_partial_pressures(temperature, x),
+            )
+
+        return self._get_partial_pressures(temperature, x)
+
+    def _get_partial_pressures(
+        self, temperature: float, x: float
+    ) -> typing.Tuple[float, float]:
+        ln_activity_coefficients = self.activity_model.ln_activity_coefficients(
+            x, temperature
+        )
+        return (
+            self.vapour_pressure(0, temperature)
+            * numpy.exp(ln_activity_coefficients[0])
+            * x,
+            self.vapour_pressure(1, temperature)
+            * numpy.exp(ln_activity_coefficients[1])
+            * (1 - x),
+        )
+
+    def get_partial_pressures_with_derivatives(
+        self, temperature: float, composition: Composition
+    ) -> PartialPressuresDerivatives:
+        """
+        Calculation of partial pressures of both test_components and their analytic derivatives at a single point
+        :param temperature: temperature in K
+        :param composition: specified composition in mol or weight %, derivatives are always by the molar fraction
+        :return: PartialPressuresDerivatives object
+        """
+        x = self.to_molar_fraction(composition.p, composition.type)
+        fractions = (x, 1 - x)
+        (
+            ln_activity_coefficients,
+            fraction_derivatives,
+            temperature_derivatives,
+        ) = self.activity_model.ln_activity_coefficients_derivatives(x, temperature)
+
+        partial_pressures = []
+        d_first_component_fraction = []
+        d_temperature = []
+        for index, sign in enumerate((1, -1)):
+            vapour_pressure = self.vapour_pressure(index, temperature)
+            activity_coefficient = numpy.exp(ln_activity_coefficients[index])
+            partial_pressures.append(
+                vapour_pressure * activity_coefficient * fractions[index]
+            )
+            d_first_component_fraction.append(
+                vapour_pressure
+                * activity_coefficient
+                * (sign + fractions[index] * fraction_derivatives[index])
+            )
+            d_temperature.append(
+                activity_coefficient
+                * fractions[index]
+                * (
+                    self.vapour_pressure_derivative(index, temperature)
+                    + vapour_pressure * temperature_derivatives[index]
+                )
+            )
+
+        return PartialPressuresDerivatives(
+            partial_pressures=tuple(partial_pressures),
+            d_first_component_fraction=tuple(d_first_component_fraction),
+            d_temperature=tuple(d_temperature),
+        )
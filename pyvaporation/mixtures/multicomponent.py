@@ -0,0 +1,308 @@
+import itertools
+import typing
+
+import attr
+import numpy
+
+from ..components import Component
+from .mixture import ActivityCoefficientModel, Mixture, NRTLModel
+
+
+@attr.s(auto_attribs=True)
+class MulticomponentMixture:
+    """
+    A class to represent mixtures of any number of components,
+    interactions of the components are described by the binary mixtures of each pair
+    """
+
+    name: str
+    components: typing.List[Component]
+    binary_mixtures: typing.List[Mixture]
+
+    def __attrs_post_init__(self):
+        if len(self.components) < 2:
+            raise ValueError("At least two components are required to create a mixture!")
+        for i, j in itertools.combinations(range(len(self.components)), 2):
+            self.get_binary_mixture(i, j)
+
+    @classmethod
+    def from_mixture(cls, mixture: Mixture) -> "MulticomponentMixture":
+        """
+        Represents a binary mixture as a multicomponent one
+        :param mixture: a binary mixture
+        :return: MulticomponentMixture object
+        """
+        return cls(
+            name=mixture.name,
+            components=[mixture.first_component, mixture.second_component],
+            binary_mixtures=[mixture],
+        )
+
+    def get_binary_mixture(self, i: int, j: int) -> typing.Tuple[Mixture, bool]:
+        """
+        Finds the binary mixture of a pair of components
+        :param i: index of the first component of the pair
+        :param j: index of the second component of the pair
+        :return: the binary mixture and True if its first component is the j-th component
+        """
+        for mixture in self.binary_mixtures:
+            if (
+                mixture.first_component.name == self.components[i].name
+                and mixture.second_component.name == self.components[j].name
+            ):
+                return mixture, False
+            if (
+                mixture.first_component.name == self.components[j].name
+                and mixture.second_component.name == self.components[i].name
+            ):
+                return mixture, True
+
+        raise ValueError(
+            "Binary mixture of %s and %s must be specified"
+            % (self.components[i].name, self.components[j].name)
+        )
+
+    def _pairs(self) -> typing.Iterator[typing.Tuple[int, int, Mixture]]:
+        """
+        :return: indices of each ordered pair of components, so that the binary mixture's first component is i-th
+        """
+        for i, j in itertools.combinations(range(len(self.components)), 2):
+            mixture, is_swapped = self.get_binary_mixture(i, j)
+            if is_swapped:
+                yield j, i, mixture
+            else:
+                yield i, j, mixture
+
+
+@attr.s(auto_attribs=True)
+class MulticomponentNRTLModel:
+    """
+    NRTL activity coefficient model of a mixture of N components in matrix form,
+    alpha, a and g (divided by R) are (N, N) matrices with zero diagonals
+    """
+
+    alpha: numpy.ndarray
+    a: numpy.ndarray
+    g: numpy.ndarray
+
+    @classmethod
+    def from_mixture(cls, mixture: MulticomponentMixture) -> "MulticomponentNRTLModel":
+        """
+        Assembles interaction matrices from NRTL parameters of the binary mixtures
+        :param mixture: a mixture for which the calculation should be conducted
+        :return: MulticomponentNRTLModel object
+        """
+        size = len(mixture.components)
+        alpha = numpy.zeros((size, size))
+        a = numpy.zeros((size, size))
+        g = numpy.zeros((size, size))
+
+        for i, j, binary_mixture in mixture._pairs():
+            binary_model = NRTLModel.from_mixture(binary_mixture)
+            alpha[i, j], alpha[j, i] = binary_model.alpha
+            a[i, j], a[j, i] = binary_model.a
+            g[i, j], g[j, i] = binary_model.g
+
+        return cls(alpha=alpha, a=a, g=g)
+
+    def ln_activity_coefficients(
+        self,
+        fractions: numpy.ndarray,
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of logarithms of activity coefficients of all the components
+        :param fractions: molar fractions of the components, array of shape (..., N)
+        :param temperature: temperature(s) in K, broadcastable with fractions[..., 0]
+        :return: logarithms of activity coefficients as an array of shape (..., N)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)[..., None, None]
+
+        tau = self.a + self.g / temperature
+        g = numpy.exp(-self.alpha * tau)
+
+        # denominators and numerators of the first term, sums over k of x_k G_ki and x_k tau_ki G_ki
+        denominators = numpy.einsum("...k,...ki->...i", fractions, g)
+        numerators = numpy.einsum("...k,...ki->...i", fractions, tau * g)
+        ratios = numerators / denominators
+
+        return ratios + numpy.einsum(
+            "...j,...ij->...i",
+            fractions / denominators,
+            g * (tau - ratios[..., None, :]),
+        )
+
+    def activity_coefficients(
+        self,
+        fractions: numpy.ndarray,
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of all the components
+        :param fractions: molar fractions of the components, array of shape (..., N)
+        :param temperature: temperature(s) in K, broadcastable with fractions[..., 0]
+        :return: activity coefficients as an array of shape (..., N)
+        """
+        return numpy.exp(self.ln_activity_coefficients(fractions, temperature))
+
+
+@attr.s(auto_attribs=True)
+class MulticomponentUNIQUACModel:
+    """
+    UNIQUAC activity coefficient model of a mixture of N components in matrix form,
+    alpha and beta are (N, N) matrices with zero diagonals, so that tau_ij = exp(-(alpha_ij + beta_ij / T) / T).
+    The residual part is the standard multicomponent one,
+    for binary mixtures it coincides with UNIQUACModel for the first component only,
+    since the residual part of the second component in UNIQUACModel is kept as the default parameters were fitted with
+    """
+
+    alpha: numpy.ndarray
+    beta: numpy.ndarray
+    r: numpy.ndarray
+    q_geometric: numpy.ndarray
+    q_interaction: numpy.ndarray
+    z: float
+
+    @classmethod
+    def from_mixture(
+        cls, mixture: MulticomponentMixture
+    ) -> "MulticomponentUNIQUACModel":
+        """
+        Assembles interaction matrices from UNIQUAC parameters of the binary mixtures
+        :param mixture: a mixture for which the calculation should be conducted
+        :return: MulticomponentUNIQUACModel object
+        """
+        size = len(mixture.components)
+        alpha = numpy.zeros((size, size))
+        beta = numpy.zeros((size, size))
+        z = set()
+
+        for i, j, binary_mixture in mixture._pairs():
+            if binary_mixture.uniquac_params is None:
+                raise ValueError(
+                    "UNIQUAC Parameters must be specified for this type of calculation"
+                )
+            parameters = binary_mixture.uniquac_params
+            alpha[i, j], alpha[j, i] = parameters.alpha_12, parameters.alpha_21
+            beta[i, j], beta[j, i] = parameters.beta_12, parameters.beta_21
+            z.add(parameters.z)
+
+        if len(z) != 1:
+            raise ValueError("Coordination numbers of all the binary mixtures must be equal")
+        if any(component.uniquac_constants is None for component in mixture.components):
+            raise ValueError(
+                "UNIQUAC Constants for all Components must be specified for this type of calculation"
+            )
+
+        constants = [component.uniquac_constants for component in mixture.components]
+        return cls(
+            alpha=alpha,
+            beta=beta,
+            r=numpy.array([c.r for c in constants], dtype=float),
+            q_geometric=numpy.array([c.q_geometric for c in constants], dtype=float),
+            q_interaction=numpy.array([c.q_interaction for c in constants], dtype=float),
+            z=float(z.pop()),
+        )
+
+    def ln_activity_coefficients(
+        self,
+        fractions: numpy.ndarray,
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of logarithms of activity coefficients of all the components,
+        infinite dilution limits are used for absent components
+        :param fractions: molar fractions of the components, array of shape (..., N)
+        :param temperature: temperature(s) in K, broadcastable with fractions[..., 0]
+        :return: logarithms of activity coefficients as an array of shape (..., N)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)[..., None, None]
+
+        # phi_i / x_i and theta_i / x_i, finite at x_i = 0
+        phi_ratios = self.r / (fractions @ self.r)[..., None]
+        theta_geometric_ratios = self.q_geometric / (fractions @ self.q_geometric)[
+            ..., None
+        ]
+        theta = (
+            fractions
+            * self.q_interaction
+            / (fractions @ self.q_interaction)[..., None]
+        )
+        l = self.z / 2 * (self.r - self.q_geometric) - (self.r - 1)
+
+        combinatorial = (
+            numpy.log(phi_ratios)
+            + self.z
+            / 2
+            * self.q_geometric
+            * numpy.log(theta_geometric_ratios / phi_ratios)
+            + l
+            - phi_ratios * (fractions @ l)[..., None]
+        )
+
+        tau = numpy.exp(-(self.alpha + self.beta / temperature) / temperature)
+        # sums over j of theta_j tau_ji
+        sums = numpy.einsum("...j,...ji->...i", theta, tau)
+        residual = self.q_interaction * (
+            1 - numpy.log(sums) - numpy.einsum("...j,...ij->...i", theta / sums, tau)
+        )
+
+        return combinatorial + residual
+
+    def activity_coefficients(
+        self,
+        fractions: numpy.ndarray,
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of all the components
+        :param fractions: molar fractions of the components, array of shape (..., N)
+        :param temperature: temperature(s) in K, broadcastable with fractions[..., 0]
+        :return: activity coefficients as an array of shape (..., N)
+        """
+        return numpy.exp(self.ln_activity_coefficients(fractions, temperature))
+
+
+def calculate_multicomponent_activity_coefficients(
+    temperature: typing.Union[float, numpy.ndarray],
+    mixture: MulticomponentMixture,
+    fractions: typing.Union[typing.Sequence[float], numpy.ndarray],
+    calculation_type: str = ActivityCoefficientModel.NRTL,
+) -> numpy.ndarray:
+    """
+    Calculation of activity coefficients of all the components for a batch of compositions
+    :param temperature: temperature(s) in K, broadcastable with fractions[..., 0]
+    :param mixture: a mixture for which the calculation should be conducted
+    :param fractions: molar fractions of the components, array of shape (..., N), each row should sum up to 1
+    :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+    :return: activity coefficients as an array of shape (..., N)
+    """
+    fractions = numpy.asarray(fractions, dtype=float)
+
+    if fractions.shape[-1] != len(mixture.components):
+        raise ValueError("Number of fractions does not match the number of components")
+    if numpy.any((fractions < 0) | (fractions > 1)):
+        raise ValueError("Given molar fractions are not in [0, 1] range")
+    if not numpy.allclose(fractions.sum(axis=-1), 1):
+        raise ValueError("Molar fractions should sum up to 1")
+
+    return get_multicomponent_model(mixture, calculation_type).activity_coefficients(
+        fractions, temperature
+    )
+
+
+def get_multicomponent_model(
+    mixture: MulticomponentMixture, calculation_type: str
+) -> typing.Union[MulticomponentNRTLModel, MulticomponentUNIQUACModel]:
+    """
+    Creates a multicomponent activity coefficient model of a specified type for the mixture
+    :param mixture: a mixture for which the calculation should be conducted
+    :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+    :return: MulticomponentNRTLModel or MulticomponentUNIQUACModel object
+    """
+    if calculation_type == ActivityCoefficientModel.NRTL:
+        return MulticomponentNRTLModel.from_mixture(mixture)
+    elif calculation_type == ActivityCoefficientModel.UNIQUAC:
+        return MulticomponentUNIQUACModel.from_mixture(mixture)
+    else:
+        raise ValueError("Type of calculation not supported")
@@ -0,0 +1,280 @@
+import json
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import attr
+import numpy
+
+from ..utils import NRTLParameters, UNIQUACParameters
+from .mixture import ActivityCoefficientModel, Mixture
+from .mixtures import Mixtures
+from .uniquac_fitting import (
+    PARAMETER_LIMITS,
+    VLEObjective,
+    VLEPoints,
+    _get_component,
+    fit_vle_least_squares,
+)
+
+# keys of the parameters of the models in the registry entries
+_PARAMETERS_KEYS = {
+    ActivityCoefficientModel.UNIQUAC: "uniquac_params",
+    ActivityCoefficientModel.NRTL: "nrtl_params",
+}
+
+
+@attr.s(auto_attribs=True)
+class RefitResult:
+    """
+    Class to represent the result of a refit of a directory of VLE data:
+    names of the refitted mixtures, names of the skipped ones and the updated registry
+    """
+
+    fitted: typing.List[str]
+    skipped: typing.List[str]
+    registry: typing.Dict[str, typing.Dict[str, typing.Any]]
+
+
+def _library_version() -> str:
+    from .. import __version__
+
+    return __version__
+
+
+def _get_previous_parameters(
+    name: str,
+    data: VLEPoints,
+    entry: typing.Optional[typing.Dict[str, typing.Any]],
+    calculation_type: str,
+) -> typing.List[typing.Union[UNIQUACParameters, NRTLParameters]]:
+    """
+    :return: parameters of the model from the registry entry and from the pre-defined Mixtures of the same name
+    """
+    key = _PARAMETERS_KEYS[calculation_type]
+    parameters_type = (
+        UNIQUACParameters
+        if calculation_type == ActivityCoefficientModel.UNIQUAC
+        else NRTLParameters
+    )
+    previous = []
+    if entry is not None and key in entry:
+        previous.append(parameters_type(**entry[key]))
+    mixture = getattr(Mixtures, name, None)
+    if (
+        isinstance(mixture, Mixture)
+        and mixture.first_component.name == data.components[0].name
+        and mixture.second_component.name == data.components[1].name
+        and getattr(mixture, key) is not None
+    ):
+        previous.append(getattr(mixture, key))
+    return previous
+
+
+def _is_in_limits(params: numpy.ndarray, calculation_type: str) -> bool:
+    lower, upper = numpy.array(PARAMETER_LIMITS[calculation_type]).T
+    continuous = params[: len(lower)]
+    return bool(
+        numpy.isfinite(params).all()
+        and ((continuous > lower) & (continuous < upper)).all()
+    )
+
+
+def _refit_mixture(
+    name: str,
+    data: VLEPoints,
+    entry: typing.Optional[typing.Dict[str, typing.Any]],
+    calculation_types: typing.Sequence[str],
+) -> typing.Dict[str, typing.Any]:
+    """
+    Fits parameters of all the models to the VLE data of a mixture.
+    Besides the fit from the default initial parameters, the fits are started from the parameters
+    in the registry entry and in the pre-defined Mixtures, the previous parameters are kept,
+    if none of the fits describes the data better. Models, which could not be fitted within
+    PARAMETER_LIMITS, are left out of the entry
+    :return: registry entry of the mixture
+    """
+    new_entry = {
+        "data_hash": data.digest(),
+        "version": _library_version(),
+        "first_component": data.components[0].name,
+        "second_component": data.components[1].name,
+        "errors": {},
+    }
+    for calculation_type in calculation_types:
+        vle_objective = VLEObjective.from_points(data, calculation_type)
+        fit = fit_vle_least_squares(data=data, calculation_type=calculation_type)
+        candidates = [vle_objective.to_array(fit.parameters)]
+        for parameters in _get_previous_parameters(
+            name, data, entry, calculation_type
+        ):
+            params = vle_objective.to_array(parameters)
+            if not _is_in_limits(params, calculation_type):
+                continue
+            if calculation_type == ActivityCoefficientModel.UNIQUAC:
+                warm_fit = fit_vle_least_squares(
+                    data=data, z_values=[int(params[4])], x0=params[:4]
+                )
+            else:
+                warm_fit = fit_vle_least_squares(
+                    data=data, x0=params, calculation_type=calculation_type
+                )
+            candidates += [params, vle_objective.to_array(warm_fit.parameters)]
+
+        errors = [
+            vle_objective(params) if _is_in_limits(params, calculation_type) else numpy.inf
+            for params in candidates
+        ]
+        best = int(numpy.argmin(errors))
+        if not numpy.isfinite(errors[best]):
+            continue
+
+        new_entry["errors"][calculation_type] = float(errors[best])
+        new_entry[_PARAMETERS_KEYS[calculation_type]] = {
+            field: value if field == "z" or value is None else float(value)
+            for field, value in attr.asdict(
+                vle_objective.to_parameters(candidates[best])
+            ).items()
+        }
+    return new_entry
+
+
+def _merge_entries(
+    entry: typing.Optional[typing.Dict[str, typing.Any]],
+    new_entry: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """
+    Parameters of the models, which were not refitted, are kept,
+    their errors are kept only if the data did not change
+    """
+    if entry is None:
+        return new_entry
+    errors = (
+        dict(entry.get("errors", {}))
+        if entry.get("data_hash") == new_entry["data_hash"]
+        else {}
+    )
+    errors.update(new_entry["errors"])
+    return {**entry, **new_entry, "errors": errors}
+
+
+def _is_up_to_date(
+    entry: typing.Optional[typing.Dict[str, typing.Any]],
+    data_hash: str,
+    calculation_types: typing.Sequence[str],
+) -> bool:
+    return (
+        entry is not None
+        and entry.get("data_hash") == data_hash
+        and entry.get("version") == _library_version()
+        and all(
+            calculation_type in entry.get("errors", {})
+            for calculation_type in calculation_types
+        )
+    )
+
+
+def refit_mixtures(
+    directory: typing.Union[str, Path],
+    registry_path: typing.Union[str, Path],
+    calculation_types: typing.Sequence[str] = (
+        ActivityCoefficientModel.UNIQUAC,
+        ActivityCoefficientModel.NRTL,
+    ),
+    n_jobs: typing.Optional[int] = None,
+    force: bool = False,
+) -> RefitResult:
+    """
+    Fits UNIQUAC and NRTL parameters to every VLE .csv file in a directory and writes them to a .json registry,
+    mixtures are named after the files. Mixtures, which data did not change since the registry was written,
+    are skipped, the rest are fitted concurrently in a pool of processes.
+    Refitted models are merged into the existing entries, the previous parameters of a model are kept,
+    if the new fit does not describe the data better
+    :param directory: directory with VLE data files in the format of VLEPoints.from_csv
+    :param registry_path: path to the .json registry, it is updated if it exists
+    :param calculation_types: Thermodynamic models, which parameters are fitted
+    :param n_jobs: number of worker processes, by default the number of CPUs,
+    if 1 the mixtures are fitted one after another in the current process
+    :param force: if True all the mixtures are refitted
+    :return: RefitResult object
+    """
+    registry_path = Path(registry_path)
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("Number of jobs should be positive")
+
+    registry = {}
+    if registry_path.exists():
+        with open(registry_path) as file:
+            registry = json.load(file)
+
+    # each file is read once, the parsed data is sent to the workers
+    data = {
+        path.stem: VLEPoints.from_csv(path)
+        for path in sorted(Path(directory).glob("*.csv"))
+    }
+    fitted = [
+        name
+        for name, points in data.items()
+        if force
+        or not _is_up_to_date(registry.get(name), points.digest(), calculation_types)
+    ]
+
+    if n_jobs == 1 or len(fitted) < 2:
+        entries = [
+            _refit_mixture(name, data[name], registry.get(name), calculation_types)
+            for name in fitted
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(fitted))) as executor:
+            entries = list(
+                executor.map(
+                    _refit_mixture,
+                    fitted,
+                    [data[name] for name in fitted],
+                    [registry.get(name) for name in fitted],
+                    [calculation_types] * len(fitted),
+                )
+            )
+    for name, entry in zip(fitted, entries):
+        registry[name] = _merge_entries(registry.get(name), entry)
+
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = registry_path.with_suffix(".tmp%s" % os.getpid())
+    with open(temporary_path, "w") as file:
+        json.dump(registry, file, indent=4, sort_keys=True)
+    os.replace(temporary_path, registry_path)
+
+    return RefitResult(
+        fitted=fitted,
+        skipped=[name for name in data if name not in fitted],
+        registry=registry,
+    )
+
+
+def load_mixtures(registry_path: typing.Union[str, Path]) -> typing.Dict[str, Mixture]:
+    """
+    Reads mixtures from a .json registry written by refit_mixtures
+    :param registry_path: path to the .json registry
+    :return: dictionary of mixtures by their names
+    """
+    with open(registry_path) as file:
+        registry = json.load(file)
+
+    return {
+        name: Mixture(
+            name=name,
+            first_component=_get_component(entry["first_component"]),
+            second_component=_get_component(entry["second_component"]),
+            nrtl_params=NRTLParameters(**entry["nrtl_params"])
+            if "nrtl_params" in entry
+            else None,
+            uniquac_params=UNIQUACParameters(**entry["uniquac_params"])
+            if "uniquac_params" in entry
+            else None,
+        )
+        for name, entry in registry.items()
+    }
+
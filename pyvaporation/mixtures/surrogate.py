@@ -0,0 +1,417 @@
+import typing
+
+import attr
+import numpy
+
+from .mixture import (
+    ActivityCoefficientModel,
+    Composition,
+    Mixture,
+    ThermodynamicKernel,
+    calculate_activity_coefficients_array,
+)
+
+
+@attr.s(auto_attribs=True)
+class ThermodynamicSurrogate:
+    """
+    Tabulated surrogate of a ThermodynamicKernel.
+    Logarithms of activity coefficients are tabulated on an adaptively refined
+    grid of molar fractions and temperatures and interpolated with tensor product linear splines,
+    outside the tabulated temperature range the exact kernel is used.
+    The surrogate may be used by Pervaporation in place of the exact kernel
+    """
+
+    kernel: ThermodynamicKernel
+    fractions: numpy.ndarray
+    temperatures: numpy.ndarray
+    ln_activity_coefficients: numpy.ndarray
+    lookup_resolution: typing.Tuple[int, int] = (4096, 512)
+    max_error: typing.Optional[float] = None
+    _fraction_lookup: numpy.ndarray = attr.ib(init=False, repr=False, eq=False)
+    _temperature_lookup: numpy.ndarray = attr.ib(init=False, repr=False, eq=False)
+    _cell_coefficients: numpy.ndarray = attr.ib(init=False, repr=False, eq=False)
+    _fraction_scales: numpy.ndarray = attr.ib(init=False, repr=False, eq=False)
+    _temperature_scales: numpy.ndarray = attr.ib(init=False, repr=False, eq=False)
+    _fraction_nodes: typing.List[float] = attr.ib(init=False, repr=False, eq=False)
+    _temperature_nodes: typing.List[float] = attr.ib(init=False, repr=False, eq=False)
+    _fraction_lookup_list: typing.List[int] = attr.ib(init=False, repr=False, eq=False)
+    _temperature_lookup_list: typing.List[int] = attr.ib(init=False, repr=False, eq=False)
+    _table: typing.List = attr.ib(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        if self.fractions[0] != 0 or self.fractions[-1] != 1:
+            raise ValueError("Tabulated molar fractions should span [0, 1]")
+        if self.ln_activity_coefficients.shape != (
+            len(self.fractions),
+            len(self.temperatures),
+            2,
+        ):
+            raise ValueError(
+                "Shape of the table does not match the tabulated fractions and temperatures"
+            )
+        # Interval of the grid containing each cell of a fine uniform grid,
+        # so that the interval of a point is found without a binary search.
+        # The fine grid should be aligned with the nodes, which is the case for the grids built by from_kernel
+        if not _is_aligned(self.fractions, self.lookup_resolution[0]):
+            raise ValueError(
+                "Tabulated molar fractions are not aligned with the lookup grid"
+            )
+        if not _is_aligned(self.temperatures, self.lookup_resolution[1]):
+            raise ValueError(
+                "Tabulated temperatures are not aligned with the lookup grid"
+            )
+        self._fraction_lookup = _interval_lookup(
+            self.fractions, self.lookup_resolution[0]
+        )
+        self._temperature_lookup = _interval_lookup(
+            self.temperatures, self.lookup_resolution[1]
+        )
+        # bilinear coefficients of each cell, component wise and contiguous,
+        # ln(gamma) = c0 + u * cu + v * (cv + u * cuv) for local coordinates u, v in [0, 1]
+        table = self.ln_activity_coefficients
+        c0 = table[:-1, :-1]
+        cu = table[1:, :-1] - c0
+        cv = table[:-1, 1:] - c0
+        cuv = table[1:, 1:] - table[1:, :-1] - cv
+        self._cell_coefficients = numpy.ascontiguousarray(
+            numpy.stack((c0, cu, cv, cuv)).transpose(3, 0, 1, 2).reshape(2, 4, -1)
+        )
+        self._fraction_scales = 1 / numpy.diff(self.fractions)
+        self._temperature_scales = 1 / numpy.diff(self.temperatures)
+
+        self._fraction_nodes = self.fractions.tolist()
+        self._temperature_nodes = self.temperatures.tolist()
+        self._fraction_lookup_list = self._fraction_lookup.tolist()
+        self._temperature_lookup_list = self._temperature_lookup.tolist()
+        self._table = self.ln_activity_coefficients.tolist()
+
+    @classmethod
+    def from_kernel(
+        cls,
+        kernel: ThermodynamicKernel,
+        temperature_range: typing.Tuple[float, float],
+        tolerance: float = 1e-4,
+        max_refinements: int = 7,
+        validation_points: int = 10000,
+    ) -> "ThermodynamicSurrogate":
+        """
+        Tabulates activity coefficients of a kernel.
+        Starting from a 33 x 5 grid, intervals are split in halves until the interpolation error at their midpoints
+        is below the tolerance or the intervals were split max_refinements times
+        :param kernel: ThermodynamicKernel to be tabulated
+        :param temperature_range: minimum and maximum tabulated temperatures in K
+        :param tolerance: target absolute error in logarithms of activity coefficients
+        :param max_refinements: maximum number of times an interval may be split
+        :param validation_points: number of random points used to estimate the maximum error
+        :return: ThermodynamicSurrogate object
+        """
+        if temperature_range[0] >= temperature_range[1]:
+            raise ValueError("Temperature range should be stated as (minimum, maximum)")
+
+        fractions = numpy.linspace(0, 1, 33)
+        temperatures = numpy.linspace(temperature_range[0], temperature_range[1], 5)
+        lookup_resolution = (
+            (len(fractions) - 1) * 2**max_refinements,
+            (len(temperatures) - 1) * 2**max_refinements,
+        )
+        min_fraction_interval = 1.5 / lookup_resolution[0]
+        min_temperature_interval = (
+            1.5 * (temperature_range[1] - temperature_range[0]) / lookup_resolution[1]
+        )
+
+        while True:
+            table = _ln_activity_coefficients(kernel, fractions, temperatures)
+
+            fraction_errors = numpy.abs(
+                _ln_activity_coefficients(
+                    kernel, (fractions[:-1] + fractions[1:]) / 2, temperatures
+                )
+                - (table[:-1] + table[1:]) / 2
+            ).max(axis=(1, 2))
+            temperature_errors = numpy.abs(
+                _ln_activity_coefficients(
+                    kernel, fractions, (temperatures[:-1] + temperatures[1:]) / 2
+                )
+                - (table[:, :-1] + table[:, 1:]) / 2
+            ).max(axis=(0, 2))
+
+            # both directions contribute to the error of the bilinear interpolation
+            refine_fractions = (fraction_errors > tolerance / 2) & (
+                numpy.diff(fractions) > min_fraction_interval
+            )
+            refine_temperatures = (temperature_errors > tolerance / 2) & (
+                numpy.diff(temperatures) > min_temperature_interval
+            )
+            if not refine_fractions.any() and not refine_temperatures.any():
+                break
+
+            fractions = _split_intervals(fractions, refine_fractions)
+            temperatures = _split_intervals(temperatures, refine_temperatures)
+
+        surrogate = cls(
+            kernel=kernel,
+            fractions=fractions,
+            temperatures=temperatures,
+            ln_activity_coefficients=table,
+            lookup_resolution=lookup_resolution,
+        )
+        surrogate.max_error = surrogate.validate(validation_points)
+
+        return surrogate
+
+    @classmethod
+    def from_mixture(
+        cls,
+        mixture: Mixture,
+        temperature_range: typing.Tuple[float, float],
+        calculation_type: str = ActivityCoefficientModel.NRTL,
+        tolerance: float = 1e-4,
+        max_refinements: int = 7,
+        validation_points: int = 10000,
+    ) -> "ThermodynamicSurrogate":
+        """
+        Tabulates activity coefficients of a mixture
+        :param mixture: a mixture for which the calculation should be conducted
+        :param temperature_range: minimum and maximum tabulated temperatures in K
+        :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param tolerance: target absolute error in logarithms of activity coefficients
+        :param max_refinements: maximum number of times an interval may be split
+        :param validation_points: number of random points used to estimate the maximum error
+        :return: ThermodynamicSurrogate object
+        """
+        return cls.from_kernel(
+            kernel=mixture.get_kernel(calculation_type),
+            temperature_range=temperature_range,
+            tolerance=tolerance,
+            max_refinements=max_refinements,
+            validation_points=validation_points,
+        )
+
+    @property
+    def mixture(self) -> Mixture:
+        return self.kernel.mixture
+
+    @property
+    def calculation_type(self) -> str:
+        return self.kernel.calculation_type
+
+    @property
+    def temperature_range(self) -> typing.Tuple[float, float]:
+        return self._temperature_nodes[0], self._temperature_nodes[-1]
+
+    def validate(self, number_of_points: int = 10000, seed: int = 0) -> float:
+        """
+        Estimates the maximum relative error of interpolated activity coefficients
+        against calculate_activity_coefficients at random points of the tabulated range
+        :param number_of_points: number of validation points
+        :param seed: seed of the random generator
+        :return: maximum relative error of activity coefficients
+        """
+        generator = numpy.random.default_rng(seed)
+        fractions = generator.uniform(0, 1, number_of_points)
+        temperatures = generator.uniform(*self.temperature_range, number_of_points)
+
+        exact = calculate_activity_coefficients_array(
+            temperature=temperatures,
+            mixture=self.mixture,
+            first_component_fraction=fractions,
+            calculation_type=self.calculation_type,
+        )
+        return float(
+            numpy.abs(self.gamma(fractions, temperatures) / exact - 1).max()
+        )
+
+    def to_molar_fraction(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        composition_type: str,
+    ) -> typing.Union[float, numpy.ndarray]:
+        """
+        Converts fraction(s) of the first component to molar fraction(s)
+        :param first_component_fraction: fraction(s) of the first component
+        :param composition_type: type of the given fraction(s)
+        :return: molar fraction(s) of the first component
+        """
+        return self.kernel.to_molar_fraction(first_component_fraction, composition_type)
+
+    def gamma(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of activity coefficients of both components,
+        the exact kernel is used outside the tabulated temperature range
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: activity coefficients as an array of shape (..., 2)
+        """
+        x, temperature = numpy.broadcast_arrays(
+            numpy.asarray(first_component_fraction, dtype=float),
+            numpy.asarray(temperature, dtype=float),
+        )
+        inside = (temperature >= self._temperature_nodes[0]) & (
+            temperature <= self._temperature_nodes[-1]
+        )
+
+        i = numpy.take(
+            self._fraction_lookup,
+            _cells(x, self.fractions, self.lookup_resolution[0]),
+        )
+        j = numpy.take(
+            self._temperature_lookup,
+            _cells(temperature, self.temperatures, self.lookup_resolution[1]),
+        )
+        u = (x - numpy.take(self.fractions, i)) * numpy.take(self._fraction_scales, i)
+        v = (temperature - numpy.take(self.temperatures, j)) * numpy.take(
+            self._temperature_scales, j
+        )
+        cell = i * (len(self.temperatures) - 1) + j
+
+        result = numpy.empty(x.shape + (2,))
+        for component, coefficients in enumerate(self._cell_coefficients):
+            c0, cu, cv, cuv = (numpy.take(c, cell) for c in coefficients)
+            result[..., component] = c0 + u * cu + v * (cv + u * cuv)
+        numpy.exp(result, out=result)
+
+        if not inside.all():
+            result[~inside] = self.kernel.gamma(x[~inside], temperature[~inside])
+
+        return result
+
+    def psat(self, temperature: typing.Union[float, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculation of saturated pressures of both components in kPa
+        :param temperature: temperature(s) in K
+        :return: saturated pressures as an array of shape (..., 2)
+        """
+        return self.kernel.psat(temperature)
+
+    def partial_pressures(
+        self,
+        first_component_fraction: typing.Union[float, numpy.ndarray],
+        temperature: typing.Union[float, numpy.ndarray],
+    ) -> numpy.ndarray:
+        """
+        Calculation of partial pressures of both components in kPa
+        :param first_component_fraction: molar fraction(s) of the first component
+        :param temperature: temperature(s) in K, broadcastable with the fractions
+        :return: partial pressures as an array of shape (..., 2)
+        """
+        first_component_fraction = numpy.asarray(first_component_fraction, dtype=float)
+        fractions = numpy.stack(
+            (first_component_fraction, 1 - first_component_fraction), axis=-1
+        )
+        return (
+            self.psat(temperature)
+            * self.gamma(first_component_fraction, temperature)
+            * fractions
+        )
+
+    def get_partial_pressures(
+        self, temperature: float, composition: Composition
+    ) -> typing.Tuple[float, float]:
+        """
+        Calculation of partial pressures of both test_components at a single point
+        :param temperature: temperature in K
+        :param composition: specified composition in mol or weight %
+        :return: Partial pressures as a tuple, test_components wise in kPa
+        """
+        temperatures = self._temperature_nodes
+        if not temperatures[0] <= temperature <= temperatures[-1]:
+            return self.kernel.get_partial_pressures(temperature, composition)
+
+        x = self.kernel.to_molar_fraction(composition.p, composition.type)
+        fractions = self._fraction_nodes
+
+        i = self._fraction_lookup_list[
+            min(int(x * self.lookup_resolution[0]), self.lookup_resolution[0] - 1)
+        ]
+        j = self._temperature_lookup_list[
+            min(
+                int(
+                    (temperature - temperatures[0])
+                    / (temperatures[-1] - temperatures[0])
+                    * self.lookup_resolution[1]
+                ),
+                self.lookup_resolution[1] - 1,
+            )
+        ]
+        u = (x - fractions[i]) / (fractions[i + 1] - fractions[i])
+        v = (temperature - temperatures[j]) / (temperatures[j + 1] - temperatures[j])
+
+        f_00 = self._table[i][j]
+        f_01 = self._table[i][j + 1]
+        f_10 = self._table[i + 1][j]
+        f_11 = self._table[i + 1][j + 1]
+        w_00 = (1 - u) * (1 - v)
+        w_01 = (1 - u) * v
+        w_10 = u * (1 - v)
+        w_11 = u * v
+
+        return (
+            self.kernel.vapour_pressure(0, temperature)
+            * numpy.exp(
+                w_00 * f_00[0] + w_01 * f_01[0] + w_10 * f_10[0] + w_11 * f_11[0]
+            )
+            * x,
+            self.kernel.vapour_pressure(1, temperature)
+            * numpy.exp(
+                w_00 * f_00[1] + w_01 * f_01[1] + w_10 * f_10[1] + w_11 * f_11[1]
+            )
+            * (1 - x),
+        )
+
+
+def _ln_activity_coefficients(
+    kernel: ThermodynamicKernel, fractions: numpy.ndarray, temperatures: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    :return: logarithms of activity coefficients on a grid of shape (fractions, temperatures, 2)
+    """
+    return numpy.stack(
+        kernel.activity_model.ln_activity_coefficients(
+            fractions[:, None], temperatures[None, :]
+        ),
+        axis=-1,
+    )
+
+
+def _interval_lookup(nodes: numpy.ndarray, number_of_cells: int) -> numpy.ndarray:
+    """
+    :return: index of the interval of nodes containing the center of each cell of a uniform grid
+    """
+    centers = nodes[0] + (numpy.arange(number_of_cells) + 0.5) * (
+        nodes[-1] - nodes[0]
+    ) / number_of_cells
+    return numpy.searchsorted(nodes, centers, side="right") - 1
+
+
+def _is_aligned(nodes: numpy.ndarray, number_of_cells: int) -> bool:
+    """
+    :return: True if the nodes are increasing and each node is a boundary of a cell of a uniform grid
+    """
+    if len(nodes) < 2 or numpy.any(numpy.diff(nodes) <= 0):
+        return False
+    positions = (nodes - nodes[0]) / (nodes[-1] - nodes[0]) * number_of_cells
+    return bool(numpy.allclose(positions, numpy.round(positions), rtol=0, atol=1e-6))
+
+
+def _cells(
+    values: numpy.ndarray, nodes: numpy.ndarray, number_of_cells: int
+) -> numpy.ndarray:
+    """
+    :return: index of the cell of a uniform grid containing each value
+    """
+    cells = ((values - nodes[0]) / (nodes[-1] - nodes[0]) * number_of_cells).astype(int)
+    return numpy.clip(cells, 0, number_of_cells - 1)
+
+
+def _split_intervals(nodes: numpy.ndarray, split: numpy.ndarray) -> numpy.ndarray:
+    """
+    :return: nodes with midpoints of the selected intervals inserted
+    """
+    return numpy.sort(
+        numpy.concatenate((nodes, ((nodes[:-1] + nodes[1:]) / 2)[split]))
+    )
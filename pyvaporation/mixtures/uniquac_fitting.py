@@ -1,14 +1,31 @@
+import hashlib
+import itertools
+import os
+import time
 import typing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
 import attr
 import numpy
 import pandas
 from pathlib import Path
 
 
-from ..utils import UNIQUACParameters
+from ..utils import NRTLParameters, UNIQUACParameters
 from ..components import Component, Components
-from .mixture import get_partial_pressures, Composition, Mixture
+from .fit_cache import VLEFitCache
+from .mixture import (
+    ActivityCoefficientModel,
+    Composition,
+    CompositionArray,
+    CompositionType,
+    Mixture,
+    NRTLModel,
+    UNIQUACModel,
+    get_activity_coefficient_model_type,
+)
 from scipy import optimize
+from scipy.stats import qmc
 
 VLE_COLUMNS = [
     'first_component',
@@ -20,6 +37,17 @@ VLE_COLUMNS = [
     'temperature',
     'reference']
 
+VLE_DTYPES = {
+    'first_component': str,
+    'second_component': str,
+    'composition': numpy.float64,
+    'composition_type': str,
+    'first_component_pressure': numpy.float64,
+    'second_component_pressure': numpy.float64,
+    'temperature': numpy.float64,
+    'reference': str,
+}
+
 FITTING_ALGS = [
         "Nelder-Mead",
         "Powell",
@@ -31,6 +59,34 @@ FITTING_ALGS = [
         "SLSQP",
         "trust-constr"]
 
+LEAST_SQUARES = "least_squares"
+
+INITIAL_PARAMETERS = {
+    ActivityCoefficientModel.UNIQUAC: (0, 0, 0, 0, 10),
+    ActivityCoefficientModel.NRTL: (0, 0, 0.3, 0, 0),
+}
+
+# ranges of the continuous parameters for the starting points of multi-start fits:
+# alpha_12, alpha_21, beta_12 and beta_21 for UNIQUAC, g12, g21, alpha12, a12 and a21 for NRTL
+MULTISTART_BOUNDS = {
+    ActivityCoefficientModel.UNIQUAC: (
+        (-2000, 2000), (-2000, 2000), (-5e5, 5e5), (-5e5, 5e5)
+    ),
+    ActivityCoefficientModel.NRTL: (
+        (-5000, 15000), (-5000, 15000), (0.1, 0.7), (-5, 5), (-5, 5)
+    ),
+}
+
+# limits of the continuous parameters in least squares fits, fits reaching them are considered failed
+PARAMETER_LIMITS = {
+    ActivityCoefficientModel.UNIQUAC: (
+        (-1e5, 1e5), (-1e5, 1e5), (-1e8, 1e8), (-1e8, 1e8)
+    ),
+    ActivityCoefficientModel.NRTL: (
+        (-1e5, 1e5), (-1e5, 1e5), (-2, 2), (-100, 100), (-100, 100)
+    ),
+}
+
 
 @attr.s(auto_attribs=True)
 class VLEPoint:
@@ -59,107 +115,1056 @@ class VLEPoint:
         )
 
 
-@attr.s(auto_attribs=True)
+def _to_molar_fractions(
+    compositions: CompositionArray, components: typing.Sequence[Component]
+) -> numpy.ndarray:
+    """
+    :return: molar fractions of the first component
+    """
+    if compositions.type == CompositionType.molar:
+        return compositions.p
+    first = compositions.p / components[0].molecular_weight
+    return first / (first + (1 - compositions.p) / components[1].molecular_weight)
+
+
+def _pack_compositions(
+    fractions: numpy.ndarray,
+    types: typing.Sequence[str],
+    components: typing.Sequence[Component],
+) -> CompositionArray:
+    """
+    Packs fractions of the first component into a CompositionArray,
+    fractions of different types are converted to molar ones
+    """
+    types = numpy.asarray(types, dtype=object)
+    unique_types = set(types.tolist())
+    if not unique_types <= {CompositionType.molar, CompositionType.weight}:
+        raise ValueError("Unknown composition types: %s" % sorted(map(str, unique_types)))
+    if len(unique_types) == 1:
+        return CompositionArray(p=fractions, type=unique_types.pop())
+
+    is_weight = types == CompositionType.weight
+    fractions = numpy.array(fractions, dtype=float)
+    fractions[is_weight] = _to_molar_fractions(
+        CompositionArray(p=fractions[is_weight], type=CompositionType.weight),
+        components,
+    )
+    return CompositionArray(p=fractions, type=CompositionType.molar)
+
+
+def _get_component(name: str) -> Component:
+    component = getattr(Components, name, None)
+    if not isinstance(component, Component):
+        raise ValueError("Unknown component: %s" % name)
+    return component
+
+
+@attr.s(auto_attribs=True, eq=False, init=False)
 class VLEPoints:
     """
-        Class to represent experimental VLE points
+        Class to represent experimental VLE points,
+        compositions, partial pressures and temperatures of all the points are stored as arrays,
+        indexing yields VLEPoint objects
     """
     components: typing.List[Component]
-    data: typing.List[VLEPoint]
+    compositions: CompositionArray
+    pressures: numpy.ndarray
+    temperatures: numpy.ndarray
+
+    def __init__(
+        self,
+        components: typing.List[Component],
+        compositions: typing.Optional[CompositionArray] = None,
+        pressures: typing.Optional[numpy.ndarray] = None,
+        temperatures: typing.Optional[numpy.ndarray] = None,
+        data: typing.Optional[typing.Sequence[VLEPoint]] = None,
+    ) -> None:
+        """
+        :param components: components of the mixture
+        :param compositions: compositions of the points
+        :param pressures: partial pressures of the components at the points, kPa, of the shape (n, 2)
+        :param temperatures: temperatures of the points, K
+        :param data: list of VLEPoint objects, which is packed into the arrays as in from_points,
+        could be stated instead of the arrays, also as the second positional argument
+        """
+        if data is None and compositions is not None and not isinstance(
+            compositions, CompositionArray
+        ):
+            data, compositions = compositions, None
+        if data is not None:
+            if compositions is not None or pressures is not None or temperatures is not None:
+                raise ValueError("Either VLEPoint objects or arrays could be stated not both")
+            packed = self.from_points(components, data)
+            compositions, pressures, temperatures = (
+                packed.compositions,
+                packed.pressures,
+                packed.temperatures,
+            )
+        if compositions is None or pressures is None or temperatures is None:
+            raise ValueError("Compositions, pressures and temperatures should be stated")
+
+        self.components = components
+        self.compositions = compositions
+        self.pressures = numpy.asarray(pressures, dtype=float).reshape(-1, 2)
+        self.temperatures = numpy.asarray(temperatures, dtype=float).reshape(-1)
+        if not len(self.compositions) == len(self.pressures) == len(self.temperatures):
+            raise ValueError("Numbers of compositions, pressures and temperatures should be equal")
+
+    @classmethod
+    def from_points(
+        cls, components: typing.List[Component], data: typing.Sequence[VLEPoint]
+    ) -> "VLEPoints":
+        """
+        Packs VLEPoint objects into arrays
+        :param components: components of the mixture
+        :param data: list of VLEPoint objects
+        :return: VLEPoints object
+        """
+        return cls(
+            components=components,
+            compositions=_pack_compositions(
+                numpy.array([point.composition.p for point in data], dtype=float),
+                [point.composition.type for point in data],
+                components,
+            ),
+            pressures=[point.pressures for point in data],
+            temperatures=[point.temperature for point in data],
+        )
 
     @classmethod
     def from_csv(cls, path: typing.Union[str, Path]) -> "VLEPoints":
         """
-        Generates VLEPOINTS object from the .csv file
+        Generates VLEPOINTS object from the .csv file,
+        blank components and composition types are the same as in the previous row
         :param path: Path to the file
         :return: VLEPoints object with data described in a .csv file
         """
-        frame = pandas.read_csv(path)
+        frame = pandas.read_csv(path, dtype=VLE_DTYPES)
 
         if list(frame.columns) != VLE_COLUMNS:
             raise ValueError("Incorrect columns: %s" % list(frame.columns))
 
-        points = []
+        names = frame[
+            ["first_component", "second_component", "composition_type"]
+        ].ffill()
+        if (
+            names["first_component"].nunique() != 1
+            or names["second_component"].nunique() != 1
+        ):
+            raise ValueError("All the points should have the same components")
+
+        components = [
+            _get_component(names["first_component"].iloc[0]),
+            _get_component(names["second_component"].iloc[0]),
+        ]
 
-        d = frame.iloc[0].to_dict()
-        components = [getattr(Components, d["first_component"]),
-                      getattr(Components, d["second_component"])]
+        return cls(
+            components=components,
+            compositions=_pack_compositions(
+                frame["composition"].to_numpy(dtype=float),
+                names["composition_type"].to_numpy(dtype=object),
+                components,
+            ),
+            pressures=frame[
+                ["first_component_pressure", "second_component_pressure"]
+            ].to_numpy(dtype=float),
+            temperatures=frame["temperature"].to_numpy(dtype=float),
+        )
 
-        for _, row in frame.iterrows():
-            d = row.to_dict()
-            points.append(VLEPoint.from_dict(d))
+    def digest(self) -> str:
+        """
+        :return: hexadecimal SHA-256 digest of the components and arrays of the points
+        """
+        digest = hashlib.sha256()
+        for text in (
+            self.components[0].name,
+            self.components[1].name,
+            self.compositions.type,
+        ):
+            digest.update(text.encode())
+            digest.update(b"\0")
+        for array in (self.compositions.p, self.pressures, self.temperatures):
+            digest.update(numpy.ascontiguousarray(array, dtype="<f8").tobytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
 
-        return VLEPoints(components=components, data=points)
+    @property
+    def data(self) -> typing.List[VLEPoint]:
+        """
+        Returns the points as a list of VLEPoint objects
+        """
+        return [self[i] for i in range(len(self))]
 
     def __len__(self):
-        return len(self.data)
+        return len(self.temperatures)
 
-    def __getitem__(self, item: int) -> VLEPoint:
-        return self.data[item]
+    def __iter__(self) -> typing.Iterator[VLEPoint]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(
+        self, item: typing.Union[int, slice]
+    ) -> typing.Union[VLEPoint, typing.List[VLEPoint]]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(len(self))[item]]
+        return VLEPoint(
+            composition=self.compositions[item],
+            pressures=tuple(self.pressures[item].tolist()),
+            temperature=float(self.temperatures[item]),
+        )
 
     def __add__(self, other):
         if self.components != other.components:
             raise ValueError("Both sets should have same components and indexes")
 
-        return VLEPoints(components=self.components, data=self.data + other.data)
+        if self.compositions.type == other.compositions.type:
+            compositions = CompositionArray(
+                p=numpy.concatenate((self.compositions.p, other.compositions.p)),
+                type=self.compositions.type,
+            )
+        else:
+            compositions = CompositionArray(
+                p=numpy.concatenate(
+                    (
+                        _to_molar_fractions(self.compositions, self.components),
+                        _to_molar_fractions(other.compositions, other.components),
+                    )
+                ),
+                type=CompositionType.molar,
+            )
+
+        return VLEPoints(
+            components=self.components,
+            compositions=compositions,
+            pressures=numpy.concatenate((self.pressures, other.pressures)),
+            temperatures=numpy.concatenate((self.temperatures, other.temperatures)),
+        )
+
+
+@attr.s(auto_attribs=True)
+class VLEObjective:
+    """
+    Vectorized objective function of the UNIQUAC or NRTL parameters fit.
+    Experimental points are converted to arrays and saturated pressures are calculated once,
+    each evaluation updates preallocated UNIQUACParameters or NRTLParameters object in place
+    and calculates partial pressures of all the points in a single call.
+    Parameters are represented as arrays of alpha_12, alpha_21, beta_12, beta_21 and z for UNIQUAC
+    and of g12, g21, alpha12, a12 and a21 for NRTL
+    """
+
+    mixture: Mixture
+    calculation_type: str
+    model: typing.Union[UNIQUACModel, NRTLModel]
+    first_component_fractions: numpy.ndarray
+    temperatures: numpy.ndarray
+    saturated_pressures: numpy.ndarray
+    pressures: numpy.ndarray
+
+    @classmethod
+    def from_points(
+        cls,
+        data: VLEPoints,
+        calculation_type: str = ActivityCoefficientModel.UNIQUAC,
+    ) -> "VLEObjective":
+        """
+        Creates the objective function for the experimental data
+        :param data: Experimental data represented as a VLEPoints object
+        :param calculation_type: Thermodynamic model, which parameters are fitted
+        :return: VLEObjective object
+        """
+        if calculation_type == ActivityCoefficientModel.UNIQUAC:
+            mixture = Mixture(
+                name="",
+                first_component=data.components[0],
+                second_component=data.components[1],
+                uniquac_params=UNIQUACParameters(
+                    alpha_12=0, alpha_21=0, beta_12=0, beta_21=0
+                ),
+            )
+            model = UNIQUACModel.from_mixture(mixture)
+        elif calculation_type == ActivityCoefficientModel.NRTL:
+            mixture = Mixture(
+                name="",
+                first_component=data.components[0],
+                second_component=data.components[1],
+                nrtl_params=NRTLParameters(g12=0, g21=0, alpha12=0.3),
+            )
+            model = NRTLModel.from_mixture(mixture)
+        else:
+            raise ValueError("Type of calculation not supported")
+        return cls(
+            mixture=mixture,
+            calculation_type=calculation_type,
+            model=model,
+            first_component_fractions=_to_molar_fractions(
+                data.compositions, data.components
+            ),
+            temperatures=data.temperatures,
+            saturated_pressures=numpy.stack(
+                (
+                    mixture.first_component.get_vapor_pressure(data.temperatures),
+                    mixture.second_component.get_vapor_pressure(data.temperatures),
+                ),
+                axis=-1,
+            ),
+            pressures=data.pressures,
+        )
+
+    def _set_parameters(
+        self, params: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> None:
+        assert len(params) == 5
+        if self.calculation_type == ActivityCoefficientModel.NRTL:
+            parameters = self.mixture.nrtl_params
+            parameters.g12 = params[0]
+            parameters.g21 = params[1]
+            parameters.alpha12 = params[2]
+            parameters.a12 = params[3]
+            parameters.a21 = params[4]
+            self.model = NRTLModel.from_mixture(self.mixture)
+            return
+
+        parameters = self.mixture.uniquac_params
+        parameters.alpha_12 = params[0]
+        parameters.alpha_21 = params[1]
+        parameters.beta_12 = params[2]
+        parameters.beta_21 = params[3]
+
+        # only composition independent terms of the model depend on the coordination number
+        z = int(params[4])
+        if z != parameters.z:
+            parameters.z = z
+            self.model = UNIQUACModel.from_mixture(self.mixture)
+
+    def _partial_pressures(
+        self, ln_activity_coefficients: typing.Tuple[numpy.ndarray, numpy.ndarray]
+    ) -> numpy.ndarray:
+        return numpy.stack(
+            (
+                self.saturated_pressures[:, 0]
+                * numpy.exp(ln_activity_coefficients[0])
+                * self.first_component_fractions,
+                self.saturated_pressures[:, 1]
+                * numpy.exp(ln_activity_coefficients[1])
+                * (1 - self.first_component_fractions),
+            ),
+            axis=-1,
+        )
+
+    def to_parameters(
+        self, params: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> typing.Union[UNIQUACParameters, NRTLParameters]:
+        """
+        :param params: UNIQUAC or NRTL parameters represented as a list
+        :return: UNIQUACParameters or NRTLParameters object
+        """
+        if self.calculation_type == ActivityCoefficientModel.NRTL:
+            return NRTLParameters.from_array(params)
+        return UNIQUACParameters.from_array(params)
+
+    def to_array(
+        self, parameters: typing.Union[UNIQUACParameters, NRTLParameters]
+    ) -> numpy.ndarray:
+        """
+        :param parameters: UNIQUACParameters or NRTLParameters object
+        :return: parameters represented as an array
+        """
+        if self.calculation_type == ActivityCoefficientModel.NRTL:
+            return numpy.array(
+                [
+                    parameters.g12,
+                    parameters.g21,
+                    parameters.alpha12,
+                    parameters.a12,
+                    parameters.a21,
+                ],
+                dtype=float,
+            )
+        return numpy.array(
+            [
+                parameters.alpha_12,
+                parameters.alpha_21,
+                parameters.beta_12,
+                parameters.beta_21,
+                parameters.z,
+            ],
+            dtype=float,
+        )
+
+    def subset(self, indices: numpy.ndarray) -> "VLEObjective":
+        """
+        :param indices: indices of the experimental points, may be repeated
+        :return: objective function of the selected points sharing no parameters with this one
+        """
+        return VLEObjective(
+            mixture=attr.evolve(
+                self.mixture,
+                nrtl_params=None
+                if self.mixture.nrtl_params is None
+                else attr.evolve(self.mixture.nrtl_params),
+                uniquac_params=None
+                if self.mixture.uniquac_params is None
+                else attr.evolve(self.mixture.uniquac_params),
+            ),
+            calculation_type=self.calculation_type,
+            model=self.model,
+            first_component_fractions=self.first_component_fractions[indices],
+            temperatures=self.temperatures[indices],
+            saturated_pressures=self.saturated_pressures[indices],
+            pressures=self.pressures[indices],
+        )
+
+    def residuals(
+        self, params: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        :param params: UNIQUAC or NRTL parameters represented as a list
+        :return: deviations of calculated partial pressures from the experimental ones in kPa,
+        array of shape (2 * number of points,), components of each point are adjacent
+        """
+        self._set_parameters(params)
+        return (
+            self._partial_pressures(
+                self.model.ln_activity_coefficients(
+                    self.first_component_fractions, self.temperatures
+                )
+            )
+            - self.pressures
+        ).ravel()
+
+    def jacobian(
+        self, params: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        :param params: UNIQUAC or NRTL parameters represented as a list
+        :return: analytic derivatives of the residuals by the continuous parameters,
+        alpha_12, alpha_21, beta_12 and beta_21 for UNIQUAC or all the parameters for NRTL,
+        array of shape (2 * number of points, 4) or (2 * number of points, 5)
+        """
+        self._set_parameters(params)
+        ln_activity_coefficients, derivatives = (
+            self.model.ln_activity_coefficients_parameters_derivatives(
+                self.first_component_fractions, self.temperatures
+            )
+        )
+        partial_pressures = self._partial_pressures(ln_activity_coefficients)
+        # d(p_i)/d(param) = p_i * d(ln(gamma_i))/d(param)
+        return numpy.stack(
+            (
+                partial_pressures[:, 0, None] * derivatives[0],
+                partial_pressures[:, 1, None] * derivatives[1],
+            ),
+            axis=1,
+        ).reshape(-1, derivatives[0].shape[-1])
+
+    def __call__(self, params: typing.Union[typing.List[float], numpy.ndarray]) -> float:
+        """
+        :param params: UNIQUAC or NRTL parameters represented as a list
+        :return: root mean squared error of partial pressures as float
+        """
+        residuals = self.residuals(params)
+        return numpy.sqrt((residuals**2).sum() / len(self.temperatures))
+
+
+@attr.s(auto_attribs=True)
+class FittingReport:
+    """
+    Class to represent the result of a single optimization algorithm in the UNIQUAC or NRTL parameters fit
+    """
+    method: str
+    params: numpy.ndarray
+    error: float
+    nfev: int
+    time: float
+    success: bool
+    message: str
+
+
+@attr.s(auto_attribs=True)
+class VLEFit:
+    """
+    Class to represent the best UNIQUAC or NRTL parameters fit along with reports of all the algorithms tried,
+    distinct local minima found by a multi-start fit are listed in solutions from the best one
+    """
+    parameters: typing.Union[UNIQUACParameters, NRTLParameters]
+    error: float
+    reports: typing.List[FittingReport]
+    solutions: typing.List[FittingReport] = attr.Factory(list)
+
+
+class _TimeLimitExceeded(Exception):
+    pass
+
+
+def _run_fitting_algorithm(
+    vle_objective: VLEObjective,
+    method: str,
+    x0: numpy.ndarray,
+    time_limit: typing.Optional[float],
+) -> FittingReport:
+    """
+    Minimizes the objective with a single algorithm,
+    if the time limit is exceeded the best point evaluated so far is reported
+    """
+    start = time.perf_counter()
+    nfev = 0
+    best = (numpy.inf, x0)
+
+    def budgeted_objective(params: numpy.ndarray) -> float:
+        nonlocal nfev, best
+        if time_limit is not None and time.perf_counter() - start > time_limit:
+            raise _TimeLimitExceeded
+        nfev += 1
+        value = vle_objective(params)
+        if value < best[0]:
+            best = (value, numpy.array(params, dtype=float))
+        return value
+
+    try:
+        result = optimize.minimize(budgeted_objective, x0=x0, method=method)
+        params, success, message = result.x, bool(result.success), str(result.message)
+    except _TimeLimitExceeded:
+        params, success, message = best[1], False, "Time limit exceeded"
+
+    error = vle_objective(params)
+    return FittingReport(
+        method=method,
+        params=params,
+        error=error if numpy.isfinite(error) else numpy.inf,
+        nfev=nfev,
+        time=time.perf_counter() - start,
+        success=success,
+        message=message,
+    )
+
+
+def fit_vle_parallel(
+    data: VLEPoints,
+    methods: typing.Optional[typing.Sequence[str]] = None,
+    n_jobs: typing.Optional[int] = None,
+    time_limit: typing.Optional[float] = None,
+    calculation_type: str = ActivityCoefficientModel.UNIQUAC,
+) -> VLEFit:
+    """
+    Get the UNIQUAC or NRTL parameters to fit the VLE of a given mixture,
+    optimization algorithms are run concurrently in a pool of processes and the most accurate fit is chosen
+    :param data: Experimental data represented as a VLEPoints object
+    :param methods: Optimization method strings, if left None all the FITTING_ALGS are tried
+    :param n_jobs: number of worker processes, by default one per algorithm up to the number of CPUs,
+    if 1 the algorithms are run one after another in the current process
+    :param time_limit: wall-clock time budget of each algorithm in seconds,
+    when exceeded the best parameters evaluated by the algorithm are used
+    :param calculation_type: Thermodynamic model, which parameters are fitted
+    :return: VLEFit object with the best fitted parameters and reports of all the algorithms
+    """
+    methods = list(FITTING_ALGS if methods is None else methods)
+    if len(methods) == 0:
+        raise ValueError("At least one optimization method should be specified")
+    if n_jobs is None:
+        n_jobs = min(len(methods), os.cpu_count() or 1)
+    if n_jobs < 1:
+        raise ValueError("Number of jobs should be positive")
+
+    vle_objective = VLEObjective.from_points(data, calculation_type)
+    x0 = numpy.array(INITIAL_PARAMETERS[calculation_type], dtype=float)
+
+    if n_jobs == 1:
+        reports = [
+            _run_fitting_algorithm(vle_objective, method, x0, time_limit)
+            for method in methods
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            reports = list(
+                executor.map(
+                    _run_fitting_algorithm,
+                    [vle_objective] * len(methods),
+                    methods,
+                    [x0] * len(methods),
+                    [time_limit] * len(methods),
+                )
+            )
+
+    best_report = min(reports, key=lambda report: report.error)
+    return VLEFit(
+        parameters=vle_objective.to_parameters(best_report.params),
+        error=best_report.error,
+        reports=reports,
+    )
+
+
+def _run_least_squares(
+    vle_objective: VLEObjective,
+    x0: numpy.ndarray,
+    fixed: typing.Sequence[float] = (),
+) -> FittingReport:
+    """
+    Minimizes squared residuals of the objective by the continuous parameters starting from x0
+    within PARAMETER_LIMITS, the fixed parameters (the coordination number of UNIQUAC) are appended to them
+    """
+    start = time.perf_counter()
+    nfev = 0
+    lower, upper = numpy.array(PARAMETER_LIMITS[vle_objective.calculation_type]).T
+    x0 = numpy.clip(numpy.asarray(x0, dtype=float), lower, upper)
+
+    def residuals(params: numpy.ndarray) -> numpy.ndarray:
+        nonlocal nfev
+        nfev += 1
+        return vle_objective.residuals([*params, *fixed])
+
+    try:
+        result = optimize.least_squares(
+            residuals,
+            x0=x0,
+            jac=lambda params: vle_objective.jacobian([*params, *fixed]),
+            bounds=(lower, upper),
+            method="trf",
+            x_scale="jac",
+        )
+    except ValueError as error:
+        # residuals or the jacobian are not finite, e.g. activity coefficients overflow
+        return FittingReport(
+            method=LEAST_SQUARES,
+            params=numpy.append(x0, fixed),
+            error=numpy.inf,
+            nfev=nfev,
+            time=time.perf_counter() - start,
+            success=False,
+            message=str(error),
+        )
+
+    params = numpy.append(result.x, fixed)
+    error = vle_objective(params)
+    message = str(result.message)
+    # parameters running away to the limits are a degenerate fit, which is not chosen as the best one
+    if not ((result.x > lower) & (result.x < upper)).all():
+        error = numpy.inf
+        message = "Parameters reached the limits of the fit"
+    return FittingReport(
+        method=LEAST_SQUARES,
+        params=params,
+        error=error if numpy.isfinite(error) else numpy.inf,
+        nfev=nfev,
+        time=time.perf_counter() - start,
+        success=bool(result.success) and numpy.isfinite(error),
+        message=message,
+    )
+
+
+def fit_vle_least_squares(
+    data: VLEPoints,
+    z_values: typing.Iterable[int] = range(1, 21),
+    x0: typing.Optional[typing.Sequence[float]] = None,
+    calculation_type: str = ActivityCoefficientModel.UNIQUAC,
+) -> VLEFit:
+    """
+    Get the UNIQUAC or NRTL parameters to fit the VLE of a given mixture by minimizing squared deviations
+    of partial pressures of each point with a trust region method using the analytic jacobian.
+    The coordination number of UNIQUAC is discrete, so it is not included in the continuous optimization,
+    instead the fit is conducted for each of the given values and the most accurate one is chosen
+    :param data: Experimental data represented as a VLEPoints object
+    :param z_values: coordination numbers to try, not used for NRTL
+    :param x0: initial continuous parameters, alpha_12, alpha_21, beta_12 and beta_21 for UNIQUAC
+    or g12, g21, alpha12, a12 and a21 for NRTL, the fit of each coordination number is started from x0
+    and, in addition, from the best fit of the previous coordination numbers, the better one is reported
+    :param calculation_type: Thermodynamic model, which parameters are fitted
+    :return: VLEFit object with the best fitted parameters and reports of all the coordination numbers
+    """
+    vle_objective = VLEObjective.from_points(data, calculation_type)
+    if calculation_type == ActivityCoefficientModel.NRTL:
+        fixed_values = [()]
+        size = 5
+    else:
+        fixed_values = [(int(z),) for z in z_values]
+        size = 4
+    if len(fixed_values) == 0:
+        raise ValueError("At least one coordination number should be specified")
+
+    if x0 is None:
+        x0 = INITIAL_PARAMETERS[calculation_type][:size]
+    x0 = numpy.array(x0, dtype=float)
+
+    reports = []
+    for fixed in fixed_values:
+        report = _run_least_squares(vle_objective, x0, fixed)
+        if reports:
+            best_report = min(reports, key=lambda report: report.error)
+            if numpy.isfinite(best_report.error):
+                warm_report = _run_least_squares(
+                    vle_objective, best_report.params[:size], fixed
+                )
+                if warm_report.error < report.error:
+                    report = warm_report
+        reports.append(report)
+
+    best_report = min(reports, key=lambda report: report.error)
+    return VLEFit(
+        parameters=vle_objective.to_parameters(best_report.params),
+        error=best_report.error,
+        reports=reports,
+    )
+
+
+def _is_same_solution(
+    report: FittingReport, other: FittingReport, tolerance: float, size: int
+) -> bool:
+    return numpy.array_equal(report.params[size:], other.params[size:]) and abs(
+        report.error - other.error
+    ) <= tolerance * min(report.error, other.error)
+
+
+def fit_vle_multistart(
+    data: VLEPoints,
+    n_starts: int = 64,
+    bounds: typing.Optional[typing.Sequence[typing.Tuple[float, float]]] = None,
+    z_values: typing.Sequence[int] = (10,),
+    n_jobs: typing.Optional[int] = None,
+    n_agree: int = 3,
+    tolerance: float = 1e-6,
+    seed: typing.Optional[int] = None,
+    calculation_type: str = ActivityCoefficientModel.UNIQUAC,
+) -> VLEFit:
+    """
+    Get the UNIQUAC or NRTL parameters to fit the VLE of a given mixture with local least squares fits
+    started from Latin hypercube samples of the parameters, which are run concurrently in a pool of processes.
+    Fits converged to the same error (and coordination number) are considered the same local minimum,
+    the search is stopped once the best minimum is found by n_agree starts,
+    no more than n_jobs fits are submitted to the pool at a time
+    :param data: Experimental data represented as a VLEPoints object
+    :param n_starts: maximum number of starting points
+    :param bounds: ranges of the continuous parameters to sample the starting points from,
+    by default MULTISTART_BOUNDS of the model are used
+    :param z_values: coordination numbers to sample the starting points from, not used for NRTL
+    :param n_jobs: number of worker processes, by default the number of CPUs,
+    if 1 the fits are run one after another in the current process
+    :param n_agree: number of starts converged to the best minimum to stop the search
+    :param tolerance: relative tolerance of errors of the same minimum
+    :param seed: seed of the random generator of the starting points
+    :param calculation_type: Thermodynamic model, which parameters are fitted
+    :return: VLEFit object with the best fitted parameters, reports of the completed starts
+    and the distinct local minima
+    """
+    vle_objective = VLEObjective.from_points(data, calculation_type)
+    size = 5 if calculation_type == ActivityCoefficientModel.NRTL else 4
+    if bounds is None:
+        bounds = MULTISTART_BOUNDS[calculation_type]
+    if len(bounds) != size:
+        raise ValueError("Bounds of all the continuous parameters should be specified")
+    if n_starts < 1 or n_agree < 1 or len(z_values) == 0:
+        raise ValueError("At least one starting point should be specified")
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("Number of jobs should be positive")
+
+    samples = qmc.LatinHypercube(d=5, seed=seed).random(n_starts)
+    lower, upper = numpy.array(bounds, dtype=float).T
+    starts = lower + samples[:, :size] * (upper - lower)
+    if calculation_type == ActivityCoefficientModel.NRTL:
+        fixed_values = [()] * n_starts
+    else:
+        fixed_values = [
+            (int(z_values[int(sample * len(z_values))]),) for sample in samples[:, 4]
+        ]
+
+    reports = []
+
+    def is_found() -> bool:
+        best_report = min(reports, key=lambda report: report.error)
+        return (
+            sum(
+                _is_same_solution(report, best_report, tolerance, size)
+                for report in reports
+            )
+            >= n_agree
+        )
+
+    if n_jobs == 1:
+        for x0, fixed in zip(starts, fixed_values):
+            reports.append(_run_least_squares(vle_objective, x0, fixed))
+            if is_found():
+                break
+    else:
+        # at most n_jobs fits are submitted at a time, so that no new fits are started,
+        # once the best minimum is found, and the fits still running are not waited for
+        executor = ProcessPoolExecutor(max_workers=n_jobs)
+        pending_starts = iter(zip(starts, fixed_values))
+        running = set()
+        try:
+            for x0, fixed in itertools.islice(pending_starts, n_jobs):
+                running.add(executor.submit(_run_least_squares, vle_objective, x0, fixed))
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    reports.append(future.result())
+                if is_found():
+                    break
+                for x0, fixed in itertools.islice(pending_starts, len(done)):
+                    running.add(
+                        executor.submit(_run_least_squares, vle_objective, x0, fixed)
+                    )
+        finally:
+            executor.shutdown(wait=not running)
+
+    solutions = []
+    for report in sorted(reports, key=lambda report: report.error):
+        if numpy.isfinite(report.error) and not any(
+            _is_same_solution(report, solution, tolerance, size)
+            for solution in solutions
+        ):
+            solutions.append(report)
+
+    best_report = min(reports, key=lambda report: report.error)
+    return VLEFit(
+        parameters=vle_objective.to_parameters(best_report.params),
+        error=best_report.error,
+        reports=reports,
+        solutions=solutions,
+    )
+
+
+@attr.s(auto_attribs=True)
+class VLEBootstrap:
+    """
+    Class to represent bootstrap estimates of uncertainty of fitted UNIQUAC or NRTL parameters.
+    Percentiles of parameters have shape (number of percentiles, 5),
+    partial pressures at the experimental points have shape (number of points, 2),
+    their percentiles have shape (number of percentiles, number of points, 2).
+    Replicates, which fits failed, are filled with NaN and excluded from the percentiles
+    """
+    parameters: typing.Union[UNIQUACParameters, NRTLParameters]
+    percentiles: typing.Tuple[float, ...]
+    replicates: numpy.ndarray
+    parameters_percentiles: numpy.ndarray
+    partial_pressures: numpy.ndarray
+    partial_pressures_percentiles: numpy.ndarray
+
+    @property
+    def n_failed(self) -> int:
+        return int(numpy.isnan(self.replicates).any(axis=1).sum())
+
+
+# objective function of the whole data set in worker processes of bootstrap_vle,
+# so that only indices of the points are sent with each replicate
+_bootstrap_objective: typing.Optional[VLEObjective] = None
+
+
+def _set_bootstrap_objective(vle_objective: VLEObjective) -> None:
+    global _bootstrap_objective
+    _bootstrap_objective = vle_objective
+
+
+def _fit_replicate(
+    vle_objective: VLEObjective,
+    indices: numpy.ndarray,
+    x0: numpy.ndarray,
+    fixed: typing.Sequence[float],
+) -> numpy.ndarray:
+    """
+    :return: parameters fitted to the selected points, NaN if the fit failed
+    """
+    report = _run_least_squares(vle_objective.subset(indices), x0, fixed)
+    if not numpy.isfinite(report.error):
+        return numpy.full(len(report.params), numpy.nan)
+    return report.params
+
+
+def _fit_bootstrap_replicate(
+    indices: numpy.ndarray, x0: numpy.ndarray, fixed: typing.Sequence[float]
+) -> numpy.ndarray:
+    return _fit_replicate(_bootstrap_objective, indices, x0, fixed)
+
+
+def bootstrap_vle(
+    data: VLEPoints,
+    n_replicates: int = 200,
+    parameters: typing.Optional[typing.Union[UNIQUACParameters, NRTLParameters]] = None,
+    percentiles: typing.Sequence[float] = (2.5, 50, 97.5),
+    n_jobs: typing.Optional[int] = None,
+    seed: typing.Optional[int] = None,
+    calculation_type: str = ActivityCoefficientModel.UNIQUAC,
+) -> VLEBootstrap:
+    """
+    Estimation of uncertainty of UNIQUAC or NRTL parameters fitted to the VLE of a given mixture.
+    Experimental points are resampled with replacement, each replicate is fitted with least squares
+    starting from the fit of the whole data, replicates are fitted concurrently in a pool of processes.
+    The data is sent to each worker process once, only indices of the resampled points are sent with replicates.
+    The coordination number of UNIQUAC is kept as in the fit of the whole data
+    :param data: Experimental data represented as a VLEPoints object
+    :param n_replicates: number of bootstrap replicates
+    :param parameters: fit of the whole data, if left None it is calculated with fit_vle_least_squares
+    :param percentiles: percentiles of parameters and partial pressures to calculate, from 0 to 100
+    :param n_jobs: number of worker processes, by default the number of CPUs,
+    if 1 the replicates are fitted one after another in the current process
+    :param seed: seed of the random generator of the replicates
+    :param calculation_type: Thermodynamic model, which parameters are fitted
+    :return: VLEBootstrap object
+    """
+    if n_replicates < 1:
+        raise ValueError("At least one replicate should be specified")
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("Number of jobs should be positive")
+
+    vle_objective = VLEObjective.from_points(data, calculation_type)
+    if parameters is None:
+        parameters = fit_vle_least_squares(
+            data=data, calculation_type=calculation_type
+        ).parameters
+    params = vle_objective.to_array(parameters)
+    if calculation_type == ActivityCoefficientModel.NRTL:
+        x0, fixed = params, ()
+    else:
+        x0, fixed = params[:4], (int(params[4]),)
+
+    indices = numpy.random.default_rng(seed).integers(
+        0, len(data), size=(n_replicates, len(data))
+    )
+    if n_jobs == 1:
+        replicates = [
+            _fit_replicate(vle_objective, replicate, x0, fixed) for replicate in indices
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_set_bootstrap_objective,
+            initargs=(vle_objective,),
+        ) as executor:
+            replicates = list(
+                executor.map(
+                    _fit_bootstrap_replicate,
+                    indices,
+                    [x0] * n_replicates,
+                    [fixed] * n_replicates,
+                    chunksize=max(1, n_replicates // (4 * n_jobs)),
+                )
+            )
+    replicates = numpy.array(replicates, dtype=float)
+
+    partial_pressures = numpy.full((n_replicates, len(data), 2), numpy.nan)
+    for i, replicate in enumerate(replicates):
+        if not numpy.isnan(replicate).any():
+            partial_pressures[i] = (
+                vle_objective.residuals(replicate).reshape(-1, 2) + vle_objective.pressures
+            )
+
+    return VLEBootstrap(
+        parameters=parameters,
+        percentiles=tuple(percentiles),
+        replicates=replicates,
+        parameters_percentiles=numpy.nanpercentile(replicates, percentiles, axis=0),
+        partial_pressures=vle_objective.residuals(params).reshape(-1, 2)
+        + vle_objective.pressures,
+        partial_pressures_percentiles=numpy.nanpercentile(
+            partial_pressures, percentiles, axis=0
+        ),
+    )
 
 
 def fit_vle(
     data: VLEPoints,
     method: typing.Optional[str] = None,
+    cache: typing.Optional[VLEFitCache] = None,
 ) -> UNIQUACParameters:
     """
     Get the UNIQUAC parameters to fit the VLE of a given mixture
     :param data Experimental data represented as a VLEPoints object
-    :param method Optimization method string, if left None the most accurate method is chosen
+    :param method Optimization method string, if left None the most accurate method is chosen,
+    "least_squares" uses fit_vle_least_squares
+    :param cache optional VLEFitCache to store the fitted parameters, which are reused for the same data and method
     :return fitted UNIQUACParameters object
     """
-    if method is None:
-        algs = FITTING_ALGS
-    else:
-        algs = [method]
+    if cache is not None:
+        key = VLEFitCache.key(
+            data, method, INITIAL_PARAMETERS[ActivityCoefficientModel.UNIQUAC]
+        )
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
 
-    best_fit = []
-    error = 1000
-    for alg in algs:
-        result = optimize.minimize(
-            lambda params: objective(data=data,
-                                     params=params),
-            x0=numpy.array([0, 0, 0, 0, 10]),
-            method=alg,
+    if method == LEAST_SQUARES:
+        fit = fit_vle_least_squares(data=data)
+    else:
+        fit = fit_vle_parallel(
+            data=data, methods=FITTING_ALGS if method is None else [method], n_jobs=1
         )
 
-        current_error = objective(data=data, params=result.x)
-        if current_error < error:
-            best_fit = result.x
-            error = current_error
+    if cache is not None:
+        cache.put(key, fit.parameters, fit.error)
+    return fit.parameters
 
-    return UNIQUACParameters.from_array(best_fit)
+
+def fit_nrtl_vle(
+    data: VLEPoints,
+    method: str = LEAST_SQUARES,
+) -> NRTLParameters:
+    """
+    Get the NRTL parameters to fit the VLE of a given mixture,
+    non-randomness parameter alpha12 is fitted as the same for both components
+    :param data: Experimental data represented as a VLEPoints object
+    :param method: Optimization method string, by default least squares with the analytic jacobian are used,
+    otherwise one of the FITTING_ALGS
+    :return: fitted NRTLParameters object
+    """
+    if method == LEAST_SQUARES:
+        return fit_vle_least_squares(
+            data=data, calculation_type=ActivityCoefficientModel.NRTL
+        ).parameters
+
+    return fit_vle_parallel(
+        data=data,
+        methods=[method],
+        n_jobs=1,
+        calculation_type=ActivityCoefficientModel.NRTL,
+    ).parameters
+
+
+def fit_activity_coefficient_model(
+    data: VLEPoints,
+    calculation_type: str,
+) -> typing.Any:
+    """
+    Get the parameters of any registered activity coefficient model to fit the VLE of a given mixture.
+    NRTL and UNIQUAC parameters are fitted to partial pressures by fit_vle_least_squares,
+    parameters of the other models are fitted by their own fit routines
+    to experimental activity coefficients p_i / (x_i * p_sat_i)
+    :param data: Experimental data represented as a VLEPoints object
+    :param calculation_type: Thermodynamic model, which parameters are fitted
+    :return: fitted parameters of the model, e.g. MargulesParameters
+    """
+    if calculation_type in (
+        ActivityCoefficientModel.NRTL,
+        ActivityCoefficientModel.UNIQUAC,
+    ):
+        return fit_vle_least_squares(
+            data=data, calculation_type=calculation_type
+        ).parameters
+
+    model = get_activity_coefficient_model_type(calculation_type)
+    fractions = _to_molar_fractions(data.compositions, data.components)
+    saturated_pressures = numpy.stack(
+        (
+            data.components[0].get_vapor_pressure(data.temperatures),
+            data.components[1].get_vapor_pressure(data.temperatures),
+        ),
+        axis=-1,
+    )
+    # activity coefficients of absent components are not defined and ignored by the fit
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        ln_activity_coefficients = numpy.log(
+            data.pressures
+            / (numpy.stack((fractions, 1 - fractions), axis=-1) * saturated_pressures)
+        )
+    return model.fit(fractions, data.temperatures, ln_activity_coefficients)
 
 
 def objective(data: VLEPoints, params: typing.List[float]) -> float:
     """
-    Objective function for minimization during the UNIQUAC parameters fit
+    Objective function for minimization during the UNIQUAC parameters fit,
+    use VLEObjective to evaluate it repeatedly for the same data
     :param data: data Experimental data represented as a VLEPoints object
     :param params: UNIQUAC parameters represented as a list
     :return: accumulative squared error as float
     """
-    error = 0
-    mixture = Mixture(
-                      name="",
-                      first_component=data.components[0],
-                      second_component=data.components[1],
-                      uniquac_params=UNIQUACParameters.from_array(params),
-    )
-    for point in data:
-        error += (get_partial_pressures(temperature=point.temperature,
-                                        composition=point.composition,
-                                        mixture=mixture,
-                                        calculation_type="UNIQUAC",
-                                        )[0] - point.pressures[0]) ** 2 \
-                 + (get_partial_pressures(temperature=point.temperature,
-                                          composition=point.composition,
-                                          mixture=mixture,
-                                          calculation_type="UNIQUAC",
-                                          )[1] - point.pressures[1]) ** 2
-    return numpy.sqrt(error / len(data))
+    return VLEObjective.from_points(data)(params)
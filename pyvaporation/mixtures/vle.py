@@ -0,0 +1,430 @@
+import typing
+
+import attr
+import numpy
+from scipy import optimize
+
+from ..plotting import plot_graph
+from .mixture import (
+    ActivityCoefficientModel,
+    CompositionArray,
+    Composition,
+    CompositionType,
+    Mixture,
+    ThermodynamicKernel,
+)
+
+# number of temperatures scanned to bracket a bubble point, when the Newton iteration fails
+_BRACKET_POINTS = 400
+
+
+@attr.s(auto_attribs=True)
+class VLEDiagram:
+    """
+    Vapour-liquid equilibrium of a binary mixture: bubble points of liquids of given compositions
+    and compositions of the vapours in equilibrium with them.
+    Isobaric diagrams (T-x-y) have a constant pressure, isothermal diagrams (P-x-y) have a constant temperature
+    """
+
+    mixture: Mixture
+    calculation_type: str
+    x: numpy.ndarray
+    y: numpy.ndarray
+    temperature: numpy.ndarray
+    pressure: numpy.ndarray
+
+    @property
+    def is_isobaric(self) -> bool:
+        return bool(numpy.all(self.pressure == self.pressure[0]))
+
+    def plot(self) -> None:
+        """
+        Draws bubble and dew lines of the diagram
+        :return: plots a graph
+        """
+        if self.is_isobaric:
+            ordinate = self.temperature
+            y_label = "Temperature, K"
+        else:
+            ordinate = self.pressure
+            y_label = "Pressure, kPa"
+
+        plot_graph(
+            x_label=f"{self.mixture.first_component.name}, molar fraction",
+            y_label=y_label,
+            points={
+                "Liquid": (self.x, ordinate, True),
+                "Vapour": (self.y, ordinate, True),
+            },
+        )
+
+
+def _to_molar_fractions(
+    mixture: Mixture,
+    compositions: typing.Optional[CompositionArray],
+    number_of_points: int,
+) -> numpy.ndarray:
+    if compositions is None:
+        return numpy.linspace(0, 1, number_of_points)
+    return compositions.to_molar(mixture).p
+
+
+def calculate_bubble_pressures(
+    mixture: Mixture,
+    temperature: float,
+    compositions: typing.Optional[CompositionArray] = None,
+    calculation_type: str = ActivityCoefficientModel.NRTL,
+    number_of_points: int = 101,
+) -> VLEDiagram:
+    """
+    Calculation of the isothermal (P-x-y) diagram of a mixture
+    :param mixture: a mixture for which the calculation should be conducted
+    :param temperature: temperature in K
+    :param compositions: liquid compositions, by default evenly spaced molar fractions are used
+    :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+    :param number_of_points: number of evenly spaced molar fractions, if compositions are not specified
+    :return: VLEDiagram object
+    """
+    x = _to_molar_fractions(mixture, compositions, number_of_points)
+    partial_pressures = mixture.get_kernel(calculation_type).partial_pressures(
+        x, temperature
+    )
+    pressure = partial_pressures.sum(axis=-1)
+
+    return VLEDiagram(
+        mixture=mixture,
+        calculation_type=calculation_type,
+        x=x,
+        y=partial_pressures[..., 0] / pressure,
+        temperature=numpy.full_like(x, temperature),
+        pressure=pressure,
+    )
+
+
+def calculate_bubble_temperatures(
+    mixture: Mixture,
+    pressure: float,
+    compositions: typing.Optional[CompositionArray] = None,
+    calculation_type: str = ActivityCoefficientModel.NRTL,
+    number_of_points: int = 101,
+    precision: float = 1e-8,
+    max_iterations: int = 50,
+) -> VLEDiagram:
+    """
+    Calculation of the isobaric (T-x-y) diagram of a mixture.
+    Bubble temperatures of all the compositions are found simultaneously
+    with a vectorized Newton iteration on the logarithm of total pressure versus reciprocal temperature,
+    which is nearly linear, using analytic derivatives of partial pressures.
+    Points, where the iteration fails, are bracketed and solved with Brent's method,
+    temperatures of liquids, which total pressure calculated by the model does not reach the pressure, are NaN
+    :param mixture: a mixture for which the calculation should be conducted
+    :param pressure: pressure in kPa
+    :param compositions: liquid compositions, by default evenly spaced molar fractions are used
+    :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+    :param number_of_points: number of evenly spaced molar fractions, if compositions are not specified
+    :param precision: tolerance of the relative change of temperature
+    :param max_iterations: maximum number of Newton iterations
+    :return: VLEDiagram object
+    """
+    kernel = mixture.get_kernel(calculation_type)
+    x = _to_molar_fractions(mixture, compositions, number_of_points)
+    temperature = _bubble_temperatures(kernel, x, pressure, precision, max_iterations)
+    partial_pressures = kernel.partial_pressures(x, temperature)
+
+    return VLEDiagram(
+        mixture=mixture,
+        calculation_type=calculation_type,
+        x=x,
+        y=partial_pressures[..., 0] / partial_pressures.sum(axis=-1),
+        temperature=temperature,
+        pressure=numpy.full_like(x, pressure),
+    )
+
+
+def _bubble_temperatures(
+    kernel: ThermodynamicKernel,
+    x: numpy.ndarray,
+    pressure: float,
+    precision: float,
+    max_iterations: int,
+) -> numpy.ndarray:
+    """
+    Newton iteration on the logarithm of total pressure versus reciprocal temperature,
+    points, where it does not converge to a root with total pressure increasing with temperature,
+    are bracketed on a grid of temperatures and solved with Brent's method
+    :return: bubble temperatures of liquids with molar fractions x of the first component at the pressure, K,
+    NaN where the total pressure calculated by the model does not reach the pressure
+    """
+    fractions = numpy.stack((x, 1 - x), axis=-1)
+
+    # boiling points of pure components interpolated linearly in reciprocal temperature as the initial guess
+    boiling_points = _boiling_points(kernel, pressure, precision, max_iterations)
+    reciprocal_temperature = x / boiling_points[0] + (1 - x) / boiling_points[1]
+    # activity coefficients may overflow far from the bubble points, such points are solved by bracketing
+    with numpy.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(max_iterations):
+            temperature = 1 / reciprocal_temperature
+            (
+                partial_pressures,
+                d_temperature,
+            ) = _partial_pressures_with_temperature_derivatives(
+                kernel, x, fractions, temperature
+            )
+            total_pressure = partial_pressures.sum(axis=-1)
+
+            # d(ln P)/d(1/T) = -T^2 * (dP/dT) / P
+            step = (numpy.log(total_pressure) - numpy.log(pressure)) / (
+                -(temperature**2) * d_temperature.sum(axis=-1) / total_pressure
+            )
+            step = numpy.clip(
+                step, -0.1 * reciprocal_temperature, 0.1 * reciprocal_temperature
+            )
+            reciprocal_temperature = reciprocal_temperature - step
+
+            converged = numpy.abs(step) <= precision * reciprocal_temperature
+            if numpy.all(converged):
+                break
+
+        # at a bubble point total pressure increases with temperature
+        converged &= d_temperature.sum(axis=-1) > 0
+
+        temperature = 1 / reciprocal_temperature
+        for i in numpy.flatnonzero(~converged):
+            temperature[i] = _bracket_bubble_temperature(
+                kernel, x[i], pressure, precision, boiling_points
+            )
+
+    return temperature
+
+
+def _bracket_bubble_temperature(
+    kernel: ThermodynamicKernel,
+    x: float,
+    pressure: float,
+    precision: float,
+    boiling_points: numpy.ndarray,
+) -> float:
+    """
+    Scans total pressure from 1.5 times the highest to 0.5 times the lowest boiling point of the components
+    and refines the first crossing of the pressure with Brent's method
+    :return: bubble temperature of a liquid with molar fraction x of the first component at the pressure, K,
+    NaN if the total pressure does not reach the pressure
+    """
+
+    def residual(reciprocal_temperature: numpy.ndarray) -> numpy.ndarray:
+        reciprocal_temperature = numpy.asarray(reciprocal_temperature, dtype=float)
+        total_pressure = kernel.partial_pressures(
+            numpy.full_like(reciprocal_temperature, x), 1 / reciprocal_temperature
+        ).sum(axis=-1)
+        return numpy.log(total_pressure) - numpy.log(pressure)
+
+    grid = numpy.linspace(
+        1 / (1.5 * boiling_points.max()),
+        1 / (0.5 * boiling_points.min()),
+        _BRACKET_POINTS,
+    )
+    values = residual(grid)
+    # from high temperatures down, the first point, where total pressure falls below the pressure
+    for k in numpy.flatnonzero(
+        numpy.isfinite(values[:-1])
+        & numpy.isfinite(values[1:])
+        & (values[:-1] > 0)
+        & (values[1:] <= 0)
+    )[:1]:
+        reciprocal_temperature = optimize.brentq(
+            lambda value: float(residual(value)),
+            grid[k],
+            grid[k + 1],
+            xtol=precision * grid[k],
+        )
+        return 1 / reciprocal_temperature
+
+    return numpy.nan
+
+
+@attr.s(auto_attribs=True)
+class Azeotrope:
+    """
+    Azeotrope of a binary mixture predicted by an activity coefficient model at a given pressure
+    """
+
+    mixture: Mixture
+    calculation_type: str
+    pressure: float
+    composition: Composition
+    temperature: float
+
+
+def find_azeotropes(
+    mixtures: typing.Iterable[Mixture],
+    pressures: typing.Union[float, typing.Iterable[float]],
+    calculation_types: typing.Iterable[str] = (
+        ActivityCoefficientModel.NRTL,
+        ActivityCoefficientModel.UNIQUAC,
+    ),
+    number_of_points: int = 201,
+    precision: float = 1e-10,
+    max_iterations: int = 50,
+) -> typing.List[Azeotrope]:
+    """
+    Screening of mixtures for azeotropes over a range of pressures.
+    Logarithm of relative volatility at the bubble point is scanned on a grid of molar fractions
+    in a single vectorized calculation, its sign changes are refined with Brent's method.
+    Models without parameters specified for a mixture are skipped,
+    as well as combinations of a mixture, a model and a pressure, for which the calculation fails
+    and compositions, which bubble points are not defined by the model
+    :param mixtures: mixtures to screen, e.g. a list of Mixtures attributes
+    :param pressures: pressure or pressures in kPa
+    :param calculation_types: Thermodynamic models used for calculation of activity coefficients
+    :param number_of_points: number of molar fractions in the coarse scan
+    :param precision: tolerance of the azeotropic molar fraction and of the bubble temperatures
+    :param max_iterations: maximum number of Newton iterations of bubble temperatures
+    :return: list of found azeotropes
+    """
+    pressures = numpy.atleast_1d(numpy.asarray(pressures, dtype=float)).tolist()
+    x = numpy.linspace(0, 1, number_of_points)[1:-1]
+
+    azeotropes = []
+    for mixture in mixtures:
+        for calculation_type in calculation_types:
+            try:
+                kernel = mixture.get_kernel(calculation_type)
+            except ValueError:
+                continue
+
+            for pressure in pressures:
+                try:
+                    azeotropes.extend(
+                        _find_azeotropes(
+                            kernel, x, pressure, precision, max_iterations
+                        )
+                    )
+                except (ValueError, RuntimeError):
+                    continue
+
+    return azeotropes
+
+
+def _find_azeotropes(
+    kernel: ThermodynamicKernel,
+    x: numpy.ndarray,
+    pressure: float,
+    precision: float,
+    max_iterations: int,
+) -> typing.List[Azeotrope]:
+    """
+    :return: azeotropes of the kernel's mixture at the pressure found by the scan over molar fractions x
+    """
+
+    def ln_relative_volatility(fractions: numpy.ndarray) -> numpy.ndarray:
+        temperature = _bubble_temperatures(
+            kernel, fractions, pressure, precision, max_iterations
+        )
+        ln_activity_coefficients = kernel.activity_model.ln_activity_coefficients(
+            fractions, temperature
+        )
+        saturated_pressures = kernel.psat(temperature)
+        return (
+            ln_activity_coefficients[0]
+            + numpy.log(saturated_pressures[..., 0])
+            - ln_activity_coefficients[1]
+            - numpy.log(saturated_pressures[..., 1])
+        )
+
+    values = ln_relative_volatility(x)
+    azeotropes = []
+    # sign changes between compositions with defined bubble points
+    for i in numpy.nonzero(
+        numpy.isfinite(values[:-1])
+        & numpy.isfinite(values[1:])
+        & (numpy.sign(values[:-1]) != numpy.sign(values[1:]))
+        & (values[1:] != 0)
+    )[0]:
+        if values[i] == 0:
+            azeotropic_fraction = x[i]
+        else:
+            azeotropic_fraction = optimize.brentq(
+                lambda fraction: float(
+                    ln_relative_volatility(numpy.array([fraction]))[0]
+                ),
+                x[i],
+                x[i + 1],
+                xtol=precision,
+            )
+        temperature = float(
+            _bubble_temperatures(
+                kernel,
+                numpy.array([azeotropic_fraction]),
+                pressure,
+                precision,
+                max_iterations,
+            )[0]
+        )
+        if not numpy.isfinite(temperature):
+            continue
+
+        azeotropes.append(
+            Azeotrope(
+                mixture=kernel.mixture,
+                calculation_type=kernel.calculation_type,
+                pressure=pressure,
+                composition=Composition(
+                    p=float(azeotropic_fraction),
+                    type=CompositionType.molar,
+                ),
+                temperature=temperature,
+            )
+        )
+
+    return azeotropes
+
+
+def _boiling_points(
+    kernel: ThermodynamicKernel, pressure: float, precision: float, max_iterations: int
+) -> numpy.ndarray:
+    """
+    :return: boiling temperatures of both components at the pressure, K
+    """
+    reciprocal_temperature = numpy.full(2, 1 / 350)
+    for _ in range(max_iterations):
+        temperature = 1 / reciprocal_temperature
+        # i-th component at the i-th temperature
+        saturated_pressures = numpy.diagonal(kernel.psat(temperature))
+        step = (numpy.log(saturated_pressures) - numpy.log(pressure)) / (
+            -(temperature**2)
+            * numpy.diagonal(kernel.psat_derivative(temperature))
+            / saturated_pressures
+        )
+        step = numpy.clip(step, -0.1 * reciprocal_temperature, 0.1 * reciprocal_temperature)
+        reciprocal_temperature = reciprocal_temperature - step
+
+        if numpy.all(numpy.abs(step) <= precision * reciprocal_temperature):
+            return 1 / reciprocal_temperature
+
+    raise ValueError("Boiling temperatures did not converge in %s iterations" % max_iterations)
+
+
+def _partial_pressures_with_temperature_derivatives(
+    kernel: ThermodynamicKernel,
+    x: numpy.ndarray,
+    fractions: numpy.ndarray,
+    temperature: numpy.ndarray,
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    :return: partial pressures and their derivatives by temperature as arrays of shape (..., 2)
+    """
+    ln_activity_coefficients, _, temperature_derivatives = (
+        kernel.activity_model.ln_activity_coefficients_derivatives(x, temperature)
+    )
+    activity_coefficients = numpy.exp(numpy.stack(ln_activity_coefficients, axis=-1))
+    saturated_pressures = kernel.psat(temperature)
+
+    return (
+        saturated_pressures * activity_coefficients * fractions,
+        activity_coefficients
+        * fractions
+        * (
+            kernel.psat_derivative(temperature)
+            + saturated_pressures * numpy.stack(temperature_derivatives, axis=-1)
+        ),
+    )
@@ -1,3 +1,9 @@
 from .pervaporation import Pervaporation
+from .solvers import PermeateCompositionError, PermeateSolver, ProcessFailurePolicy
 
-__all__ = ["Pervaporation"]
+__all__ = [
+    "Pervaporation",
+    "PermeateSolver",
+    "PermeateCompositionError",
+    "ProcessFailurePolicy",
+]
@@ -1,6 +1,7 @@
 import datetime
 import typing
 from datetime import datetime
+from time import monotonic
 
 import attr
 import numpy
@@ -8,11 +9,27 @@ import numpy
 from ..conditions import Conditions
 from ..diffusion_curve import DiffusionCurve, DiffusionCurveSet
 from ..membrane import Membrane
-from ..mixtures import Composition, CompositionType, Mixture, get_partial_pressures
+from ..mixtures import (
+    Composition,
+    CompositionArray,
+    CompositionType,
+    Mixture,
+    ThermodynamicCache,
+    ThermodynamicKernel,
+    ThermodynamicSurrogate,
+)
 from ..optimizer import Measurements, find_best_fit
 from ..permeance import Permeance, Units
 from ..process import ProcessModel
 from ..utils import R
+from .solvers import (
+    PERMEATE_SOLVERS,
+    IterationMonitor,
+    PermeateBalance,
+    PermeateCompositionError,
+    PermeateSolver,
+    ProcessFailurePolicy,
+)
 
 
 def get_permeate_composition_from_fluxes(
@@ -28,6 +45,29 @@ def get_permeate_composition_from_fluxes(
 class Pervaporation:
     membrane: Membrane
     mixture: Mixture
+    cache: typing.Optional[ThermodynamicCache] = None
+    surrogate: typing.Optional[ThermodynamicSurrogate] = None
+
+    def get_kernel(
+        self, calculation_type: typing.Optional[str] = "NRTL"
+    ) -> typing.Union[ThermodynamicKernel, ThermodynamicSurrogate]:
+        """
+        Returns the thermodynamics used in calculations:
+        the surrogate if it is specified, otherwise a ThermodynamicKernel of the mixture
+        :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :return: ThermodynamicSurrogate or ThermodynamicKernel object
+        """
+        if self.surrogate is None:
+            return self.mixture.get_kernel(calculation_type, cache=self.cache)
+
+        if self.surrogate.mixture is not self.mixture:
+            raise ValueError("Surrogate was built for a different mixture")
+        if self.surrogate.calculation_type != calculation_type:
+            raise ValueError(
+                "Surrogate was built for %s calculation type"
+                % self.surrogate.calculation_type
+            )
+        return self.surrogate
 
     def get_partial_fluxes_from_permeate_composition(
         self,
@@ -39,6 +79,9 @@ class Pervaporation:
         permeate_temperature: typing.Optional[float] = None,
         permeate_pressure: typing.Optional[float] = None,
         calculation_type: typing.Optional[str] = "NRTL",
+        kernel: typing.Optional[
+            typing.Union[ThermodynamicKernel, ThermodynamicSurrogate]
+        ] = None,
     ) -> typing.Tuple[float, float]:
         """
         Calculates partial fluxes at a given Permeate composition, accounting for the driving force change
@@ -51,17 +94,20 @@ class Pervaporation:
         :param permeate_temperature - permeate temperature, K , if not specified permeate pressure is considered 0 kPa
         :param permeate_pressure - permeate pressure, kPa , if not specified permeate pressure is considered 0 kPa
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param kernel: prepared ThermodynamicKernel or ThermodynamicSurrogate of the mixture, if not specified is obtained with get_kernel
         """
+        if kernel is None:
+            kernel = self.get_kernel(calculation_type)
 
-        feed_nrtl_partial_pressures = get_partial_pressures(
-            feed_temperature, self.mixture, feed_composition, calculation_type,
+        feed_nrtl_partial_pressures = kernel.get_partial_pressures(
+            feed_temperature, feed_composition
         )
         if permeate_temperature is None and permeate_pressure is None:
             permeate_nrtl_partial_pressures = (0, 0)
 
         elif permeate_temperature is not None and permeate_pressure is None:
-            permeate_nrtl_partial_pressures = get_partial_pressures(
-                permeate_temperature, self.mixture, permeate_composition, calculation_type,
+            permeate_nrtl_partial_pressures = kernel.get_partial_pressures(
+                permeate_temperature, permeate_composition
             )
         elif permeate_pressure is not None and permeate_temperature is None:
             permeate_nrtl_partial_pressures = (
@@ -91,6 +137,13 @@ class Pervaporation:
         first_component_permeance: typing.Optional[Permeance] = None,
         second_component_permeance: typing.Optional[Permeance] = None,
         calculation_type: typing.Optional[str] = "NRTL",
+        kernel: typing.Optional[
+            typing.Union[ThermodynamicKernel, ThermodynamicSurrogate]
+        ] = None,
+        solver: str = PermeateSolver.fixed_point,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
+        initial_permeate_composition: typing.Optional[Composition] = None,
     ) -> typing.Tuple[float, float]:
         """
         Calculates partial fluxes of the test_components at specified conditions.
@@ -103,8 +156,21 @@ class Pervaporation:
         :param first_component_permeance: Permeance of the first test_components, if not specified is calculated
         :param second_component_permeance: Permeance of the second test_components, if not specified is calculated
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param kernel: prepared ThermodynamicKernel or ThermodynamicSurrogate of the mixture, if not specified is obtained with get_kernel
+        :param solver: strategy of the permeate composition calculation, one of PermeateSolver:
+        successive substitution (fixed_point), safeguarded Newton's method (newton),
+        bracketed Brent's method (brent) or Anderson-accelerated substitution (anderson)
+        :param max_iterations: maximum number of iterations of the solver
+        :param time_limit: wall-clock limit of the calculation in seconds, by default is not limited
+        :param initial_permeate_composition: initial guess of the permeate composition, e.g. the one obtained
+        at close conditions, if not specified the permeate composition at zero permeate pressure is used
         :return: Partial fluxes of test_components as a tuple
+        :raises PermeateCompositionError: if the solver exceeds the limits, diverges
+        or the partial fluxes are not defined in the stated conditions
         """
+        if kernel is None:
+            kernel = self.get_kernel(calculation_type)
+
         if second_component_permeance is None or first_component_permeance is None:
             first_component_permeance = self.membrane.get_permeance(
                 feed_temperature, self.mixture.first_component
@@ -117,47 +183,97 @@ class Pervaporation:
                 to_units=Units().kg_m2_h_kPa, component=self.mixture.second_component
             )
 
-        initial_fluxes: typing.Tuple[float, float] = numpy.multiply(
-            (first_component_permeance.value, second_component_permeance.value),
-            get_partial_pressures(feed_temperature, self.mixture, composition, calculation_type),
+        if solver not in PERMEATE_SOLVERS:
+            raise ValueError("Solver %s is not supported" % solver)
+        monitor = IterationMonitor(
+            max_iterations=max_iterations,
+            deadline=None if time_limit is None else monotonic() + time_limit,
         )
-        permeate_composition = get_permeate_composition_from_fluxes(initial_fluxes)
-
-        d = 1
-        while d >= precision:
-            try:
-                permeate_composition_new = get_permeate_composition_from_fluxes(
-                    self.get_partial_fluxes_from_permeate_composition(
-                        first_component_permeance=first_component_permeance,
-                        second_component_permeance=second_component_permeance,
-                        permeate_composition=permeate_composition,
-                        feed_composition=composition,
-                        feed_temperature=feed_temperature,
-                        permeate_temperature=permeate_temperature,
-                        permeate_pressure=permeate_pressure,
-                        calculation_type=calculation_type,
-                    )
-                )
-                d = max(
-                    abs(permeate_composition_new.first - permeate_composition.first),
-                    abs(permeate_composition_new.second - permeate_composition.second),
-                )
-            except ():
-                raise ValueError(
-                    "Partial fluxes are not defined in the stated conditions range"
-                )
-            else:
-                permeate_composition = permeate_composition_new
 
-        return self.get_partial_fluxes_from_permeate_composition(
-            first_component_permeance=first_component_permeance,
-            second_component_permeance=second_component_permeance,
-            permeate_composition=permeate_composition,
-            feed_composition=composition,
-            feed_temperature=feed_temperature,
+        balance = PermeateBalance(
+            permeances=(first_component_permeance.value, second_component_permeance.value),
+            feed_partial_pressures=kernel.get_partial_pressures(
+                feed_temperature, composition
+            ),
+            kernel=kernel,
+            molecular_weights=(
+                self.mixture.first_component.molecular_weight,
+                self.mixture.second_component.molecular_weight,
+            ),
             permeate_temperature=permeate_temperature,
             permeate_pressure=permeate_pressure,
-            calculation_type=calculation_type,
+        )
+        if initial_permeate_composition is None:
+            # the iterations start from the permeate composition at zero permeate pressure
+            initial_fluxes = numpy.multiply(
+                balance.permeances, balance.feed_partial_pressures
+            )
+            initial_permeate_fraction = initial_fluxes[0] / initial_fluxes.sum()
+        else:
+            initial_permeate_fraction = initial_permeate_composition.to_weight(
+                self.mixture
+            ).first
+        permeate_composition = PERMEATE_SOLVERS[solver](
+            balance,
+            initial_permeate_fraction,
+            precision,
+            monitor,
+        )
+
+        return balance.fluxes(permeate_composition)
+
+    @staticmethod
+    def _get_process_deadline(
+        on_failure: str, time_limit: typing.Optional[float]
+    ) -> typing.Optional[float]:
+        """
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy
+        :param time_limit: wall-clock limit of a process model or a diffusion curve in seconds
+        :return: deadline of the calculation in terms of time.monotonic()
+        """
+        if on_failure not in (
+            ProcessFailurePolicy.fail,
+            ProcessFailurePolicy.stop,
+            ProcessFailurePolicy.fallback,
+        ):
+            raise ValueError("Failure policy %s is not supported" % on_failure)
+        if time_limit is None:
+            return None
+        return monotonic() + time_limit
+
+    def _calculate_process_partial_fluxes(
+        self,
+        on_failure: str,
+        fallback_solver: str,
+        deadline: typing.Optional[float],
+        **kwargs
+    ) -> typing.Optional[typing.Tuple[float, float]]:
+        """
+        Calculates partial fluxes at a step of a process model or a diffusion curve according to the failure policy
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy
+        :param fallback_solver: solver, which is used after a failure, if on_failure is fallback
+        :param deadline: deadline of the calculation in terms of time.monotonic()
+        :param kwargs: arguments of calculate_partial_fluxes
+        :return: Partial fluxes of test_components as a tuple,
+        None if the calculation failed and the calculation should be stopped
+        """
+        try:
+            return self.calculate_partial_fluxes(
+                time_limit=None if deadline is None else deadline - monotonic(),
+                **kwargs
+            )
+        except PermeateCompositionError:
+            if on_failure == ProcessFailurePolicy.stop:
+                return None
+            if (
+                on_failure != ProcessFailurePolicy.fallback
+                or kwargs["solver"] == fallback_solver
+            ):
+                raise
+        kwargs["solver"] = fallback_solver
+        return self.calculate_partial_fluxes(
+            time_limit=None if deadline is None else deadline - monotonic(),
+            **kwargs
         )
 
     def calculate_permeate_composition(
@@ -168,6 +284,7 @@ class Pervaporation:
         permeate_temperature: typing.Optional[float] = None,
         permeate_pressure: typing.Optional[float] = None,
         calculation_type: typing.Optional[str] = "NRTL",
+        solver: str = PermeateSolver.fixed_point,
     ) -> Composition:
         """
         Calculates permeate composition at given conditions
@@ -178,6 +295,7 @@ class Pervaporation:
         :param permeate_temperature: Permeate temperature, if not specified permeate pressure is set to 0 kPa
         :param permeate_pressure - permeate pressure, kPa , if not specified permeate pressure is considered 0 kPa
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
         :return: Permeate composition in weight %
         """
 
@@ -187,7 +305,8 @@ class Pervaporation:
             precision,
             permeate_temperature,
             permeate_pressure,
-            calculation_type
+            calculation_type,
+            solver=solver,
         )
         return Composition(x[0] / numpy.sum(x), type=CompositionType.weight)
 
@@ -199,6 +318,7 @@ class Pervaporation:
         permeate_pressure: typing.Optional[float] = None,
         precision: typing.Optional[float] = 5e-5,
         calculation_type: typing.Optional[str] = "NRTL",
+        solver: str = PermeateSolver.fixed_point,
     ) -> float:
         """
         Calculates separation factor at given conditions
@@ -210,6 +330,7 @@ class Pervaporation:
             permeate_temperature,
             permeate_pressure,
             calculation_type,
+            solver=solver,
         )
         return (composition.second / composition.first) / (
             perm_comp.second / perm_comp.first
@@ -218,42 +339,67 @@ class Pervaporation:
     def ideal_diffusion_curve(
         self,
         feed_temperature: float,
-        compositions: typing.List[Composition],
+        compositions: typing.Union[typing.List[Composition], CompositionArray],
         permeate_temperature: typing.Optional[float] = None,
         permeate_pressure: typing.Optional[float] = None,
         precision: typing.Optional[float] = 5e-5,
         calculation_type: typing.Optional[str] = "NRTL",
+        solver: str = PermeateSolver.fixed_point,
+        on_failure: str = ProcessFailurePolicy.fail,
+        fallback_solver: str = PermeateSolver.brent,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
     ) -> DiffusionCurve:
         """
         Models Ideal Diffusion curve of a specified membrane, at a given temperature, for a given Mixture
         if Ideal experiments for both test_components are available.
         Either permeate temperature or permeate pressure could be stated;
         :param feed_temperature: Feed temperature, K
-        :param compositions: List of compositions to model parameters at
+        :param compositions: List of compositions or a CompositionArray to model parameters at
         :param permeate_temperature: Permeate temperature, if not specified permeate pressure is set to 0 kPa
         :param permeate_pressure - Permeate pressure, kPa , if not specified permeate pressure is considered 0 kPa
         :param precision: Precision in obtained permeate composition, by default is 5e-5
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy,
+        stop returns the diffusion curve up to the failed composition
+        :param fallback_solver: solver of the permeate composition, which is used after a failure,
+        if on_failure is fallback
+        :param max_iterations: maximum number of iterations of the solver at each composition
+        :param time_limit: wall-clock limit of the whole diffusion curve in seconds, by default is not limited
         :return: A DiffusionCurve Object
         """
+        kernel = self.get_kernel(calculation_type)
+        deadline = self._get_process_deadline(on_failure, time_limit)
+
+        partial_fluxes: typing.List[typing.Tuple[float, float]] = []
+        for composition in compositions:
+            fluxes = self._calculate_process_partial_fluxes(
+                on_failure=on_failure,
+                fallback_solver=fallback_solver,
+                deadline=deadline,
+                feed_temperature=feed_temperature,
+                composition=composition,
+                precision=precision,
+                permeate_temperature=permeate_temperature,
+                permeate_pressure=permeate_pressure,
+                calculation_type=calculation_type,
+                kernel=kernel,
+                solver=solver,
+                max_iterations=max_iterations,
+            )
+            if fluxes is None:
+                break
+            partial_fluxes.append(fluxes)
+
         return DiffusionCurve(
             mixture=self.mixture,
             membrane_name=self.membrane.name,
             feed_temperature=feed_temperature,
             permeate_temperature=permeate_temperature,
             permeate_pressure=permeate_pressure,
-            feed_compositions=compositions,
-            partial_fluxes=[
-                self.calculate_partial_fluxes(
-                    feed_temperature,
-                    composition,
-                    precision,
-                    permeate_temperature,
-                    permeate_pressure,
-                    calculation_type,
-                )
-                for composition in compositions
-            ],
+            feed_compositions=compositions[: len(partial_fluxes)],
+            partial_fluxes=partial_fluxes,
             comments=(
                 str(self.membrane.name)
                 + " "
@@ -272,6 +418,11 @@ class Pervaporation:
         conditions: Conditions,
         precision: typing.Optional[float] = 5e-5,
         calculation_type: typing.Optional[str] = "NRTL",
+        solver: str = PermeateSolver.fixed_point,
+        on_failure: str = ProcessFailurePolicy.fail,
+        fallback_solver: str = PermeateSolver.brent,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
     ) -> ProcessModel:
         """
         Models mass and heat balance of an Ideal (constant Permeance) Isothermal Pervaporation Process
@@ -280,6 +431,12 @@ class Pervaporation:
         :param conditions: Conditions object, where initial conditions are specified
         :param precision: Precision in obtained permeate composition, by default is 5e-5
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy
+        :param fallback_solver: solver of the permeate composition, which is used after a failure,
+        if on_failure is fallback
+        :param max_iterations: maximum number of iterations of the solver at each step
+        :param time_limit: wall-clock limit of the whole process model in seconds, by default is not limited
         :return: A ProcessModel Object
         """
 
@@ -300,7 +457,7 @@ class Pervaporation:
                 first_component_permeance,
                 second_component_permeance,
             )
-        ] * number_of_steps
+        ] * len(time)
 
         permeate_composition: typing.List[Composition] = []
         feed_composition: typing.List[Composition] = [
@@ -353,19 +510,34 @@ class Pervaporation:
                 conditions.permeate_temperature, conditions.initial_feed_temperature
             )
 
+        kernel = self.get_kernel(calculation_type)
+        deadline = self._get_process_deadline(on_failure, time_limit)
+
         for step in range(len(time)):
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=conditions.initial_feed_temperature,
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=first_component_permeance,
-                    second_component_permeance=second_component_permeance,
-                    calculation_type=calculation_type,
-                )
-            )
+            fluxes = self._calculate_process_partial_fluxes(
+                on_failure=on_failure,
+                fallback_solver=fallback_solver,
+                deadline=deadline,
+                feed_temperature=conditions.initial_feed_temperature,
+                composition=feed_composition[step],
+                precision=precision,
+                permeate_temperature=conditions.permeate_temperature,
+                permeate_pressure=conditions.permeate_pressure,
+                first_component_permeance=first_component_permeance,
+                second_component_permeance=second_component_permeance,
+                calculation_type=calculation_type,
+                kernel=kernel,
+                solver=solver,
+                max_iterations=max_iterations,
+                initial_permeate_composition=permeate_composition[step - 1]
+                if step > 0
+                else None,
+            )
+            if fluxes is None:
+                del time[step:]
+                del permeances[step:]
+                break
+            partial_fluxes.append(fluxes)
 
             permeate_composition.append(
                 Composition(
@@ -409,11 +581,11 @@ class Pervaporation:
         return ProcessModel(
             mixture=self.mixture,
             membrane_name=self.membrane.name,
-            feed_temperature=[conditions.initial_feed_temperature] * number_of_steps,
+            feed_temperature=[conditions.initial_feed_temperature] * len(time),
             feed_compositions=feed_composition,
             permeate_composition=permeate_composition,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
+            permeate_temperature=[conditions.permeate_temperature] * len(time),
+            permeate_pressure=[conditions.permeate_pressure] * len(time),
             feed_mass=feed_mass,
             partial_fluxes=partial_fluxes,
             permeances=permeances,
@@ -428,6 +600,63 @@ class Pervaporation:
             membrane_path=self.membrane.path,
         )
 
+    def _get_permeate_condensation_heat(
+        self,
+        conditions: Conditions,
+        feed_temperature: typing.List[float],
+        partial_fluxes: typing.List[typing.Tuple[float, float]],
+        delta_hours: float,
+    ) -> typing.List[typing.Optional[float]]:
+        """
+        Calculates heat released at the permeate side at each step of a non-isothermal process model,
+        the permeate temperature is constant, so that the condensation heats are calculated once
+        and the cooling heats are calculated for all steps at once
+        :param conditions: Conditions of the process
+        :param feed_temperature: feed temperatures at each step, K
+        :param partial_fluxes: partial fluxes at each step, kg/(m2*h)
+        :param delta_hours: The duration of each step in hours
+        :return: permeate condensation heat at each step, None if the permeate temperature is not specified
+        """
+        if conditions.permeate_temperature is None:
+            return [None] * len(partial_fluxes)
+
+        condensation_heat_1 = (
+            self.mixture.first_component.get_vaporisation_heat(
+                conditions.permeate_temperature
+            )
+            / self.mixture.first_component.molecular_weight
+            * 1000
+        )
+        condensation_heat_2 = (
+            self.mixture.second_component.get_vaporisation_heat(
+                conditions.permeate_temperature
+            )
+            / self.mixture.second_component.molecular_weight
+            * 1000
+        )
+
+        feed_temperature = numpy.array(
+            feed_temperature[: len(partial_fluxes)], dtype=float
+        )
+        d_mass = (
+            numpy.array(partial_fluxes, dtype=float).reshape(-1, 2)
+            * conditions.membrane_area
+            * delta_hours
+        )
+        specific_heat_1 = self.mixture.first_component.get_cooling_heat(
+            feed_temperature, conditions.permeate_temperature
+        )
+        specific_heat_2 = self.mixture.second_component.get_cooling_heat(
+            feed_temperature, conditions.permeate_temperature
+        )
+
+        return (
+            condensation_heat_1 * d_mass[:, 0]
+            + condensation_heat_2 * d_mass[:, 1]
+            + (specific_heat_1 * d_mass[:, 0] + specific_heat_2 * d_mass[:, 1])
+            * (feed_temperature - conditions.permeate_temperature)
+        ).tolist()
+
     def ideal_non_isothermal_process(
         self,
         conditions: Conditions,
@@ -435,6 +664,11 @@ class Pervaporation:
         delta_hours: float,
         precision: typing.Optional[float] = 5e-5,
         calculation_type: typing.Optional[str] = "NRTL",
+        solver: str = PermeateSolver.fixed_point,
+        on_failure: str = ProcessFailurePolicy.fail,
+        fallback_solver: str = PermeateSolver.brent,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
     ) -> ProcessModel:
         """
         Models mass and heat balance of an Ideal (constant Permeance) Non-Isothermal Pervaporation Process.
@@ -445,6 +679,12 @@ class Pervaporation:
         :param conditions: Conditions object, where initial conditions are specified
         :param precision: Precision in obtained permeate composition, by default is 5e-5
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy
+        :param fallback_solver: solver of the permeate composition, which is used after a failure,
+        if on_failure is fallback
+        :param max_iterations: maximum number of iterations of the solver at each step
+        :param time_limit: wall-clock limit of the whole process model in seconds, by default is not limited
         :return: A ProcessModel Object
         """
 
@@ -466,34 +706,31 @@ class Pervaporation:
 
         feed_evaporation_heat: typing.List[float] = []
 
-        permeate_condensation_heat: typing.List[typing.Optional[float]] = []
-
         feed_mass: typing.List[float] = [conditions.initial_feed_amount]
 
+        kernel = self.get_kernel(calculation_type)
+        deadline = self._get_process_deadline(on_failure, time_limit)
+
         for step in range(len(time)):
 
+            _, vaporisation_heat_1, molar_heat_capacity_1 = (
+                self.mixture.first_component.properties(feed_temperature[step])
+            )
+            _, vaporisation_heat_2, molar_heat_capacity_2 = (
+                self.mixture.second_component.properties(feed_temperature[step])
+            )
             evaporation_heat_1 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
+                vaporisation_heat_1 / self.mixture.first_component.molecular_weight * 1000
             )
             evaporation_heat_2 = (
-                self.mixture.second_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.second_component.molecular_weight
-                * 1000
+                vaporisation_heat_2 / self.mixture.second_component.molecular_weight * 1000
             )
 
             heat_capacity_1 = (
-                self.mixture.first_component.get_specific_heat(feed_temperature[step])
-                / self.mixture.first_component.molecular_weight
+                molar_heat_capacity_1 / self.mixture.first_component.molecular_weight
             )
             heat_capacity_2 = (
-                self.mixture.second_component.get_specific_heat(feed_temperature[step])
-                / self.mixture.second_component.molecular_weight
+                molar_heat_capacity_2 / self.mixture.second_component.molecular_weight
             )
             feed_heat_capacity = (
                 feed_composition[step].first * heat_capacity_1
@@ -511,18 +748,30 @@ class Pervaporation:
                 )
             )
 
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=feed_temperature[step],
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=permeances[step][0],
-                    second_component_permeance=permeances[step][1],
-                    calculation_type=calculation_type,
-                )
-            )
+            fluxes = self._calculate_process_partial_fluxes(
+                on_failure=on_failure,
+                fallback_solver=fallback_solver,
+                deadline=deadline,
+                feed_temperature=feed_temperature[step],
+                composition=feed_composition[step],
+                precision=precision,
+                permeate_temperature=conditions.permeate_temperature,
+                permeate_pressure=conditions.permeate_pressure,
+                first_component_permeance=permeances[step][0],
+                second_component_permeance=permeances[step][1],
+                calculation_type=calculation_type,
+                kernel=kernel,
+                solver=solver,
+                max_iterations=max_iterations,
+                initial_permeate_composition=permeate_composition[step - 1]
+                if step > 0
+                else None,
+            )
+            if fluxes is None:
+                del time[step:]
+                del permeances[step:]
+                break
+            partial_fluxes.append(fluxes)
 
             permeate_composition.append(
                 Composition(
@@ -534,38 +783,6 @@ class Pervaporation:
             d_mass_1 = partial_fluxes[step][0] * conditions.membrane_area * delta_hours
             d_mass_2 = partial_fluxes[step][1] * conditions.membrane_area * delta_hours
 
-            if conditions.permeate_temperature is None:
-                permeate_condensation_heat.append(None)
-            else:
-                condensation_heat_1 = (
-                    self.mixture.first_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.first_component.molecular_weight
-                    * 1000
-                )
-                condensation_heat_2 = (
-                    self.mixture.second_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.second_component.molecular_weight
-                    * 1000
-                )
-
-                specific_heat_1 = self.mixture.first_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-                specific_heat_2 = self.mixture.second_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-
-                permeate_condensation_heat.append(
-                    condensation_heat_1 * d_mass_1
-                    + condensation_heat_2 * d_mass_2
-                    + (specific_heat_1 * d_mass_1 + specific_heat_2 * d_mass_2)
-                    * (feed_temperature[step] - conditions.permeate_temperature)
-                )
-
             feed_evaporation_heat.append(
                 evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
             )
@@ -597,12 +814,19 @@ class Pervaporation:
         feed_composition.pop(-1)
         feed_temperature.pop(-1)
 
+        permeate_condensation_heat = self._get_permeate_condensation_heat(
+            conditions=conditions,
+            feed_temperature=feed_temperature,
+            partial_fluxes=partial_fluxes,
+            delta_hours=delta_hours,
+        )
+
         return ProcessModel(
             mixture=self.mixture,
             membrane_name=self.membrane.name,
             feed_temperature=feed_temperature,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
+            permeate_temperature=[conditions.permeate_temperature] * len(time),
+            permeate_pressure=[conditions.permeate_pressure] * len(time),
             feed_compositions=feed_composition,
             permeate_composition=permeate_composition,
             feed_mass=feed_mass,
@@ -636,6 +860,11 @@ class Pervaporation:
         m_first: typing.Optional[int] = None,
         m_second: typing.Optional[int] = None,
         include_zero: bool = False,
+        solver: str = PermeateSolver.fixed_point,
+        on_failure: str = ProcessFailurePolicy.fail,
+        fallback_solver: str = PermeateSolver.brent,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
     ):
         """
         The Fucntion models Non-Ideal Diffusion curve
@@ -659,6 +888,13 @@ class Pervaporation:
         :param m_second: m parameter of the PervaporationFunction of the second component
         :param include_zero: bool parameter to force default points while fitting the PervaporationFunction
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy,
+        stop returns the diffusion curve up to the failed composition
+        :param fallback_solver: solver of the permeate composition, which is used after a failure,
+        if on_failure is fallback
+        :param max_iterations: maximum number of iterations of the solver at each composition
+        :param time_limit: wall-clock limit of the whole diffusion curve in seconds, by default is not limited
         :return: non-ideal diffusion curve
         """
 
@@ -777,6 +1013,9 @@ class Pervaporation:
             initial_feed_composition.to_weight(self.mixture)
         ]
 
+        kernel = self.get_kernel(calculation_type)
+        deadline = self._get_process_deadline(on_failure, time_limit)
+
         for i in range(number_of_steps + 1):
 
             compositions.append(
@@ -786,18 +1025,30 @@ class Pervaporation:
                 )
             )
 
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=feed_temperature,
-                    composition=compositions[i],
-                    precision=precision,
-                    permeate_temperature=permeate_temperature,
-                    permeate_pressure=permeate_pressure,
-                    first_component_permeance=permeances[i][0],
-                    second_component_permeance=permeances[i][1],
-                    calculation_type=calculation_type,
+            fluxes = self._calculate_process_partial_fluxes(
+                on_failure=on_failure,
+                fallback_solver=fallback_solver,
+                deadline=deadline,
+                feed_temperature=feed_temperature,
+                composition=compositions[i],
+                precision=precision,
+                permeate_temperature=permeate_temperature,
+                permeate_pressure=permeate_pressure,
+                first_component_permeance=permeances[i][0],
+                second_component_permeance=permeances[i][1],
+                calculation_type=calculation_type,
+                kernel=kernel,
+                solver=solver,
+                max_iterations=max_iterations,
+                initial_permeate_composition=get_permeate_composition_from_fluxes(
+                    partial_fluxes[i - 1]
                 )
+                if i > 0
+                else None,
             )
+            if fluxes is None:
+                break
+            partial_fluxes.append(fluxes)
 
             permeances.append(
                 (
@@ -820,8 +1071,8 @@ class Pervaporation:
                 )
             )
 
-        compositions.pop(-1)
-        permeances.pop(-1)
+        del compositions[len(partial_fluxes) :]
+        del permeances[len(partial_fluxes) :]
 
         return DiffusionCurve(
             mixture=self.mixture,
@@ -853,6 +1104,11 @@ class Pervaporation:
         n_second: typing.Optional[int] = None,
         m_second: typing.Optional[int] = None,
         include_zero: bool = False,
+        solver: str = PermeateSolver.fixed_point,
+        on_failure: str = ProcessFailurePolicy.fail,
+        fallback_solver: str = PermeateSolver.brent,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
     ):
         """
         The function models Non-Ideal Isothermal Process
@@ -883,6 +1139,12 @@ class Pervaporation:
          first_component_fraction = 1 second_component_permeance=0 for the second test_components
          for each temperature are added to the measurements in order to improve obtained fits
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy
+        :param fallback_solver: solver of the permeate composition, which is used after a failure,
+        if on_failure is fallback
+        :param max_iterations: maximum number of iterations of the solver at each step
+        :param time_limit: wall-clock limit of the whole process model in seconds, by default is not limited
         :return: ProcessModel object
         """
         for curve in diffusion_curve_set.diffusion_curves:
@@ -1062,20 +1324,34 @@ class Pervaporation:
                 conditions.permeate_temperature, conditions.initial_feed_temperature
             )
 
+        kernel = self.get_kernel(calculation_type)
+        deadline = self._get_process_deadline(on_failure, time_limit)
+
         for step in range(len(time)):
 
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=conditions.initial_feed_temperature,
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=permeances[step][0],
-                    second_component_permeance=permeances[step][1],
-                    calculation_type=calculation_type,
-                )
-            )
+            fluxes = self._calculate_process_partial_fluxes(
+                on_failure=on_failure,
+                fallback_solver=fallback_solver,
+                deadline=deadline,
+                feed_temperature=conditions.initial_feed_temperature,
+                composition=feed_composition[step],
+                precision=precision,
+                permeate_temperature=conditions.permeate_temperature,
+                permeate_pressure=conditions.permeate_pressure,
+                first_component_permeance=permeances[step][0],
+                second_component_permeance=permeances[step][1],
+                calculation_type=calculation_type,
+                kernel=kernel,
+                solver=solver,
+                max_iterations=max_iterations,
+                initial_permeate_composition=permeate_composition[step - 1]
+                if step > 0
+                else None,
+            )
+            if fluxes is None:
+                del time[step:]
+                break
+            partial_fluxes.append(fluxes)
 
             permeate_composition.append(
                 Composition(
@@ -1138,11 +1414,11 @@ class Pervaporation:
         return ProcessModel(
             mixture=self.mixture,
             membrane_name=self.membrane.name,
-            feed_temperature=[conditions.initial_feed_temperature] * number_of_steps,
+            feed_temperature=[conditions.initial_feed_temperature] * len(time),
             feed_compositions=feed_composition,
             permeate_composition=permeate_composition,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
+            permeate_temperature=[conditions.permeate_temperature] * len(time),
+            permeate_pressure=[conditions.permeate_pressure] * len(time),
             feed_mass=feed_mass,
             partial_fluxes=partial_fluxes,
             permeances=permeances,
@@ -1174,6 +1450,11 @@ class Pervaporation:
         n_second: typing.Optional[int] = None,
         m_second: typing.Optional[int] = None,
         include_zero: bool = False,
+        solver: str = PermeateSolver.fixed_point,
+        on_failure: str = ProcessFailurePolicy.fail,
+        fallback_solver: str = PermeateSolver.brent,
+        max_iterations: int = 1000,
+        time_limit: typing.Optional[float] = None,
     ) -> ProcessModel:
         """
         The function models Non-Ideal Non-Isothermal Process
@@ -1205,6 +1486,12 @@ class Pervaporation:
          first_component_fraction = 1 second_component_permeance=0 for the second test_components
          for each temperature are added to the measurements in order to improve obtained fits
         :param calculation_type: Thermodynamic model used for calculation of activity coefficients
+        :param solver: strategy of the permeate composition calculation, see calculate_partial_fluxes
+        :param on_failure: reaction on a failed calculation of the permeate composition, one of ProcessFailurePolicy
+        :param fallback_solver: solver of the permeate composition, which is used after a failure,
+        if on_failure is fallback
+        :param max_iterations: maximum number of iterations of the solver at each step
+        :param time_limit: wall-clock limit of the whole process model in seconds, by default is not limited
         :return: ProcessModel object
         """
         for curve in diffusion_curve_set.diffusion_curves:
@@ -1228,8 +1515,6 @@ class Pervaporation:
 
         feed_evaporation_heat: typing.List[float] = []
 
-        permeate_condensation_heat: typing.List[typing.Optional[float]] = []
-
         feed_mass: typing.List[float] = [conditions.initial_feed_amount]
 
         measurements_first = Measurements.from_diffusion_curves_first(
@@ -1334,48 +1619,58 @@ class Pervaporation:
             )
         )
 
+        kernel = self.get_kernel(calculation_type)
+        deadline = self._get_process_deadline(on_failure, time_limit)
+
         for step in range(len(time)):
 
+            _, vaporisation_heat_1, molar_heat_capacity_1 = (
+                self.mixture.first_component.properties(feed_temperature[step])
+            )
+            _, vaporisation_heat_2, molar_heat_capacity_2 = (
+                self.mixture.second_component.properties(feed_temperature[step])
+            )
             evaporation_heat_1 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
+                vaporisation_heat_1 / self.mixture.first_component.molecular_weight * 1000
             )
             evaporation_heat_2 = (
-                self.mixture.second_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.second_component.molecular_weight
-                * 1000
+                vaporisation_heat_2 / self.mixture.second_component.molecular_weight * 1000
             )
 
             heat_capacity_1 = (
-                self.mixture.first_component.get_specific_heat(feed_temperature[step])
-                / self.mixture.first_component.molecular_weight
+                molar_heat_capacity_1 / self.mixture.first_component.molecular_weight
             )
             heat_capacity_2 = (
-                self.mixture.second_component.get_specific_heat(feed_temperature[step])
-                / self.mixture.second_component.molecular_weight
+                molar_heat_capacity_2 / self.mixture.second_component.molecular_weight
             )
             feed_heat_capacity = (
                 feed_composition[step].first * heat_capacity_1
                 + feed_composition[step].second * heat_capacity_2
             )
 
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=feed_temperature[step],
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=permeances[step][0],
-                    second_component_permeance=permeances[step][1],
-                    calculation_type=calculation_type,
-                )
-            )
+            fluxes = self._calculate_process_partial_fluxes(
+                on_failure=on_failure,
+                fallback_solver=fallback_solver,
+                deadline=deadline,
+                feed_temperature=feed_temperature[step],
+                composition=feed_composition[step],
+                precision=precision,
+                permeate_temperature=conditions.permeate_temperature,
+                permeate_pressure=conditions.permeate_pressure,
+                first_component_permeance=permeances[step][0],
+                second_component_permeance=permeances[step][1],
+                calculation_type=calculation_type,
+                kernel=kernel,
+                solver=solver,
+                max_iterations=max_iterations,
+                initial_permeate_composition=permeate_composition[step - 1]
+                if step > 0
+                else None,
+            )
+            if fluxes is None:
+                del time[step:]
+                break
+            partial_fluxes.append(fluxes)
 
             permeate_composition.append(
                 Composition(
@@ -1387,38 +1682,6 @@ class Pervaporation:
             d_mass_1 = partial_fluxes[step][0] * conditions.membrane_area * delta_hours
             d_mass_2 = partial_fluxes[step][1] * conditions.membrane_area * delta_hours
 
-            if conditions.permeate_temperature is None:
-                permeate_condensation_heat.append(None)
-            else:
-                condensation_heat_1 = (
-                    self.mixture.first_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.first_component.molecular_weight
-                    * 1000
-                )
-                condensation_heat_2 = (
-                    self.mixture.second_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.second_component.molecular_weight
-                    * 1000
-                )
-
-                specific_heat_1 = self.mixture.first_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-                specific_heat_2 = self.mixture.second_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-
-                permeate_condensation_heat.append(
-                    condensation_heat_1 * d_mass_1
-                    + condensation_heat_2 * d_mass_2
-                    + (specific_heat_1 * d_mass_1 + specific_heat_2 * d_mass_2)
-                    * (feed_temperature[step] - conditions.permeate_temperature)
-                )
-
             feed_evaporation_heat.append(
                 evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
             )
@@ -1470,12 +1733,19 @@ class Pervaporation:
         permeances.pop(-1)
         feed_temperature.pop(-1)
 
+        permeate_condensation_heat = self._get_permeate_condensation_heat(
+            conditions=conditions,
+            feed_temperature=feed_temperature,
+            partial_fluxes=partial_fluxes,
+            delta_hours=delta_hours,
+        )
+
         return ProcessModel(
             mixture=self.mixture,
             membrane_name=self.membrane.name,
             feed_temperature=feed_temperature,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
+            permeate_temperature=[conditions.permeate_temperature] * len(time),
+            permeate_pressure=[conditions.permeate_pressure] * len(time),
             feed_compositions=feed_composition,
             permeate_composition=permeate_composition,
             feed_mass=feed_mass,
@@ -0,0 +1,363 @@
+import time
+import typing
+
+import attr
+import numpy
+from scipy import optimize
+
+from ..mixtures import Composition, CompositionType, ThermodynamicKernel, ThermodynamicSurrogate
+
+# step of the finite difference used for thermodynamics without analytic derivatives
+_FINITE_DIFFERENCE_STEP = 1e-7
+# default maximum number of iterations of a solver
+_MAX_ITERATIONS = 1000
+# number of iterations in a row with growing residual, after which a solver is considered diverging
+_DIVERGENCE_STEPS = 5
+
+
+class PermeateSolver:
+    """
+    Class to represent strategies of the permeate composition calculation
+    """
+
+    fixed_point: str = "fixed_point"
+    newton: str = "newton"
+    brent: str = "brent"
+    anderson: str = "anderson"
+
+
+class ProcessFailurePolicy:
+    """
+    Class to represent reactions of process models on a failed calculation of the permeate composition:
+    raise the error (fail), return the ProcessModel of the steps calculated so far (stop)
+    or repeat the calculation with another solver (fallback)
+    """
+
+    fail: str = "fail"
+    stop: str = "stop"
+    fallback: str = "fallback"
+
+
+@attr.s(auto_attribs=True)
+class PermeateBalance:
+    """
+    Balance of the permeate composition at fixed feed conditions and permeances.
+    Weight fraction of the first component in the permeate w is a fixed point of F(w) = J_1(w) / (J_1(w) + J_2(w)),
+    where J_i(w) = P_i * (p_feed_i - p_permeate_i(w)) are partial fluxes at the permeate composition w
+    """
+
+    permeances: typing.Tuple[float, float]
+    feed_partial_pressures: typing.Tuple[float, float]
+    kernel: typing.Union[ThermodynamicKernel, ThermodynamicSurrogate]
+    molecular_weights: typing.Tuple[float, float]
+    permeate_temperature: typing.Optional[float] = None
+    permeate_pressure: typing.Optional[float] = None
+
+    def __attrs_post_init__(self):
+        if self.permeate_temperature is not None and self.permeate_pressure is not None:
+            raise ValueError(
+                "Either permeate temperature or permeate pressure could be stated not both"
+            )
+
+    def permeate_partial_pressures(self, w: float) -> typing.Tuple[float, float]:
+        """
+        :param w: weight fraction of the first component in the permeate
+        :return: partial pressures of the components in the permeate, kPa
+        """
+        if self.permeate_temperature is not None:
+            return self.kernel.get_partial_pressures(
+                self.permeate_temperature, Composition(p=w, type=CompositionType.weight)
+            )
+        if self.permeate_pressure is not None:
+            return self.permeate_pressure * w, self.permeate_pressure * (1 - w)
+        return 0, 0
+
+    def permeate_partial_pressures_derivatives(
+        self, w: float
+    ) -> typing.Tuple[float, float]:
+        """
+        :param w: weight fraction of the first component in the permeate
+        :return: derivatives of partial pressures of the components in the permeate by w, kPa
+        """
+        if self.permeate_temperature is not None:
+            if not hasattr(self.kernel, "get_partial_pressures_with_derivatives"):
+                # the stencil is clipped to [0, 1], so that the difference is one-sided at the bounds
+                upper_w = min(w + _FINITE_DIFFERENCE_STEP, 1)
+                lower_w = max(w - _FINITE_DIFFERENCE_STEP, 0)
+                upper = self.permeate_partial_pressures(upper_w)
+                lower = self.permeate_partial_pressures(lower_w)
+                return tuple(
+                    (upper[i] - lower[i]) / (upper_w - lower_w) for i in range(2)
+                )
+
+            derivatives = self.kernel.get_partial_pressures_with_derivatives(
+                self.permeate_temperature, Composition(p=w, type=CompositionType.weight)
+            ).d_first_component_fraction
+            # derivative of the molar fraction of the first component by its weight fraction
+            m_1, m_2 = self.molecular_weights
+            dx_dw = 1 / (m_1 * m_2 * (w / m_1 + (1 - w) / m_2) ** 2)
+            return derivatives[0] * dx_dw, derivatives[1] * dx_dw
+        if self.permeate_pressure is not None:
+            return self.permeate_pressure, -self.permeate_pressure
+        return 0, 0
+
+    def fluxes(self, w: float) -> typing.Tuple[float, float]:
+        """
+        :param w: weight fraction of the first component in the permeate
+        :return: partial fluxes of the components at the permeate composition
+        """
+        permeate_partial_pressures = self.permeate_partial_pressures(w)
+        return (
+            self.permeances[0]
+            * (self.feed_partial_pressures[0] - permeate_partial_pressures[0]),
+            self.permeances[1]
+            * (self.feed_partial_pressures[1] - permeate_partial_pressures[1]),
+        )
+
+    def __call__(self, w: float) -> float:
+        """
+        :param w: weight fraction of the first component in the permeate
+        :return: weight fraction of the first component in the permeate formed by the partial fluxes, F(w)
+        """
+        fluxes = self.fluxes(w)
+        return fluxes[0] / (fluxes[0] + fluxes[1])
+
+    def derivative(self, w: float) -> typing.Tuple[float, float]:
+        """
+        :param w: weight fraction of the first component in the permeate
+        :return: F(w) and its derivative by w
+        """
+        j_1, j_2 = self.fluxes(w)
+        d_p_1, d_p_2 = self.permeate_partial_pressures_derivatives(w)
+        d_j_1 = -self.permeances[0] * d_p_1
+        d_j_2 = -self.permeances[1] * d_p_2
+        total = j_1 + j_2
+        return j_1 / total, (d_j_1 * j_2 - j_1 * d_j_2) / total**2
+
+
+class PermeateCompositionError(ValueError):
+    """
+    Raised, when the permeate composition could not be calculated;
+    keeps the last iterate of the solver and the history of its residuals F(w) - w
+    """
+
+    def __init__(
+        self, message: str, iterate: float, residuals: typing.List[float]
+    ) -> None:
+        super().__init__(message)
+        self.iterate = iterate
+        self.residuals = residuals
+
+
+@attr.s(auto_attribs=True)
+class IterationMonitor:
+    """
+    Limits of a solver of the permeate composition: maximum number of iterations,
+    wall-clock deadline in terms of time.monotonic() and divergence of the residuals.
+    The solvers record every iterate, that did not converge, and the monitor raises PermeateCompositionError,
+    when any of the limits is exceeded
+    """
+
+    max_iterations: int = _MAX_ITERATIONS
+    deadline: typing.Optional[float] = None
+    iterate: float = numpy.nan
+    residuals: typing.List[float] = attr.Factory(list)
+
+    def __attrs_post_init__(self):
+        if self.max_iterations < 1:
+            raise ValueError("Maximum number of iterations should be positive")
+
+    def error(self, message: str) -> PermeateCompositionError:
+        """
+        :param message: description of the failure
+        :return: PermeateCompositionError with the last iterate and the residuals
+        """
+        return PermeateCompositionError(message, self.iterate, list(self.residuals))
+
+    def check_range(self, w: float, f: float) -> float:
+        """
+        Permeate composition is out of range, when a partial flux is negative
+        :param w: weight fraction of the first component in the permeate
+        :param f: F(w)
+        :return: f, if it is in [0, 1]
+        """
+        if not 0 <= f <= 1:
+            self.iterate = w
+            self.residuals.append(f - w)
+            raise self.error(
+                "Partial fluxes are not defined in the stated conditions range"
+            )
+        return f
+
+    def record(self, w: float, residual: float, check_divergence: bool = True) -> None:
+        """
+        Records an iterate and checks the limits
+        :param w: weight fraction of the first component in the permeate
+        :param residual: F(w) - w
+        :param check_divergence: if True, the absolute residual growing for several iterations in a row
+        is considered a divergence
+        """
+        self.iterate = w
+        self.residuals.append(residual)
+        if not numpy.isfinite(residual):
+            raise self.error(
+                "Partial fluxes are not defined in the stated conditions range"
+            )
+        if len(self.residuals) >= self.max_iterations:
+            raise self.error(
+                "Permeate composition did not converge in %s iterations"
+                % self.max_iterations
+            )
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise self.error(
+                "Permeate composition did not converge in the time limit"
+            )
+        if check_divergence and len(self.residuals) > _DIVERGENCE_STEPS:
+            latest = numpy.abs(self.residuals[-_DIVERGENCE_STEPS - 1 :])
+            if numpy.all(numpy.diff(latest) > 0):
+                raise self.error("Permeate composition diverges")
+
+
+def solve_fixed_point(
+    balance: PermeateBalance, w: float, precision: float, monitor: IterationMonitor
+) -> float:
+    """
+    Successive substitution w = F(w)
+    :param balance: PermeateBalance object
+    :param w: initial weight fraction of the first component in the permeate
+    :param precision: the iterations stop, when the permeate composition changes less than the precision
+    :param monitor: IterationMonitor, which limits the iterations
+    :return: weight fraction of the first component in the permeate
+    """
+    while True:
+        w_new = monitor.check_range(w, balance(w))
+        if abs(w_new - w) < precision:
+            return w_new
+        monitor.record(w, w_new - w)
+        w = w_new
+
+
+def solve_newton(
+    balance: PermeateBalance, w: float, precision: float, monitor: IterationMonitor
+) -> float:
+    """
+    Newton's method for F(w) - w = 0 with analytic derivatives of the partial pressures.
+    Steps leaving [0, 1] or not reducing the residual are replaced with a substitution step w = F(w)
+    :param balance: PermeateBalance object
+    :param w: initial weight fraction of the first component in the permeate
+    :param precision: the iterations stop, when |F(w) - w| is less than the precision
+    :param monitor: IterationMonitor, which limits the iterations
+    :return: weight fraction of the first component in the permeate
+    """
+
+    def derivative(value: float) -> typing.Tuple[float, float]:
+        try:
+            return balance.derivative(value)
+        except (ValueError, ZeroDivisionError) as error:
+            monitor.iterate = value
+            raise monitor.error(
+                "Derivative of the permeate composition could not be calculated: %s"
+                % error
+            ) from error
+
+    f, d_f = derivative(w)
+    while True:
+        residual = monitor.check_range(w, f) - w
+        if abs(residual) < precision:
+            return f
+        monitor.record(w, residual)
+
+        w_new = w - residual / (d_f - 1) if d_f != 1 else f
+        if not 0 <= w_new <= 1:
+            w_new = f
+        f_new, d_f_new = derivative(w_new)
+        if not abs(f_new - w_new) < abs(residual):
+            w_new = f
+            f_new, d_f_new = derivative(w_new)
+        w, f, d_f = w_new, f_new, d_f_new
+
+
+def solve_brent(
+    balance: PermeateBalance, w: float, precision: float, monitor: IterationMonitor
+) -> float:
+    """
+    Brent's method for F(w) - w = 0. The root is bracketed starting from the initial composition
+    with the substitution step, which is doubled until the residual changes its sign,
+    then the root is refined with substitution steps until |F(w) - w| is less than the precision
+    :param balance: PermeateBalance object
+    :param w: initial weight fraction of the first component in the permeate
+    :param precision: the iterations stop, when |F(w) - w| is less than the precision
+    :param monitor: IterationMonitor, which limits the iterations
+    :return: weight fraction of the first component in the permeate
+    """
+
+    def residual(value: float) -> float:
+        result = balance(value) - value
+        # residuals of a bracketing method do not decrease monotonically
+        monitor.record(value, result, check_divergence=False)
+        return result
+
+    lower, lower_residual = w, residual(w)
+    step = lower_residual
+    upper, upper_residual = lower, lower_residual
+    while upper_residual != 0 and upper_residual * lower_residual > 0:
+        if upper in (0, 1) and upper != w:
+            raise monitor.error(
+                "Partial fluxes are not defined in the stated conditions range"
+            )
+        lower, lower_residual = upper, upper_residual
+        upper = min(max(lower + step, 0), 1)
+        upper_residual = residual(upper)
+        step *= 2
+
+    if upper_residual != 0:
+        upper = optimize.brentq(
+            residual,
+            min(lower, upper),
+            max(lower, upper),
+            xtol=precision / 10,
+            maxiter=monitor.max_iterations,
+        )
+    return solve_fixed_point(balance, upper, precision, monitor)
+
+
+def solve_anderson(
+    balance: PermeateBalance, w: float, precision: float, monitor: IterationMonitor
+) -> float:
+    """
+    Anderson-accelerated substitution, for a scalar composition the acceleration of depth one is used,
+    which mixes the two latest iterates to cancel their residuals.
+    Mixed iterates outside [0, 1] are replaced with plain substitution steps
+    :param balance: PermeateBalance object
+    :param w: initial weight fraction of the first component in the permeate
+    :param precision: the iterations stop, when the permeate composition changes less than the precision
+    :param monitor: IterationMonitor, which limits the iterations
+    :return: weight fraction of the first component in the permeate
+    """
+    previous: typing.Optional[typing.Tuple[float, float]] = None
+    while True:
+        f = monitor.check_range(w, balance(w))
+        residual = f - w
+        if abs(residual) < precision:
+            return f
+        monitor.record(w, residual)
+
+        w_new = f
+        if previous is not None and residual != previous[1]:
+            gamma = residual / (residual - previous[1])
+            w_new = f - gamma * (f - previous[0])
+            if not 0 <= w_new <= 1:
+                w_new = f
+        previous = f, residual
+        w = w_new
+
+
+# solvers of the permeate composition by the names, which are accepted by Pervaporation.calculate_partial_fluxes
+PERMEATE_SOLVERS: typing.Dict[
+    str, typing.Callable[[PermeateBalance, float, float, IterationMonitor], float]
+] = {
+    PermeateSolver.fixed_point: solve_fixed_point,
+    PermeateSolver.newton: solve_newton,
+    PermeateSolver.brent: solve_brent,
+    PermeateSolver.anderson: solve_anderson,
+}
@@ -8,7 +8,7 @@ import numpy
 import pandas
 
 from ..conditions import Conditions
-from ..mixtures import Composition, Mixture, Mixtures
+from ..mixtures import Composition, CompositionArray, Mixture, Mixtures
 from ..optimizer import PervaporationFunction
 from ..permeance import Permeance, Units
 from ..plotting import plot_graph
@@ -45,8 +45,8 @@ class ProcessModel:
     mixture: Mixture
     membrane_name: str
     feed_temperature: typing.List[float]
-    feed_compositions: typing.List[Composition]
-    permeate_composition: typing.List[Composition]
+    feed_compositions: typing.Union[typing.List[Composition], CompositionArray]
+    permeate_composition: typing.Union[typing.List[Composition], CompositionArray]
     permeate_temperature: typing.List[float]
     permeate_pressure: typing.List[float]
     feed_mass: typing.List[float]
@@ -1,11 +1,14 @@
 from .utils import (
     HeatCapacityConstants,
+    MargulesParameters,
     NRTLParameters,
     R,
     VaporPressureConstants,
     VPConstantsType,
     UNIQUACConstants,
     UNIQUACParameters,
+    VanLaarParameters,
+    WilsonParameters,
 )
 
 __all__ = [
@@ -16,4 +19,7 @@ __all__ = [
     "VPConstantsType",
     "UNIQUACConstants",
     "UNIQUACParameters",
+    "MargulesParameters",
+    "VanLaarParameters",
+    "WilsonParameters",
 ]
@@ -32,6 +32,19 @@ class NRTLParameters:
     a12: typing.Optional[float] = 0
     a21: typing.Optional[float] = 0
 
+    @classmethod
+    def from_array(
+            cls, array: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> "NRTLParameters":
+        assert len(array) == 5
+        return cls(
+            g12=array[0],
+            g21=array[1],
+            alpha12=array[2],
+            a12=array[3],
+            a21=array[4],
+        )
+
 
 @attr.s(auto_attribs=True)
 class UNIQUACConstants:
@@ -66,6 +79,54 @@ class UNIQUACParameters:
         )
 
 
+@attr.s(auto_attribs=True)
+class MargulesParameters:
+    # two-parameter Margules equation, A_ij = a_ij + b_ij / T
+    a12: float
+    a21: float
+    b12: float = 0
+    b21: float = 0
+
+    @classmethod
+    def from_array(
+            cls, array: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> "MargulesParameters":
+        assert len(array) == 4
+        return cls(a12=array[0], a21=array[1], b12=array[2], b21=array[3])
+
+
+@attr.s(auto_attribs=True)
+class VanLaarParameters:
+    # Van Laar equation, A_ij = a_ij + b_ij / T
+    a12: float
+    a21: float
+    b12: float = 0
+    b21: float = 0
+
+    @classmethod
+    def from_array(
+            cls, array: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> "VanLaarParameters":
+        assert len(array) == 4
+        return cls(a12=array[0], a21=array[1], b12=array[2], b21=array[3])
+
+
+@attr.s(auto_attribs=True)
+class WilsonParameters:
+    # Wilson equation, Lambda_ij = exp(a_ij + b_ij / T)
+    a12: float
+    a21: float
+    b12: float = 0
+    b21: float = 0
+
+    @classmethod
+    def from_array(
+            cls, array: typing.Union[typing.List[float], numpy.ndarray]
+    ) -> "WilsonParameters":
+        assert len(array) == 4
+        return cls(a12=array[0], a21=array[1], b12=array[2], b21=array[3])
+
+
 @attr.s(auto_attribs=True)
 class HeatCapacityConstants:
     a: float = attr.ib(converter=lambda value: float(value))  # type: ignore
@@ -1,3 +1,5 @@
+import numpy
+
 from pyvaporation.components import Component
 from pyvaporation.utils import HeatCapacityConstants, VaporPressureConstants
 
@@ -127,3 +129,46 @@ def test_get_cooling_heat():
     assert abs(test_component.get_cooling_heat(333, 273) - 2019.442222) < 2.5e-1
     assert abs(test_component.get_cooling_heat(323, 273) - 1681.011314) < 2.5e-1
     assert abs(test_component.get_cooling_heat(313, 273) - 1343.342474) < 2.5e-1
+
+
+def test_vapor_pressure_derivative():
+    for component in [test_component, test_component_2]:
+        for temperature in [293.15, 323.15, 373.15]:
+            finite_difference = (
+                component.get_vapor_pressure(temperature + 1e-3)
+                - component.get_vapor_pressure(temperature - 1e-3)
+            ) / 2e-3
+            assert (
+                abs(
+                    component.get_vapor_pressure_derivative(temperature)
+                    - finite_difference
+                )
+                < abs(finite_difference) * 1e-6
+            )
+
+
+def test_properties():
+    temperatures = numpy.array([[293.15, 313.15], [333.15, 373.15]])
+    for component in [test_component, test_component_2]:
+        vapour_pressure, vaporisation_heat, specific_heat = component.properties(
+            temperatures
+        )
+        assert vapour_pressure.shape == temperatures.shape
+        for index in numpy.ndindex(temperatures.shape):
+            temperature = float(temperatures[index])
+            assert abs(
+                vapour_pressure[index] - component.get_vapor_pressure(temperature)
+            ) < 1e-12 * vapour_pressure[index]
+            assert abs(
+                vaporisation_heat[index]
+                - component.get_vaporisation_heat(temperature)
+            ) < 1e-12 * vaporisation_heat[index]
+            assert specific_heat[index] == component.get_specific_heat(temperature)
+
+        assert numpy.allclose(
+            component.get_vapor_pressure(temperatures), vapour_pressure, rtol=1e-12
+        )
+        assert numpy.allclose(
+            component.get_vaporisation_heat(temperatures), vaporisation_heat, rtol=1e-12
+        )
+        assert component.get_cooling_heat(temperatures, 273.15).shape == (2, 2)
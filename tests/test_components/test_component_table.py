@@ -0,0 +1,100 @@
+import numpy
+import pandas
+import pytest
+
+from pyvaporation.components import Component, Components, ComponentTable
+from pyvaporation.utils import HeatCapacityConstants, VaporPressureConstants
+
+H2O_frost = Component(
+    name="H2O_frost",
+    molecular_weight=18.02,
+    vapour_pressure_constants=VaporPressureConstants(
+        a=16.5191,
+        b=-3937.6553,
+        c=-190231.9062,
+        type="frost",
+    ),
+    heat_capacity_constants=Components.H2O.heat_capacity_constants,
+)
+
+
+def test_component_table():
+    components = [Components.H2O, H2O_frost, Components.EtOH, Components.Toluene]
+    table = ComponentTable.from_components(components)
+    assert len(table) == 4
+    assert list(table.antoine_indices) == [0, 2, 3]
+    assert list(table.frost_indices) == [1]
+    assert table.index("EtOH") == 2
+    with pytest.raises(ValueError):
+        table.index("MTBE")
+
+    temperatures = numpy.linspace(290, 370, 9)[:, None] + numpy.array([0, 0.5])
+    vapour_pressure, vaporisation_heat, specific_heat = table.properties(temperatures)
+    assert vapour_pressure.shape == (9, 2, 4)
+
+    for i, component in enumerate(components):
+        assert numpy.allclose(
+            vapour_pressure[..., i],
+            component.get_vapor_pressure(temperatures),
+            rtol=1e-12,
+        )
+        assert numpy.allclose(
+            vaporisation_heat[..., i],
+            component.get_vaporisation_heat(temperatures),
+            rtol=1e-12,
+        )
+        assert numpy.allclose(
+            specific_heat[..., i],
+            component.get_specific_heat(temperatures),
+            rtol=1e-12,
+        )
+
+    assert numpy.array_equal(table.get_vapor_pressure(temperatures), vapour_pressure)
+    assert numpy.array_equal(
+        table.get_vaporisation_heat(temperatures), vaporisation_heat
+    )
+    assert numpy.array_equal(table.get_specific_heat(temperatures), specific_heat)
+    assert table.get_vapor_pressure(333.15).shape == (4,)
+
+
+def test_component_table_defaults():
+    table = ComponentTable.from_components()
+    assert table.names[:3] == ["H2O", "MeOH", "EtOH"]
+    assert table.get_vapor_pressure(373.15)[table.index("H2O")] == pytest.approx(
+        101.325, rel=1e-2
+    )
+
+    with pytest.raises(ValueError):
+        ComponentTable.from_components([Components.H2O, Components.H2O])
+    with pytest.raises(ValueError):
+        ComponentTable.from_components([])
+
+
+def test_component_table_csv(tmp_path):
+    table = ComponentTable.from_components(
+        [Components.MeOH, H2O_frost, Components.DMC]
+    )
+    table.to_csv(tmp_path / "components.csv")
+    loaded = ComponentTable.from_csv(tmp_path / "components.csv")
+
+    assert loaded.names == table.names
+    assert numpy.array_equal(loaded.frost_indices, table.frost_indices)
+    temperatures = numpy.linspace(290, 370, 9)
+    for expected, calculated in zip(
+        table.properties(temperatures), loaded.properties(temperatures)
+    ):
+        assert numpy.allclose(expected, calculated, rtol=1e-14)
+
+    # empty type of the equation stands for Antoine equation
+    frame = pandas.read_csv(tmp_path / "components.csv")
+    frame["vapour_pressure_type"] = [None, "frost", None]
+    frame.to_csv(tmp_path / "components.csv", index=False)
+    assert list(
+        ComponentTable.from_csv(tmp_path / "components.csv").antoine_indices
+    ) == [0, 2]
+
+    frame.drop(columns="heat_capacity_d").to_csv(
+        tmp_path / "components.csv", index=False
+    )
+    with pytest.raises(ValueError):
+        ComponentTable.from_csv(tmp_path / "components.csv")
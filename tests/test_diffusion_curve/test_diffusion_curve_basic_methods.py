@@ -3,7 +3,8 @@ from pathlib import Path
 from pytest import fixture
 
 from pyvaporation.membrane import Membrane
-from pyvaporation.mixtures import Composition
+from pyvaporation.diffusion_curve import DiffusionCurve
+from pyvaporation.mixtures import Composition, CompositionArray
 from pyvaporation.permeance import Permeance
 
 
@@ -96,3 +97,30 @@ def test_get_selectivity(diffusion_curve):
 
     for i in range(len(diffusion_curve.get_selectivity)):
         assert (diffusion_curve.get_selectivity[i] - validation_selectivity[i]) < 1e-2
+
+
+def test_composition_array_feed(diffusion_curve):
+    curve = DiffusionCurve(
+        mixture=diffusion_curve.mixture,
+        membrane_name=diffusion_curve.membrane_name,
+        feed_temperature=diffusion_curve.feed_temperature,
+        feed_compositions=CompositionArray.from_compositions(
+            diffusion_curve.feed_compositions
+        ),
+        partial_fluxes=diffusion_curve.partial_fluxes,
+    )
+
+    assert len(curve) == len(diffusion_curve)
+    assert curve.permeate_composition == diffusion_curve.permeate_composition
+    for i in range(len(curve)):
+        assert (
+            abs(
+                curve.get_permeances[i][0].value
+                - diffusion_curve.get_permeances[i][0].value
+            )
+            < 1e-12
+        )
+        assert (
+            abs(curve.get_separation_factor[i] - diffusion_curve.get_separation_factor[i])
+            < 1e-9
+        )
@@ -0,0 +1,186 @@
+import attr
+import numpy
+import pytest
+
+from pyvaporation.mixtures import (
+    ACTIVITY_COEFFICIENT_MODELS,
+    Composition,
+    CompositionType,
+    MargulesModel,
+    Mixture,
+    Mixtures,
+    VanLaarModel,
+    WilsonModel,
+    calculate_activity_coefficients_array,
+    fit_activity_coefficient_model,
+    get_partial_pressures,
+    register_activity_coefficient_model,
+)
+from pyvaporation.mixtures.mixture import _InteractionTermsModel
+from pyvaporation.mixtures.uniquac_fitting import VLEPoints
+from pyvaporation.utils import MargulesParameters, VanLaarParameters, WilsonParameters
+
+MODELS = [
+    MargulesModel(a=(1.2, 0.6), b=(100, -50)),
+    VanLaarModel(a=(1.2, 0.6), b=(100, -50)),
+    WilsonModel(a=(-0.5, 0.3), b=(100, -200)),
+]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_model_derivatives(model):
+    x_1 = numpy.linspace(0.05, 0.95, 7)
+    temperature = numpy.linspace(320, 360, 7)
+    (
+        ln_activity_coefficients,
+        fraction_derivatives,
+        temperature_derivatives,
+    ) = model.ln_activity_coefficients_derivatives(x_1, temperature)
+
+    for i in range(2):
+        assert numpy.allclose(
+            ln_activity_coefficients[i],
+            model.ln_activity_coefficients(x_1, temperature)[i],
+        )
+        assert numpy.allclose(
+            fraction_derivatives[i],
+            (
+                model.ln_activity_coefficients(x_1 + 1e-6, temperature)[i]
+                - model.ln_activity_coefficients(x_1 - 1e-6, temperature)[i]
+            )
+            / 2e-6,
+            atol=1e-8,
+        )
+        assert numpy.allclose(
+            temperature_derivatives[i],
+            (
+                model.ln_activity_coefficients(x_1, temperature + 1e-4)[i]
+                - model.ln_activity_coefficients(x_1, temperature - 1e-4)[i]
+            )
+            / 2e-4,
+            atol=1e-10,
+        )
+
+    # Gibbs-Duhem equation
+    assert numpy.allclose(
+        x_1 * fraction_derivatives[0] + (1 - x_1) * fraction_derivatives[1], 0
+    )
+    # pure components are ideal
+    assert model.ln_activity_coefficients(1.0, 330)[0] == pytest.approx(0)
+    assert model.ln_activity_coefficients(0.0, 330)[1] == pytest.approx(0)
+
+
+@pytest.mark.parametrize(
+    "calculation_type, parameters",
+    [
+        ("Margules", MargulesParameters(a12=1.2, a21=0.6, b12=100, b21=-50)),
+        ("VanLaar", VanLaarParameters(a12=1.2, a21=0.6, b12=100, b21=-50)),
+        ("Wilson", WilsonParameters(a12=-0.5, a21=0.3, b12=100, b21=-200)),
+    ],
+)
+def test_fit_recovers_parameters(calculation_type, parameters):
+    model = ACTIVITY_COEFFICIENT_MODELS[calculation_type].from_parameters(parameters)
+    x_1 = numpy.linspace(0.05, 0.95, 20)
+    temperatures = numpy.tile([320.0, 340.0, 360.0, 330.0], 5)
+    ln_activity_coefficients = numpy.stack(
+        model.ln_activity_coefficients(x_1, temperatures), axis=-1
+    )
+    # not finite values are ignored
+    ln_activity_coefficients[0, 0] = numpy.nan
+
+    fitted = model.fit(x_1, temperatures, ln_activity_coefficients)
+    assert isinstance(fitted, type(parameters))
+    assert numpy.allclose(
+        attr.astuple(fitted), attr.astuple(parameters), rtol=1e-5, atol=1e-5
+    )
+
+    # isothermal data are fitted without temperature dependence
+    isothermal = model.fit(
+        x_1, numpy.full(20, 330.0), ln_activity_coefficients
+    )
+    assert isothermal.b12 == 0 and isothermal.b21 == 0
+
+
+def test_fit_activity_coefficient_model():
+    points = VLEPoints.from_csv(path="tests/VLE_data/binary/H2O_EtOH.csv")
+    errors = {}
+    for calculation_type in ["Margules", "VanLaar", "Wilson"]:
+        parameters = fit_activity_coefficient_model(points, calculation_type)
+        mixture = Mixture(
+            name="H2O_EtOH",
+            first_component=points.components[0],
+            second_component=points.components[1],
+            parameters={calculation_type: parameters},
+        )
+        calculated = numpy.stack(
+            [
+                get_partial_pressures(
+                    point.temperature, mixture, point.composition, calculation_type
+                )
+                for point in points
+            ]
+        )
+        errors[calculation_type] = numpy.sqrt(
+            ((calculated - points.pressures) ** 2).sum() / len(points)
+        )
+
+    assert errors["Margules"] < 0.5
+    assert errors["VanLaar"] < 0.5
+    assert errors["Wilson"] < 0.5
+
+
+def test_registered_models():
+    mixture = attr.evolve(
+        Mixtures.H2O_EtOH,
+        parameters={"Margules": MargulesParameters(a12=1.2, a21=0.6)},
+    )
+    composition = Composition(p=0.3, type=CompositionType.molar)
+
+    margules = get_partial_pressures(333.15, mixture, composition, "Margules")
+    assert margules[0] > 0 and margules[1] > 0
+    # parameters of other models are kept
+    assert get_partial_pressures(
+        333.15, mixture, composition, "NRTL"
+    ) == get_partial_pressures(333.15, Mixtures.H2O_EtOH, composition, "NRTL")
+
+    with pytest.raises(ValueError):
+        get_partial_pressures(333.15, mixture, composition, "Wilson")
+    with pytest.raises(ValueError):
+        get_partial_pressures(333.15, mixture, composition, "Ideal")
+
+    @register_activity_coefficient_model("Ideal")
+    class IdealModel(MargulesModel):
+        @classmethod
+        def from_mixture(cls, mixture: Mixture) -> "IdealModel":
+            return cls(a=(0, 0), b=(0, 0))
+
+    try:
+        assert numpy.allclose(
+            calculate_activity_coefficients_array(
+                numpy.array([313.15, 333.15]), mixture, [0.3, 0.6], "Ideal"
+            ),
+            1,
+        )
+    finally:
+        del ACTIVITY_COEFFICIENT_MODELS["Ideal"]
+
+    with pytest.raises(ValueError):
+        Mixture(
+            name="H2O_EtOH",
+            first_component=mixture.first_component,
+            second_component=mixture.second_component,
+        )
+
+
+def test_incomplete_model():
+    # a model, which does not define all the terms, fails at construction
+    @attr.s(auto_attribs=True)
+    class IncompleteModel(_InteractionTermsModel):
+        name = "Incomplete"
+        parameters_type = MargulesParameters
+
+        def _terms(self, temperature):
+            return self.a[0] + self.b[0] / temperature, self.a[1] + self.b[1] / temperature
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompleteModel(a=(1.2, 0.6), b=(100, -50))
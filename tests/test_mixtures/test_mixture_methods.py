@@ -1,10 +1,19 @@
+import numpy
+import pytest
+
 from pyvaporation.components import Component
 from pyvaporation.mixtures import (
     Composition,
+    CompositionArray,
     CompositionType,
     Mixture,
+    Mixtures,
+    UNIQUACModel,
+    calculate_activity_coefficients_array,
     get_partial_pressures,
+    get_partial_pressures_with_derivatives,
 )
+from pyvaporation.mixtures.mixture import calculate_activity_coefficients
 from pyvaporation.utils import (
     HeatCapacityConstants,
     NRTLParameters,
@@ -284,4 +293,262 @@ def test_get_uniquac_partial_pressures_from_weight_composition():
                 - tested_partial_pressures[i][1]
             )
             < 1e-3
-        )
\ No newline at end of file
+        )
+
+def test_nrtl_activity_coefficients_array():
+    fractions = numpy.linspace(0, 1, 21)
+    temperatures = numpy.array([303.15, 313.15, 333.15])
+
+    tested_activity_coefficients = calculate_activity_coefficients_array(
+        temperature=temperatures[:, None],
+        mixture=test_mixture,
+        first_component_fraction=fractions[None, :],
+    )
+
+    assert tested_activity_coefficients.shape == (3, 21, 2)
+
+    for i, temperature in enumerate(temperatures):
+        for j, fraction in enumerate(fractions):
+            validation_activity_coefficients = calculate_activity_coefficients(
+                temperature=temperature,
+                mixture=test_mixture,
+                composition=Composition(p=fraction, type=CompositionType.molar),
+            )
+            assert numpy.allclose(
+                tested_activity_coefficients[i, j],
+                validation_activity_coefficients,
+                rtol=1e-12,
+            )
+
+
+def test_activity_coefficients_array_validation():
+    with pytest.raises(ValueError):
+        calculate_activity_coefficients_array(
+            temperature=313,
+            mixture=test_mixture,
+            first_component_fraction=numpy.array([0.5, 1.2]),
+        )
+
+
+def test_uniquac_activity_coefficients_array():
+    fractions = numpy.linspace(0, 1, 21)
+    temperatures = numpy.array([303.15, 313.15, 333.15])
+
+    tested_activity_coefficients = calculate_activity_coefficients_array(
+        temperature=temperatures[:, None],
+        mixture=test_mixture,
+        first_component_fraction=fractions[None, :],
+        calculation_type="UNIQUAC",
+    )
+
+    assert tested_activity_coefficients.shape == (3, 21, 2)
+    assert numpy.all(numpy.isfinite(tested_activity_coefficients))
+
+    for i, temperature in enumerate(temperatures):
+        for j, fraction in enumerate(fractions):
+            validation_activity_coefficients = calculate_activity_coefficients(
+                temperature=temperature,
+                mixture=test_mixture,
+                composition=Composition(p=fraction, type=CompositionType.molar),
+                calculation_type="UNIQUAC",
+            )
+            assert numpy.allclose(
+                tested_activity_coefficients[i, j],
+                validation_activity_coefficients,
+                rtol=1e-12,
+            )
+
+
+def test_uniquac_model_reuse():
+    model = UNIQUACModel.from_mixture(test_mixture)
+    fractions = numpy.array([0, 0.25, 0.5, 0.75, 1])
+
+    assert numpy.allclose(
+        model.activity_coefficients(fractions, 313),
+        calculate_activity_coefficients_array(
+            temperature=313,
+            mixture=test_mixture,
+            first_component_fraction=fractions,
+            calculation_type="UNIQUAC",
+        ),
+    )
+
+    with pytest.raises(ValueError):
+        UNIQUACModel.from_mixture(
+            Mixture(
+                name="",
+                first_component=test_component_1,
+                second_component=test_component_2,
+                nrtl_params=nrtl_params,
+            )
+        )
+
+
+def test_thermodynamic_kernel():
+    fractions = numpy.linspace(0, 1, 11)
+    temperatures = numpy.array([313, 333])
+
+    for calculation_type in ["NRTL", "UNIQUAC"]:
+        kernel = test_mixture.get_kernel(calculation_type)
+
+        assert numpy.allclose(
+            kernel.psat(temperatures),
+            [
+                [
+                    test_component_1.get_vapor_pressure(t),
+                    test_component_2.get_vapor_pressure(t),
+                ]
+                for t in temperatures
+            ],
+        )
+
+        tested_partial_pressures = kernel.partial_pressures(
+            fractions[None, :], temperatures[:, None]
+        )
+        assert tested_partial_pressures.shape == (2, 11, 2)
+
+        for i, temperature in enumerate(temperatures):
+            for j in range(11):
+                for composition in [
+                    test_composition_list_molar[j],
+                    test_composition_list_weight[j],
+                ]:
+                    validation_partial_pressures = get_partial_pressures(
+                        temperature, test_mixture, composition, calculation_type
+                    )
+                    assert numpy.allclose(
+                        kernel.get_partial_pressures(temperature, composition),
+                        validation_partial_pressures,
+                        rtol=1e-10,
+                    )
+                assert numpy.allclose(
+                    tested_partial_pressures[i, j],
+                    get_partial_pressures(
+                        temperature,
+                        test_mixture,
+                        test_composition_list_molar[j],
+                        calculation_type,
+                    ),
+                    rtol=1e-10,
+                )
+
+    with pytest.raises(ValueError):
+        test_mixture.get_kernel("Wilson")
+
+
+@pytest.mark.parametrize("calculation_type", ["NRTL", "UNIQUAC"])
+def test_partial_pressures_derivatives(calculation_type):
+    for mixture in [Mixtures.H2O_EtOH, Mixtures.MeOH_Toluene]:
+        for x in [0.05, 0.3, 0.7, 0.95]:
+            for temperature in [303.15, 343.15]:
+                composition = Composition(p=x, type=CompositionType.molar)
+                result = get_partial_pressures_with_derivatives(
+                    temperature, mixture, composition, calculation_type
+                )
+
+                assert numpy.allclose(
+                    result.partial_pressures,
+                    get_partial_pressures(
+                        temperature, mixture, composition, calculation_type
+                    ),
+                    rtol=1e-12,
+                )
+
+                d_fraction = numpy.subtract(
+                    get_partial_pressures(
+                        temperature,
+                        mixture,
+                        Composition(p=x + 1e-6, type=CompositionType.molar),
+                        calculation_type,
+                    ),
+                    get_partial_pressures(
+                        temperature,
+                        mixture,
+                        Composition(p=x - 1e-6, type=CompositionType.molar),
+                        calculation_type,
+                    ),
+                ) / 2e-6
+                d_temperature = numpy.subtract(
+                    get_partial_pressures(
+                        temperature + 1e-3, mixture, composition, calculation_type
+                    ),
+                    get_partial_pressures(
+                        temperature - 1e-3, mixture, composition, calculation_type
+                    ),
+                ) / 2e-3
+
+                assert numpy.allclose(
+                    result.d_first_component_fraction, d_fraction, rtol=1e-5, atol=1e-6
+                )
+                assert numpy.allclose(
+                    result.d_temperature, d_temperature, rtol=1e-5, atol=1e-6
+                )
+
+    weight = Composition(p=0.3, type=CompositionType.weight)
+    assert get_partial_pressures_with_derivatives(
+        323.15, Mixtures.H2O_EtOH, weight, calculation_type
+    ) == get_partial_pressures_with_derivatives(
+        323.15, Mixtures.H2O_EtOH, weight.to_molar(Mixtures.H2O_EtOH), calculation_type
+    )
+
+
+def test_composition_array():
+    compositions = CompositionArray(
+        p=[i / 10 for i in range(11)], type=CompositionType.weight
+    )
+    molar = compositions.to_molar(Mixtures.H2O_EtOH)
+
+    assert len(compositions) == 11
+    assert molar.type == CompositionType.molar
+    assert compositions[3] == Composition(p=0.3, type=CompositionType.weight)
+    assert compositions[2:4] == CompositionArray(
+        p=[0.2, 0.3], type=CompositionType.weight
+    )
+    assert numpy.allclose(
+        molar.p, [c.to_molar(Mixtures.H2O_EtOH).p for c in compositions], rtol=1e-12
+    )
+    assert numpy.allclose(
+        molar.to_weight(Mixtures.H2O_EtOH).p, compositions.p, rtol=1e-12
+    )
+    assert molar.to_molar(Mixtures.H2O_EtOH) is molar
+
+    packed = CompositionArray.from_compositions(
+        [Composition(p=0.1, type="weight"), Composition(p=0.1, type="molar")],
+        mixture=Mixtures.H2O_EtOH,
+    )
+    assert packed.type == CompositionType.molar
+    assert packed.p[1] == 0.1
+    assert (
+        CompositionArray.from_compositions(compositions.to_compositions())
+        == compositions
+    )
+
+    with pytest.raises(ValueError):
+        CompositionArray(p=[0.5, 1.1], type=CompositionType.molar)
+    with pytest.raises(ValueError):
+        CompositionArray.from_compositions(
+            [Composition(p=0.1, type="weight"), Composition(p=0.1, type="molar")]
+        )
+
+    for calculation_type in ["NRTL", "UNIQUAC"]:
+        partial_pressures = get_partial_pressures(
+            323.15, Mixtures.H2O_EtOH, compositions, calculation_type
+        )
+        activity_coefficients = calculate_activity_coefficients(
+            323.15, Mixtures.H2O_EtOH, compositions, calculation_type
+        )
+        for i, composition in enumerate(compositions):
+            assert numpy.allclose(
+                (partial_pressures[0][i], partial_pressures[1][i]),
+                get_partial_pressures(
+                    323.15, Mixtures.H2O_EtOH, composition, calculation_type
+                ),
+                rtol=1e-12,
+            )
+            assert numpy.allclose(
+                (activity_coefficients[0][i], activity_coefficients[1][i]),
+                calculate_activity_coefficients(
+                    323.15, Mixtures.H2O_EtOH, composition, calculation_type
+                ),
+                rtol=1e-12,
+            )
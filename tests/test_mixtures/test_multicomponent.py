@@ -0,0 +1,181 @@
+import attr
+import numpy
+import pytest
+
+from pyvaporation.components import Components
+from pyvaporation.mixtures import (
+    Mixture,
+    Mixtures,
+    MulticomponentMixture,
+    MulticomponentNRTLModel,
+    MulticomponentUNIQUACModel,
+    NRTLModel,
+    UNIQUACModel,
+    calculate_multicomponent_activity_coefficients,
+)
+from pyvaporation.utils import NRTLParameters, UNIQUACParameters
+
+# Interaction parameters of water and MTBE are illustrative, they are only used to close the ternary system
+H2O_MTBE = Mixture(
+    name="H2O_MTBE",
+    first_component=Components.H2O,
+    second_component=Components.MTBE,
+    nrtl_params=NRTLParameters(g12=12000, g21=3500, alpha12=0.3),
+    uniquac_params=UNIQUACParameters(
+        alpha_12=300, alpha_21=50, beta_12=0, beta_21=0, z=10
+    ),
+)
+
+H2O_MeOH_MTBE = MulticomponentMixture(
+    name="H2O_MeOH_MTBE",
+    components=[Components.H2O, Components.MeOH, Components.MTBE],
+    binary_mixtures=[Mixtures.H2O_MeOH, Mixtures.MeOH_MTBE, H2O_MTBE],
+)
+
+
+def _ternary_fractions() -> numpy.ndarray:
+    x_1, x_2 = numpy.meshgrid(numpy.linspace(0, 1, 11), numpy.linspace(0, 1, 11))
+    fractions = numpy.stack((x_1, x_2, 1 - x_1 - x_2), axis=-1).reshape(-1, 3)
+    return fractions[fractions[:, 2] >= -1e-12].clip(0, 1)
+
+
+def test_binary_special_case():
+    fractions = numpy.linspace(0.01, 0.99, 25)
+    temperatures = numpy.linspace(300, 360, 25)
+    binary_fractions = numpy.stack((fractions, 1 - fractions), axis=-1)
+
+    for mixture in [Mixtures.H2O_EtOH, Mixtures.MeOH_Toluene]:
+        multicomponent_mixture = MulticomponentMixture.from_mixture(mixture)
+
+        assert numpy.allclose(
+            MulticomponentNRTLModel.from_mixture(
+                multicomponent_mixture
+            ).ln_activity_coefficients(binary_fractions, temperatures),
+            numpy.stack(
+                NRTLModel.from_mixture(mixture).ln_activity_coefficients(
+                    fractions, temperatures
+                ),
+                axis=-1,
+            ),
+            rtol=1e-12,
+            atol=1e-14,
+        )
+
+        # the residual part of the second component differs, see UNIQUACModel
+        assert numpy.allclose(
+            MulticomponentUNIQUACModel.from_mixture(
+                multicomponent_mixture
+            ).ln_activity_coefficients(binary_fractions, temperatures)[:, 0],
+            UNIQUACModel.from_mixture(mixture).ln_activity_coefficients(
+                fractions, temperatures
+            )[0],
+            rtol=1e-12,
+            atol=1e-14,
+        )
+
+
+@pytest.mark.parametrize("calculation_type", ["NRTL", "UNIQUAC"])
+def test_ternary_mixture(calculation_type):
+    fractions = _ternary_fractions()
+    activity_coefficients = calculate_multicomponent_activity_coefficients(
+        333.15, H2O_MeOH_MTBE, fractions, calculation_type
+    )
+    assert activity_coefficients.shape == fractions.shape
+    assert numpy.all(numpy.isfinite(activity_coefficients))
+
+    # components are ideal in their pure state
+    for i in range(3):
+        pure = numpy.zeros(3)
+        pure[i] = 1
+        assert abs(
+            calculate_multicomponent_activity_coefficients(
+                333.15, H2O_MeOH_MTBE, pure, calculation_type
+            )[i]
+            - 1
+        ) < 1e-12
+
+    # without MTBE the mixture is a binary one
+    binary = MulticomponentMixture(
+        name="H2O_MeOH",
+        components=[Components.H2O, Components.MeOH],
+        binary_mixtures=[Mixtures.H2O_MeOH],
+    )
+    binary_fractions = numpy.stack(
+        (numpy.linspace(0, 1, 11), numpy.linspace(1, 0, 11)), axis=-1
+    )
+    assert numpy.allclose(
+        calculate_multicomponent_activity_coefficients(
+            333.15,
+            H2O_MeOH_MTBE,
+            numpy.concatenate((binary_fractions, numpy.zeros((11, 1))), axis=-1),
+            calculation_type,
+        )[:, :2],
+        calculate_multicomponent_activity_coefficients(
+            333.15, binary, binary_fractions, calculation_type
+        ),
+        rtol=1e-12,
+    )
+
+    # Gibbs-Duhem equation along a direction of composition change
+    if calculation_type == "NRTL":
+        model = MulticomponentNRTLModel.from_mixture(H2O_MeOH_MTBE)
+    else:
+        model = MulticomponentUNIQUACModel.from_mixture(H2O_MeOH_MTBE)
+    point = numpy.array([0.3, 0.5, 0.2])
+    direction = numpy.array([1, -0.4, -0.6]) * 1e-6
+    derivative = (
+        model.ln_activity_coefficients(point + direction, 333.15)
+        - model.ln_activity_coefficients(point - direction, 333.15)
+    ) / 2e-6
+    assert abs(point @ derivative) < 1e-6
+
+    # batches of compositions and temperatures are broadcast
+    batch = calculate_multicomponent_activity_coefficients(
+        numpy.array([[313.15], [333.15]]),
+        H2O_MeOH_MTBE,
+        fractions[None, :5],
+        calculation_type,
+    )
+    assert batch.shape == (2, 5, 3)
+    assert numpy.allclose(batch[1], activity_coefficients[:5])
+
+
+def test_multicomponent_validation():
+    with pytest.raises(ValueError):
+        MulticomponentMixture(
+            name="H2O_MeOH_MTBE",
+            components=[Components.H2O, Components.MeOH, Components.MTBE],
+            binary_mixtures=[Mixtures.H2O_MeOH, Mixtures.MeOH_MTBE],
+        )
+
+    # default UNIQUAC parameters of water - ethanol are fitted with a different coordination number
+    H2O_EtOH_ETBE = MulticomponentMixture(
+        name="H2O_EtOH_ETBE",
+        components=[Components.H2O, Components.EtOH, Components.ETBE],
+        binary_mixtures=[
+            Mixtures.H2O_EtOH,
+            Mixtures.EtOH_ETBE,
+            attr.evolve(
+                H2O_MTBE, name="H2O_ETBE", second_component=Components.ETBE
+            ),
+        ],
+    )
+    assert calculate_multicomponent_activity_coefficients(
+        333.15, H2O_EtOH_ETBE, [0.2, 0.3, 0.5]
+    ).shape == (3,)
+    with pytest.raises(ValueError):
+        calculate_multicomponent_activity_coefficients(
+            333.15, H2O_EtOH_ETBE, [0.2, 0.3, 0.5], "UNIQUAC"
+        )
+    with pytest.raises(ValueError):
+        calculate_multicomponent_activity_coefficients(
+            333.15, H2O_MeOH_MTBE, [0.5, 0.5]
+        )
+    with pytest.raises(ValueError):
+        calculate_multicomponent_activity_coefficients(
+            333.15, H2O_MeOH_MTBE, [0.5, 0.4, 0.2]
+        )
+    with pytest.raises(ValueError):
+        calculate_multicomponent_activity_coefficients(
+            333.15, H2O_MeOH_MTBE, [0.5, 0.5, 0], "Wilson"
+        )
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+from pyvaporation.membrane import Membrane
+from pyvaporation.mixtures import (
+    Composition,
+    CompositionType,
+    Mixtures,
+    ThermodynamicCache,
+    get_partial_pressures,
+)
+from pyvaporation.mixtures.mixture import calculate_activity_coefficients
+from pyvaporation.pervaporation import Pervaporation
+
+
+def test_cache_statistics():
+    cache = ThermodynamicCache(max_size=3)
+    compositions = [
+        Composition(p=i / 10, type=CompositionType.molar) for i in range(1, 5)
+    ]
+
+    for composition in compositions[:3]:
+        assert get_partial_pressures(
+            313, Mixtures.H2O_EtOH, composition, cache=cache
+        ) == get_partial_pressures(313, Mixtures.H2O_EtOH, composition)
+
+    assert cache.statistics() == {
+        "hits": 0,
+        "misses": 3,
+        "evictions": 0,
+        "hit_rate": 0,
+        "size": 3,
+    }
+
+    get_partial_pressures(313, Mixtures.H2O_EtOH, compositions[0], cache=cache)
+    assert cache.hits == 1
+
+    # the least recently used entry (0.2) is evicted
+    get_partial_pressures(313, Mixtures.H2O_EtOH, compositions[3], cache=cache)
+    assert cache.evictions == 1
+    assert len(cache) == 3
+
+    get_partial_pressures(313, Mixtures.H2O_EtOH, compositions[1], cache=cache)
+    assert cache.misses == 5
+    assert abs(cache.hit_rate - 1 / 6) < 1e-12
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+
+
+def test_cache_keys():
+    cache = ThermodynamicCache(decimals=4)
+    composition = Composition(p=0.3, type=CompositionType.molar)
+
+    nrtl = calculate_activity_coefficients(
+        313, Mixtures.H2O_EtOH, composition, "NRTL", cache=cache
+    )
+    uniquac = calculate_activity_coefficients(
+        313, Mixtures.H2O_EtOH, composition, "UNIQUAC", cache=cache
+    )
+    assert nrtl != uniquac
+
+    get_partial_pressures(313, Mixtures.H2O_MeOH, composition, cache=cache)
+    assert cache.misses == 3
+
+    # temperatures equal after rounding share the entry
+    calculate_activity_coefficients(
+        313.00001, Mixtures.H2O_EtOH, composition, "NRTL", cache=cache
+    )
+    assert cache.hits == 1
+
+
+def test_pervaporation_with_cache():
+    membrane = Membrane.load(Path("tests/default_membranes/RomakonPM_102"))
+    cache = ThermodynamicCache()
+    composition = Composition(p=0.1, type=CompositionType.weight)
+
+    pervaporation = Pervaporation(
+        membrane=membrane, mixture=Mixtures.H2O_EtOH, cache=cache
+    )
+    cached = pervaporation.calculate_partial_fluxes(
+        feed_temperature=333.15, composition=composition, permeate_temperature=293.15
+    )
+    exact = Pervaporation(
+        membrane=membrane, mixture=Mixtures.H2O_EtOH
+    ).calculate_partial_fluxes(
+        feed_temperature=333.15, composition=composition, permeate_temperature=293.15
+    )
+
+    assert cached == exact
+    # feed partial pressures are calculated once per call, a repeated call is served by the cache
+    assert pervaporation.calculate_partial_fluxes(
+        feed_temperature=333.15, composition=composition, permeate_temperature=293.15
+    ) == cached
+    assert cache.hits > 0
@@ -0,0 +1,125 @@
+from pathlib import Path
+
+import numpy
+import pytest
+
+from pyvaporation.membrane import Membrane
+from pyvaporation.mixtures import (
+    Composition,
+    CompositionType,
+    Mixtures,
+    ThermodynamicSurrogate,
+    calculate_activity_coefficients_array,
+    get_partial_pressures,
+)
+from pyvaporation.pervaporation import Pervaporation
+
+
+@pytest.mark.parametrize("calculation_type", ["NRTL", "UNIQUAC"])
+def test_surrogate_error(calculation_type):
+    tolerance = 1e-4
+    surrogate = ThermodynamicSurrogate.from_mixture(
+        Mixtures.H2O_EtOH, (300, 360), calculation_type, tolerance=tolerance
+    )
+
+    assert surrogate.temperature_range == (300, 360)
+    assert surrogate.max_error < 3 * tolerance
+
+    fractions = numpy.linspace(0, 1, 21)
+    temperatures = numpy.linspace(300, 360, 7)[:, None]
+    exact = calculate_activity_coefficients_array(
+        temperatures, Mixtures.H2O_EtOH, fractions, calculation_type
+    )
+    assert numpy.abs(surrogate.gamma(fractions, temperatures) / exact - 1).max() < (
+        3 * tolerance
+    )
+
+    for p in (0.05, 0.5, 0.95):
+        composition = Composition(p=p, type=CompositionType.weight)
+        interpolated = surrogate.get_partial_pressures(331.7, composition)
+        calculated = get_partial_pressures(
+            331.7, Mixtures.H2O_EtOH, composition, calculation_type
+        )
+        assert interpolated == pytest.approx(calculated, rel=3 * tolerance)
+
+
+def test_surrogate_fallback():
+    surrogate = ThermodynamicSurrogate.from_mixture(
+        Mixtures.H2O_iPOH, (300, 340), "UNIQUAC"
+    )
+    composition = Composition(p=0.2, type=CompositionType.molar)
+
+    assert surrogate.get_partial_pressures(
+        350, composition
+    ) == surrogate.kernel.get_partial_pressures(350, composition)
+    assert numpy.array_equal(
+        surrogate.gamma(numpy.array([0.2, 0.2]), numpy.array([290, 350])),
+        surrogate.kernel.gamma(numpy.array([0.2, 0.2]), numpy.array([290, 350])),
+    )
+
+    with pytest.raises(ValueError):
+        ThermodynamicSurrogate.from_mixture(Mixtures.H2O_iPOH, (340, 300))
+
+
+def test_pervaporation_with_surrogate():
+    membrane = Membrane.load(Path("tests/default_membranes/RomakonPM_102"))
+    surrogate = ThermodynamicSurrogate.from_mixture(Mixtures.H2O_EtOH, (290, 340))
+    composition = Composition(p=0.1, type=CompositionType.weight)
+
+    tabulated = Pervaporation(
+        membrane=membrane, mixture=Mixtures.H2O_EtOH, surrogate=surrogate
+    ).calculate_partial_fluxes(
+        feed_temperature=333.15, composition=composition, permeate_temperature=293.15
+    )
+    exact = Pervaporation(
+        membrane=membrane, mixture=Mixtures.H2O_EtOH
+    ).calculate_partial_fluxes(
+        feed_temperature=333.15, composition=composition, permeate_temperature=293.15
+    )
+    assert tabulated == pytest.approx(exact, rel=1e-3)
+
+    with pytest.raises(ValueError):
+        Pervaporation(
+            membrane=membrane, mixture=Mixtures.H2O_EtOH, surrogate=surrogate
+        ).calculate_partial_fluxes(
+            feed_temperature=333.15,
+            composition=composition,
+            calculation_type="UNIQUAC",
+        )
+    with pytest.raises(ValueError):
+        Pervaporation(
+            membrane=membrane, mixture=Mixtures.H2O_MeOH, surrogate=surrogate
+        ).calculate_partial_fluxes(feed_temperature=333.15, composition=composition)
+
+
+def test_surrogate_table_validation():
+    surrogate = ThermodynamicSurrogate.from_mixture(
+        Mixtures.H2O_EtOH, (300, 340), max_refinements=2
+    )
+    assert surrogate.lookup_resolution == (128, 16)
+
+    # a table with the same nodes is accepted
+    ThermodynamicSurrogate(
+        kernel=surrogate.kernel,
+        fractions=surrogate.fractions,
+        temperatures=surrogate.temperatures,
+        ln_activity_coefficients=surrogate.ln_activity_coefficients,
+        lookup_resolution=surrogate.lookup_resolution,
+    )
+
+    fractions = surrogate.fractions.copy()
+    fractions[1] += 1e-3
+    temperatures = surrogate.temperatures.copy()
+    temperatures[1] += 0.1
+    for nodes in [
+        dict(fractions=fractions, temperatures=surrogate.temperatures),
+        dict(fractions=surrogate.fractions, temperatures=temperatures),
+        dict(fractions=surrogate.fractions[:-1], temperatures=surrogate.temperatures),
+    ]:
+        with pytest.raises(ValueError):
+            ThermodynamicSurrogate(
+                kernel=surrogate.kernel,
+                ln_activity_coefficients=surrogate.ln_activity_coefficients,
+                lookup_resolution=surrogate.lookup_resolution,
+                **nodes
+            )
@@ -1,5 +1,36 @@
-from pyvaporation.mixtures.uniquac_fitting import fit_vle, VLEPoints
-from pyvaporation.mixtures import get_partial_pressures, Mixture
+import shutil
+import time
+
+import attr
+import numpy
+import pytest
+
+from pyvaporation.mixtures import uniquac_fitting
+from pyvaporation.mixtures.uniquac_fitting import (
+    bootstrap_vle,
+    fit_nrtl_vle,
+    fit_vle,
+    fit_vle_least_squares,
+    fit_vle_multistart,
+    fit_vle_parallel,
+    objective,
+    PARAMETER_LIMITS,
+    VLEObjective,
+    VLEPoints,
+)
+from pyvaporation.components import Components
+from pyvaporation.mixtures import (
+    Composition,
+    CompositionType,
+    get_partial_pressures,
+    Mixture,
+    Mixtures,
+    VLEFitCache,
+    load_mixtures,
+    refit_mixtures,
+    VLEPoint,
+)
+from pyvaporation.utils import NRTLParameters, UNIQUACParameters
 
 
 def test_fit_uniquac_vle():
@@ -33,3 +64,344 @@ def test_fit_uniquac_vle():
 
 
 
+
+
+def test_vle_objective():
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+    vle_objective = VLEObjective.from_points(points)
+
+    for params in ([0, 0, 0, 0, 10], [120.5, -30.2, 1000, -500, 13.7]):
+        mixture = Mixture(
+            name="",
+            first_component=points.components[0],
+            second_component=points.components[1],
+            uniquac_params=UNIQUACParameters.from_array(params),
+        )
+        error = 0
+        for point in points:
+            calc_pressures = get_partial_pressures(temperature=point.temperature,
+                                                   mixture=mixture,
+                                                   composition=point.composition,
+                                                   calculation_type="UNIQUAC")
+            error += (calc_pressures[0] - point.pressures[0]) ** 2 \
+                + (calc_pressures[1] - point.pressures[1]) ** 2
+
+        assert vle_objective(params) == pytest.approx((error / len(points)) ** 0.5, rel=1e-12)
+        assert objective(points, params) == pytest.approx(vle_objective(params), rel=1e-12)
+
+
+def test_fit_vle_parallel():
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+    methods = ["Nelder-Mead", "COBYLA", "BFGS"]
+
+    fit = fit_vle_parallel(data=points, methods=methods, n_jobs=2)
+    assert [report.method for report in fit.reports] == methods
+    assert fit.error == min(report.error for report in fit.reports)
+    assert all(report.nfev > 0 and report.time > 0 for report in fit.reports)
+    # processes run the same optimization as the sequential fit
+    assert UNIQUACParameters.from_array(fit.reports[1].params) == fit_vle(
+        data=points, method="COBYLA"
+    )
+
+    # the best point evaluated before the time limit is reported
+    fit = fit_vle_parallel(data=points, methods=methods, n_jobs=1, time_limit=0)
+    assert all(not report.success for report in fit.reports)
+    assert fit.error == pytest.approx(objective(points, [0, 0, 0, 0, 10]))
+
+
+def test_fit_vle_least_squares():
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+    vle_objective = VLEObjective.from_points(points)
+
+    params = numpy.array([120.5, -30.2, 1000, -500, 10])
+    jacobian = vle_objective.jacobian(params)
+    for i, step in enumerate([1e-4, 1e-4, 1e-2, 1e-2]):
+        shift = numpy.zeros(5)
+        shift[i] = step
+        numerical = (
+            vle_objective.residuals(params + shift) - vle_objective.residuals(params - shift)
+        ) / (2 * step)
+        assert numpy.allclose(jacobian[:, i], numerical, rtol=1e-6, atol=1e-9)
+
+    fit = fit_vle_least_squares(data=points, z_values=[8, 10, 13])
+    assert [report.params[4] for report in fit.reports] == [8, 10, 13]
+    assert fit.parameters.z in (8, 10, 13)
+    assert fit.error == pytest.approx(objective(points, attr.astuple(fit.parameters)))
+    assert fit.error < objective(points, attr.astuple(fit_vle(data=points, method="COBYLA")))
+    assert fit_vle(data=points, method="least_squares") == fit_vle_least_squares(points).parameters
+
+
+def test_fit_vle_least_squares_bounded():
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/MeOH_Toluene.csv")
+    lower, upper = numpy.array(PARAMETER_LIMITS["UNIQUAC"]).T
+
+    # a runaway fit of a single coordination number does not spoil the fits of the others
+    fit = fit_vle_least_squares(data=points)
+    params = numpy.array(attr.astuple(fit.parameters)[:4])
+    assert ((params > lower) & (params < upper)).all()
+    assert fit.error < objective(points, attr.astuple(Mixtures.MeOH_Toluene.uniquac_params))
+    for report in fit.reports:
+        assert numpy.isfinite(report.error) or not report.success
+
+
+def test_fit_vle_multistart(monkeypatch):
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+
+    fit = fit_vle_multistart(data=points, n_starts=16, n_jobs=1, seed=0)
+    assert len(fit.reports) < 16
+    assert fit.error == fit.solutions[0].error
+    assert [solution.error for solution in fit.solutions] == sorted(
+        solution.error for solution in fit.solutions
+    )
+    assert fit.error <= fit_vle_least_squares(data=points, z_values=[10]).error * (1 + 1e-6)
+
+    submitted = []
+
+    class CountingExecutor(uniquac_fitting.ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            submitted.append(args)
+            return super().submit(*args, **kwargs)
+
+    monkeypatch.setattr(uniquac_fitting, "ProcessPoolExecutor", CountingExecutor)
+    parallel_fit = fit_vle_multistart(data=points, n_starts=16, n_jobs=2, seed=0)
+    assert parallel_fit.error == pytest.approx(fit.error, rel=1e-6)
+    assert len(submitted) < 16
+    assert len(submitted) <= len(parallel_fit.reports) + 2
+
+    everything = fit_vle_multistart(data=points, n_starts=8, n_jobs=1, n_agree=100, seed=0)
+    assert len(everything.reports) == 8
+    lower, upper = numpy.array(PARAMETER_LIMITS["UNIQUAC"]).T
+    for solution in everything.solutions:
+        assert ((solution.params[:4] > lower) & (solution.params[:4] < upper)).all()
+
+
+def test_fit_nrtl_vle():
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+    vle_objective = VLEObjective.from_points(points, calculation_type="NRTL")
+
+    params = numpy.array([5823, -633, 0.3, 0.5, -0.2])
+    jacobian = vle_objective.jacobian(params)
+    for i, step in enumerate([1e-2, 1e-2, 1e-6, 1e-6, 1e-6]):
+        shift = numpy.zeros(5)
+        shift[i] = step
+        numerical = (
+            vle_objective.residuals(params + shift) - vle_objective.residuals(params - shift)
+        ) / (2 * step)
+        assert numpy.allclose(jacobian[:, i], numerical, rtol=1e-6, atol=1e-9)
+
+    params = fit_nrtl_vle(data=points)
+    assert isinstance(params, NRTLParameters)
+    test_mixture = Mixture(
+        name="",
+        first_component=points.components[0],
+        second_component=points.components[1],
+        nrtl_params=params,
+    )
+
+    error = 0
+    for point in points:
+        calc_pressures = get_partial_pressures(temperature=point.temperature,
+                                               mixture=test_mixture,
+                                               composition=point.composition,
+                                               calculation_type="NRTL")
+        error += (calc_pressures[0] - point.pressures[0]) ** 2 \
+            + (calc_pressures[1] - point.pressures[1]) ** 2
+
+    literature = Mixtures.H2O_EtOH.nrtl_params
+    literature_error = vle_objective(
+        [literature.g12, literature.g21, literature.alpha12, literature.a12, literature.a21]
+    )
+    assert (error / len(points)) ** 0.5 < literature_error
+
+    fit = fit_vle_multistart(data=points, n_starts=8, n_jobs=1, seed=0, calculation_type="NRTL")
+    assert isinstance(fit.parameters, NRTLParameters)
+    assert fit.error < literature_error
+
+
+def test_vle_points():
+    # components and composition types are specified in the first row only
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/MeOH_DMC.csv")
+    assert points.components == [Components.MeOH, Components.DMC]
+    assert points.compositions.type == CompositionType.molar
+    assert points.pressures.shape == (len(points), 2)
+
+    point = points[1]
+    assert point == VLEPoint(
+        composition=Composition(p=0.197, type=CompositionType.molar),
+        pressures=(52.99036, 48.32964),
+        temperature=345.9,
+    )
+    assert points[-1] == list(points)[-1] == points.data[-1]
+    assert points[1:3] == points.data[1:3]
+
+    packed = VLEPoints.from_points(points.components, points.data)
+    assert packed.compositions == points.compositions
+    assert numpy.array_equal(packed.pressures, points.pressures)
+    assert numpy.array_equal(packed.temperatures, points.temperatures)
+
+    # the constructor of the list of VLEPoint objects is still accepted
+    for constructed in [
+        VLEPoints(components=points.components, data=points.data),
+        VLEPoints(points.components, points.data),
+    ]:
+        assert constructed.compositions == points.compositions
+        assert numpy.array_equal(constructed.pressures, points.pressures)
+        assert constructed.data == points.data
+    with pytest.raises(ValueError):
+        VLEPoints(points.components, data=points.data, pressures=points.pressures)
+    with pytest.raises(ValueError):
+        VLEPoints(points.components, compositions=points.compositions)
+
+    weight_points = VLEPoints.from_points(
+        points.components,
+        [
+            VLEPoint(
+                composition=point.composition.to_weight(Mixtures.MeOH_DMC),
+                pressures=point.pressures,
+                temperature=point.temperature,
+            )
+            for point in points[:5]
+        ],
+    )
+    combined = points + weight_points
+    assert len(combined) == len(points) + 5
+    assert combined.compositions.type == CompositionType.molar
+    assert numpy.allclose(combined.compositions.p[-5:], points.compositions.p[:5])
+
+    with pytest.raises(ValueError):
+        points + VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+
+
+def test_fit_vle_cache(tmp_path):
+    cache = VLEFitCache(path=tmp_path / "fits", max_size=2)
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+
+    params = fit_vle(data=points, method="least_squares", cache=cache)
+    assert cache.statistics()["misses"] == 1 and len(cache) == 1
+
+    start = time.perf_counter()
+    assert fit_vle(data=points, method="least_squares", cache=cache) == params
+    assert time.perf_counter() - start < 0.1
+    assert cache.hits == 1
+
+    key = VLEFitCache.key(points, "least_squares", [0, 0, 0, 0, 10])
+    assert cache.get(key)[1] == pytest.approx(objective(points, attr.astuple(params)))
+    assert key != VLEFitCache.key(points, "COBYLA", [0, 0, 0, 0, 10])
+    assert key != VLEFitCache.key(points, "least_squares", [0, 0, 0, 0, 13])
+    assert key != VLEFitCache.key(points + points, "least_squares", [0, 0, 0, 0, 10])
+
+    # the least recently used entry is evicted
+    other_points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/EtOH_ETBE.csv")
+    fit_vle(data=other_points, method="least_squares", cache=cache)
+    assert fit_vle(data=points, method="least_squares", cache=cache) == params
+    fit_vle(data=points + points, method="least_squares", cache=cache)
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get(key) is not None
+    assert cache.get(VLEFitCache.key(other_points, "least_squares", [0, 0, 0, 0, 10])) is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_bootstrap_vle():
+    points = VLEPoints.from_csv(path=f"tests/VLE_data/binary/H2O_EtOH.csv")
+    parameters = fit_vle_least_squares(data=points, z_values=[10]).parameters
+
+    bootstrap = bootstrap_vle(
+        data=points, n_replicates=16, parameters=parameters, n_jobs=2, seed=0
+    )
+    assert bootstrap.replicates.shape == (16, 5)
+    assert bootstrap.n_failed == 0
+    assert numpy.all(bootstrap.replicates[:, 4] == 10)
+    assert bootstrap.parameters_percentiles.shape == (3, 5)
+    assert bootstrap.partial_pressures_percentiles.shape == (3, len(points), 2)
+    assert numpy.all(numpy.diff(bootstrap.parameters_percentiles, axis=0) >= 0)
+    assert numpy.all(numpy.diff(bootstrap.partial_pressures_percentiles, axis=0) >= 0)
+
+    calculated = get_partial_pressures(
+        temperature=points[0].temperature,
+        mixture=Mixture(
+            name="",
+            first_component=points.components[0],
+            second_component=points.components[1],
+            uniquac_params=parameters,
+        ),
+        composition=points[0].composition,
+        calculation_type="UNIQUAC",
+    )
+    assert bootstrap.partial_pressures[0] == pytest.approx(calculated)
+
+    # replicates fitted in the current process are the same
+    sequential = bootstrap_vle(
+        data=points, n_replicates=16, parameters=parameters, n_jobs=1, seed=0
+    )
+    assert numpy.allclose(sequential.replicates, bootstrap.replicates, rtol=1e-10)
+
+
+def test_refit_mixtures(tmp_path):
+    for name in ["EtOH_ETBE", "MeOH_DMC"]:
+        shutil.copy(f"tests/VLE_data/binary/{name}.csv", tmp_path)
+    registry_path = tmp_path / "mixtures.json"
+
+    result = refit_mixtures(tmp_path, registry_path, n_jobs=2)
+    assert result.fitted == ["EtOH_ETBE", "MeOH_DMC"]
+    assert result.skipped == []
+
+    result = refit_mixtures(tmp_path, registry_path, n_jobs=2)
+    assert result.fitted == []
+    assert result.skipped == ["EtOH_ETBE", "MeOH_DMC"]
+
+    # only the mixture, which data changed, is refitted
+    with open(tmp_path / "MeOH_DMC.csv") as file:
+        lines = file.readlines()
+    with open(tmp_path / "MeOH_DMC.csv", "w") as file:
+        file.writelines(lines[:-1])
+    result = refit_mixtures(tmp_path, registry_path, n_jobs=1)
+    assert result.fitted == ["MeOH_DMC"]
+    assert result.skipped == ["EtOH_ETBE"]
+
+    mixture_entry = result.registry["EtOH_ETBE"]
+    mixtures = load_mixtures(registry_path)
+    assert set(mixtures) == {"EtOH_ETBE", "MeOH_DMC"}
+    mixture = mixtures["EtOH_ETBE"]
+    assert mixture.first_component == Components.EtOH
+    assert mixture.uniquac_params is not None
+    assert mixture.nrtl_params is not None
+    points = VLEPoints.from_csv(path=tmp_path / "EtOH_ETBE.csv")
+    vle_objective = VLEObjective.from_points(points, calculation_type="NRTL")
+    assert vle_objective(vle_objective.to_array(mixture.nrtl_params)) == pytest.approx(
+        result.registry["EtOH_ETBE"]["errors"]["NRTL"]
+    )
+
+    # the refitted parameters are not worse than the pre-defined ones
+    keys = {"UNIQUAC": "uniquac_params", "NRTL": "nrtl_params"}
+    for name in ["EtOH_ETBE", "MeOH_DMC"]:
+        points = VLEPoints.from_csv(path=tmp_path / f"{name}.csv")
+        for calculation_type in ["UNIQUAC", "NRTL"]:
+            vle_objective = VLEObjective.from_points(points, calculation_type)
+            fitted_params = vle_objective.to_array(
+                getattr(mixtures[name], keys[calculation_type])
+            )
+            lower, upper = numpy.array(PARAMETER_LIMITS[calculation_type]).T
+            assert (
+                (fitted_params[: len(lower)] > lower)
+                & (fitted_params[: len(lower)] < upper)
+            ).all()
+            assert vle_objective(fitted_params) <= vle_objective(
+                vle_objective.to_array(
+                    getattr(
+                        getattr(Mixtures, name), keys[calculation_type]
+                    )
+                )
+            )
+
+    # refitting a single model keeps the parameters of the other one
+    with open(tmp_path / "EtOH_ETBE.csv") as file:
+        lines = file.readlines()
+    with open(tmp_path / "EtOH_ETBE.csv", "w") as file:
+        file.writelines(lines[:-1])
+    result = refit_mixtures(tmp_path, registry_path, calculation_types=["NRTL"], n_jobs=1)
+    assert result.fitted == ["EtOH_ETBE"]
+    entry = result.registry["EtOH_ETBE"]
+    assert entry["uniquac_params"] == mixture_entry["uniquac_params"]
+    assert list(entry["errors"]) == ["NRTL"]
@@ -0,0 +1,156 @@
+import numpy
+import pytest
+from scipy.optimize import brentq
+
+from pyvaporation.mixtures import (
+    Composition,
+    CompositionArray,
+    CompositionType,
+    Mixture,
+    Mixtures,
+    calculate_bubble_pressures,
+    calculate_bubble_temperatures,
+    find_azeotropes,
+    get_partial_pressures,
+)
+
+
+@pytest.mark.parametrize("calculation_type", ["NRTL", "UNIQUAC"])
+def test_bubble_temperatures(calculation_type):
+    diagram = calculate_bubble_temperatures(
+        Mixtures.H2O_EtOH, 101.325, calculation_type=calculation_type
+    )
+
+    assert diagram.is_isobaric
+    assert diagram.x.shape == diagram.y.shape == diagram.temperature.shape == (101,)
+    assert diagram.y[0] == 0 and diagram.y[-1] == 1
+
+    for x, temperature in zip(diagram.x[::10], diagram.temperature[::10]):
+        composition = Composition(p=float(x), type=CompositionType.molar)
+        validation_temperature = brentq(
+            lambda t: sum(
+                get_partial_pressures(
+                    t, Mixtures.H2O_EtOH, composition, calculation_type
+                )
+            )
+            - 101.325,
+            330,
+            390,
+        )
+        assert abs(temperature - validation_temperature) < 1e-6
+
+    # ethanol boils at 351.4 K, water at 373.1 K
+    assert abs(diagram.temperature[0] - 351.4) < 0.5
+    assert abs(diagram.temperature[-1] - 373.1) < 0.5
+
+
+@pytest.mark.parametrize(
+    "mixture",
+    [value for value in vars(Mixtures).values() if isinstance(value, Mixture)],
+    ids=lambda mixture: mixture.name,
+)
+@pytest.mark.parametrize("calculation_type", ["NRTL", "UNIQUAC"])
+@pytest.mark.parametrize("pressure", [50, 101.325])
+def test_bubble_temperatures_registered_mixtures(mixture, calculation_type, pressure):
+    diagram = calculate_bubble_temperatures(
+        mixture, pressure, calculation_type=calculation_type
+    )
+    kernel = mixture.get_kernel(calculation_type)
+    solved = numpy.isfinite(diagram.temperature)
+    assert solved[0] and solved[-1]
+    assert numpy.allclose(
+        kernel.partial_pressures(
+            diagram.x[solved], diagram.temperature[solved]
+        ).sum(axis=-1),
+        pressure,
+        rtol=1e-8,
+    )
+
+    # the model does not reach the pressure at the compositions left unsolved
+    temperatures = numpy.linspace(250, 450, 2001)
+    with numpy.errstate(over="ignore", invalid="ignore"):
+        for x in diagram.x[~solved]:
+            total_pressures = kernel.partial_pressures(
+                numpy.full_like(temperatures, x), temperatures
+            ).sum(axis=-1)
+            assert numpy.all(numpy.nan_to_num(total_pressures, nan=numpy.inf) > pressure)
+
+
+def test_bubble_pressures():
+    compositions = CompositionArray(
+        p=[0.1, 0.5, 0.9], type=CompositionType.weight
+    )
+    diagram = calculate_bubble_pressures(Mixtures.H2O_MeOH, 323.15, compositions)
+
+    assert not diagram.is_isobaric
+    assert numpy.allclose(diagram.x, compositions.to_molar(Mixtures.H2O_MeOH).p)
+    for i, composition in enumerate(compositions):
+        partial_pressures = get_partial_pressures(
+            323.15, Mixtures.H2O_MeOH, composition
+        )
+        assert abs(diagram.pressure[i] - sum(partial_pressures)) < 1e-10
+        assert abs(diagram.y[i] - partial_pressures[0] / sum(partial_pressures)) < 1e-12
+
+    isobaric = calculate_bubble_temperatures(
+        Mixtures.H2O_MeOH, 50, compositions=compositions
+    )
+    isothermal = calculate_bubble_pressures(
+        Mixtures.H2O_MeOH, isobaric.temperature[1], compositions[1:2]
+    )
+    assert abs(isothermal.pressure[0] - 50) < 1e-8
+
+
+def test_find_azeotropes():
+    azeotropes = find_azeotropes(
+        [Mixtures.H2O_EtOH, Mixtures.H2O_MeOH, Mixtures.MeOH_Toluene],
+        pressures=[50, 101.325],
+    )
+
+    # water - methanol is zeotropic
+    assert set((a.mixture.name, a.calculation_type, a.pressure) for a in azeotropes) == {
+        (mixture.name, calculation_type, pressure)
+        for mixture in [Mixtures.H2O_EtOH, Mixtures.MeOH_Toluene]
+        for calculation_type in ["NRTL", "UNIQUAC"]
+        for pressure in [50, 101.325]
+    }
+
+    for azeotrope in azeotropes:
+        kernel = azeotrope.mixture.get_kernel(azeotrope.calculation_type)
+        partial_pressures = kernel.get_partial_pressures(
+            azeotrope.temperature, azeotrope.composition
+        )
+        assert abs(sum(partial_pressures) - azeotrope.pressure) < 1e-6
+        assert (
+            abs(partial_pressures[0] / sum(partial_pressures) - azeotrope.composition.p)
+            < 1e-6
+        )
+
+    # ethanol - water azeotrope at atmospheric pressure boils at 351.3 K
+    for azeotrope in azeotropes:
+        if azeotrope.mixture is Mixtures.H2O_EtOH and azeotrope.pressure == 101.325:
+            assert abs(azeotrope.temperature - 351.3) < 0.2
+            assert azeotrope.composition.p < 0.15
+
+
+def test_find_azeotropes_registry():
+    mixtures = [value for value in vars(Mixtures).values() if isinstance(value, Mixture)]
+    azeotropes = find_azeotropes(mixtures, pressures=[50, 101.325])
+
+    # bubble points of ethanol - ETBE are partially undefined with UNIQUAC at 50 kPa,
+    # the rest of the compositions are still screened
+    assert (Mixtures.EtOH_ETBE.name, "UNIQUAC", 50) in set(
+        (a.mixture.name, a.calculation_type, a.pressure) for a in azeotropes
+    )
+    assert {a.mixture.name for a in azeotropes} >= {
+        "H2O_EtOH",
+        "MeOH_Toluene",
+        "MeOH_MTBE",
+    }
+    for azeotrope in azeotropes:
+        kernel = azeotrope.mixture.get_kernel(azeotrope.calculation_type)
+        assert sum(
+            kernel.get_partial_pressures(azeotrope.temperature, azeotrope.composition)
+        ) == pytest.approx(azeotrope.pressure, rel=1e-8)
+
+    # combinations, for which the calculation fails, are skipped
+    assert find_azeotropes(mixtures, pressures=50, max_iterations=1) == []
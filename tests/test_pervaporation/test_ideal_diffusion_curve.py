@@ -1,11 +1,20 @@
-from pytest import fixture
+from pytest import fixture, raises
 
 from pyvaporation.components import Components
 from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
-from pyvaporation.mixtures import Composition, CompositionType, Mixtures
+from pyvaporation.mixtures import (
+    Composition,
+    CompositionArray,
+    CompositionType,
+    Mixtures,
+)
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import (
+    PermeateCompositionError,
+    Pervaporation,
+    ProcessFailurePolicy,
+)
 
 
 @fixture
@@ -131,3 +140,33 @@ def test_get_permeances_permeate_pressure(meoh_mtbe_pervaporation):
         assert abs(modelled_permeances[i][0].value - validation_permeances[0]) < 1e-5
         assert abs(modelled_permeances[i][1].value - validation_permeances[1]) < 1e-5
         assert abs(calculated_selectivity[i] - validation_selectivity) < 1e-3
+
+
+def test_ideal_diffusion_curve_failure_policy(meoh_mtbe_pervaporation):
+    feed_compositions = [
+        Composition(p=(0.15 - i / 100), type=CompositionType.weight) for i in range(15)
+    ]
+    with raises(PermeateCompositionError):
+        meoh_mtbe_pervaporation.ideal_diffusion_curve(
+            feed_temperature=325.45,
+            compositions=feed_compositions,
+            permeate_pressure=20,
+        )
+    with raises(PermeateCompositionError, match="1 iterations"):
+        meoh_mtbe_pervaporation.ideal_diffusion_curve(
+            feed_temperature=325.45,
+            compositions=feed_compositions,
+            permeate_pressure=5,
+            max_iterations=1,
+        )
+
+    # partial fluxes are not defined at the low methanol content, the curve is stopped there
+    modelled_curve = meoh_mtbe_pervaporation.ideal_diffusion_curve(
+        feed_temperature=325.45,
+        compositions=CompositionArray.from_compositions(feed_compositions),
+        permeate_pressure=20,
+        on_failure=ProcessFailurePolicy.stop,
+    )
+    assert 0 < len(modelled_curve.partial_fluxes) < len(feed_compositions)
+    assert len(modelled_curve.feed_compositions) == len(modelled_curve.partial_fluxes)
+    assert modelled_curve.feed_compositions[0] == feed_compositions[0]
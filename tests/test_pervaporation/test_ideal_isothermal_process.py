@@ -7,7 +7,12 @@ from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import (
+    PermeateCompositionError,
+    PermeateSolver,
+    Pervaporation,
+    ProcessFailurePolicy,
+)
 
 
 @fixture
@@ -198,3 +203,39 @@ def test_permeate_comp_and_temp(
             conditions=romakon_al2_experiment_conditions_4,
             precision=5e-5,
         )
+
+
+def test_failure_policy_fallback(romakon_al2_pervaporation):
+    conditions = Conditions(
+        membrane_area=0.0048,
+        initial_feed_temperature=319.65,
+        initial_feed_amount=0.047,
+        initial_feed_composition=Composition(p=0.04, type=CompositionType.weight),
+        permeate_temperature=260,
+    )
+    with pytest.raises(PermeateCompositionError):
+        romakon_al2_pervaporation.ideal_isothermal_process(
+            number_of_steps=5,
+            delta_hours=1,
+            conditions=conditions,
+            max_iterations=2,
+        )
+
+    model = romakon_al2_pervaporation.ideal_isothermal_process(
+        number_of_steps=5,
+        delta_hours=1,
+        conditions=conditions,
+        max_iterations=2,
+        on_failure=ProcessFailurePolicy.fallback,
+        fallback_solver=PermeateSolver.newton,
+    )
+    reference = romakon_al2_pervaporation.ideal_isothermal_process(
+        number_of_steps=5,
+        delta_hours=1,
+        conditions=conditions,
+    )
+    assert len(model.time) == 5
+    for i in range(5):
+        assert model.permeate_composition[i].first == pytest.approx(
+            reference.permeate_composition[i].first, abs=1e-4
+        )
@@ -2,12 +2,16 @@ import pytest
 from pytest import fixture
 
 from pyvaporation.components import Components
-from pyvaporation.conditions import Conditions
+from pyvaporation.conditions import Conditions, TemperatureProgram
 from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import (
+    PermeateCompositionError,
+    Pervaporation,
+    ProcessFailurePolicy,
+)
 
 
 @fixture
@@ -147,3 +151,42 @@ def test_ideal_non_isothermal_process_perm_pressure_and_temp(
             number_of_steps=8,
             delta_hours=0.125,
         )
+
+
+def test_ideal_non_isothermal_process_failure_policy(pervaporation, test_conditions):
+    # feed is cooled below the permeate temperature after the fourth step
+    test_conditions.temperature_program = TemperatureProgram(
+        coefficients=[333.15, -10]
+    )
+    with pytest.raises(PermeateCompositionError):
+        pervaporation.ideal_non_isothermal_process(
+            conditions=test_conditions, number_of_steps=8, delta_hours=1
+        )
+
+    model = pervaporation.ideal_non_isothermal_process(
+        conditions=test_conditions,
+        number_of_steps=8,
+        delta_hours=1,
+        on_failure=ProcessFailurePolicy.stop,
+    )
+    assert model.time == [0, 1, 2, 3]
+    assert model.feed_temperature == pytest.approx([333.15, 323.15, 313.15, 303.15])
+    for values in [
+        model.feed_compositions,
+        model.permeate_composition,
+        model.permeate_temperature,
+        model.feed_mass,
+        model.partial_fluxes,
+        model.permeances,
+        model.feed_evaporation_heat,
+        model.permeate_condensation_heat,
+    ]:
+        assert len(values) == 4
+
+    with pytest.raises(ValueError):
+        pervaporation.ideal_non_isothermal_process(
+            conditions=test_conditions,
+            number_of_steps=8,
+            delta_hours=1,
+            on_failure="retry",
+        )
@@ -1,3 +1,5 @@
+import attr
+import numpy
 import pytest
 from pytest import fixture
 
@@ -5,9 +7,24 @@ from pyvaporation.components import Components
 from pyvaporation.conditions import Conditions
 from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
-from pyvaporation.mixtures import Composition, CompositionType, Mixtures
+from pyvaporation.mixtures import (
+    Composition,
+    CompositionType,
+    Mixtures,
+    ThermodynamicSurrogate,
+)
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import (
+    PermeateCompositionError,
+    PermeateSolver,
+    Pervaporation,
+)
+from pyvaporation.pervaporation.solvers import (
+    IterationMonitor,
+    PermeateBalance,
+    solve_newton,
+)
+from pyvaporation.utils import MargulesParameters
 
 
 @fixture
@@ -267,3 +284,191 @@ def test_get_separation_factor(pervaporation_binary):
         )
         < 5
     )
+
+
+def test_calculate_partial_fluxes_registered_model(romakon_pm102_binary):
+    # Margules parameters fitted to the VLE data of water - ethanol
+    pervaporation = Pervaporation(
+        membrane=romakon_pm102_binary,
+        mixture=attr.evolve(
+            Mixtures.H2O_EtOH,
+            parameters={
+                "Margules": MargulesParameters(
+                    a12=1.1783, a21=0.9144, b12=-89.15, b21=214.8
+                )
+            },
+        ),
+    )
+    composition = Composition(p=0.84, type=CompositionType.weight)
+
+    nrtl = pervaporation.calculate_partial_fluxes(
+        feed_temperature=313.15, composition=composition
+    )
+    margules = pervaporation.calculate_partial_fluxes(
+        feed_temperature=313.15, composition=composition, calculation_type="Margules"
+    )
+    assert margules[0] == pytest.approx(nrtl[0], rel=0.2)
+    assert margules[1] == pytest.approx(nrtl[1], rel=0.2)
+
+
+@pytest.mark.parametrize(
+    "solver", [PermeateSolver.newton, PermeateSolver.brent, PermeateSolver.anderson]
+)
+@pytest.mark.parametrize(
+    "permeate_conditions",
+    [{"permeate_temperature": 330.15}, {"permeate_pressure": 5}],
+)
+def test_calculate_partial_fluxes_solvers(
+    pervaporation_real, solver, permeate_conditions
+):
+    composition = Composition(p=0.9362, type=CompositionType.weight)
+    fixed_point = pervaporation_real.calculate_partial_fluxes(
+        feed_temperature=333.15,
+        composition=composition,
+        precision=5e-7,
+        **permeate_conditions
+    )
+    fluxes = pervaporation_real.calculate_partial_fluxes(
+        feed_temperature=333.15,
+        composition=composition,
+        precision=5e-7,
+        solver=solver,
+        **permeate_conditions
+    )
+    assert fluxes[0] == pytest.approx(fixed_point[0], rel=1e-4)
+    assert fluxes[1] == pytest.approx(fixed_point[1], rel=1e-4)
+
+
+def test_calculate_partial_fluxes_solvers_not_defined(pervaporation_real):
+    composition = Composition(p=0.9362, type=CompositionType.weight)
+    for solver in [
+        PermeateSolver.fixed_point,
+        PermeateSolver.newton,
+        PermeateSolver.brent,
+        PermeateSolver.anderson,
+    ]:
+        with pytest.raises(ValueError):
+            pervaporation_real.calculate_partial_fluxes(
+                feed_temperature=333.15,
+                composition=composition,
+                permeate_pressure=20,
+                solver=solver,
+            )
+
+    with pytest.raises(ValueError):
+        pervaporation_real.calculate_partial_fluxes(
+            feed_temperature=333.15, composition=composition, solver="secant"
+        )
+
+
+def test_calculate_partial_fluxes_limits(pervaporation_real):
+    composition = Composition(p=0.9362, type=CompositionType.weight)
+    with pytest.raises(PermeateCompositionError) as error:
+        pervaporation_real.calculate_partial_fluxes(
+            feed_temperature=333.15,
+            composition=composition,
+            permeate_temperature=330.15,
+            max_iterations=2,
+        )
+    assert "2 iterations" in str(error.value)
+    assert len(error.value.residuals) == 2
+    assert 0 < error.value.iterate < 1
+
+    with pytest.raises(PermeateCompositionError, match="time limit"):
+        pervaporation_real.calculate_partial_fluxes(
+            feed_temperature=333.15,
+            composition=composition,
+            permeate_temperature=330.15,
+            time_limit=0,
+        )
+
+    # partial fluxes are not defined, the error is still a ValueError
+    with pytest.raises(ValueError) as error:
+        pervaporation_real.calculate_partial_fluxes(
+            feed_temperature=333.15,
+            composition=composition,
+            permeate_temperature=332.9,
+        )
+    assert isinstance(error.value, PermeateCompositionError)
+    assert len(error.value.residuals) > 0
+
+
+def test_iteration_monitor_divergence():
+    monitor = IterationMonitor()
+    for residual in [1e-2, -2e-2, 3e-2, -4e-2, 5e-2]:
+        monitor.record(0.5, residual)
+    monitor.record(0.5, 1e-3, check_divergence=False)
+    with pytest.raises(PermeateCompositionError, match="diverges"):
+        for residual in [2e-3, 3e-3, 4e-3, 5e-3, 6e-3]:
+            monitor.record(0.5, residual)
+
+
+def test_calculate_partial_fluxes_initial_permeate_composition(pervaporation_real):
+    composition = Composition(p=0.9362, type=CompositionType.weight)
+    fluxes = pervaporation_real.calculate_partial_fluxes(
+        feed_temperature=333.15,
+        composition=composition,
+        precision=5e-7,
+        permeate_temperature=330.15,
+    )
+    permeate_composition = Composition(
+        p=fluxes[0] / sum(fluxes), type=CompositionType.weight
+    )
+
+    # the iterations starting from the solution converge at once
+    for initial_permeate_composition in [
+        permeate_composition,
+        permeate_composition.to_molar(pervaporation_real.mixture),
+    ]:
+        warm_fluxes = pervaporation_real.calculate_partial_fluxes(
+            feed_temperature=333.15,
+            composition=composition,
+            precision=5e-7,
+            permeate_temperature=330.15,
+            max_iterations=1,
+            initial_permeate_composition=initial_permeate_composition,
+        )
+        assert warm_fluxes[0] == pytest.approx(fluxes[0], rel=1e-5)
+        assert warm_fluxes[1] == pytest.approx(fluxes[1], rel=1e-5)
+
+    with pytest.raises(PermeateCompositionError):
+        pervaporation_real.calculate_partial_fluxes(
+            feed_temperature=333.15,
+            composition=composition,
+            precision=5e-7,
+            permeate_temperature=330.15,
+            max_iterations=1,
+        )
+
+
+def test_permeate_balance_derivative_bounds():
+    mixture = Mixtures.H2O_EtOH
+    balance = PermeateBalance(
+        permeances=(0.05, 0.001),
+        feed_partial_pressures=(20, 5),
+        kernel=ThermodynamicSurrogate.from_mixture(mixture, (320, 340)),
+        molecular_weights=(
+            mixture.first_component.molecular_weight,
+            mixture.second_component.molecular_weight,
+        ),
+        permeate_temperature=330,
+    )
+
+    # the finite difference is one-sided at the bounds of the composition range
+    for w, step in [(0, 1e-5), (1, -1e-5)]:
+        derivatives = balance.permeate_partial_pressures_derivatives(w)
+        pressures = balance.permeate_partial_pressures(w)
+        shifted = balance.permeate_partial_pressures(w + step)
+        for i in range(2):
+            assert derivatives[i] == pytest.approx(
+                (shifted[i] - pressures[i]) / step, rel=1e-2
+            )
+        assert numpy.isfinite(balance.derivative(w)).all()
+
+    def fail(w):
+        raise ValueError("Partial pressures are not defined")
+
+    balance.permeate_partial_pressures_derivatives = fail
+    with pytest.raises(PermeateCompositionError, match="not defined") as error:
+        solve_newton(balance, 0.9, 5e-5, IterationMonitor())
+    assert error.value.iterate == 0.9